@@ -0,0 +1,16 @@
+"""
+Tiny shared timing harness for the benchmark scripts.
+"""
+
+import timeit
+from typing import Callable
+
+
+def bench(name: str, func: Callable[[], object], *, number: int, repeat: int = 5):
+    best = min(timeit.repeat(func, number=number, repeat=repeat)) / number
+    if best >= 1e-3:
+        pretty = f"{best * 1e3:.2f} ms"
+    else:
+        pretty = f"{best * 1e6:.2f} us"
+    print(f"{name:<50} {pretty:>12}")
+    return best
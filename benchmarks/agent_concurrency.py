@@ -0,0 +1,156 @@
+"""
+Benchmarks for fanning out many concurrent `buildkite-agent` calls with the async agent flavors.
+
+Uses the fake `buildkite-agent` script from `agent_test.py`.
+"""
+
+import asyncio
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import trio
+
+from shimbboleth.buildkite.agent import (
+    AsyncioBuildkiteAgent,
+    BuildkiteAgent,
+    MetaDataCache,
+    TrioBuildkiteAgent,
+)
+from shimbboleth.buildkite.agent_test import FakeBKAgent
+
+CALLS = (100, 400)
+
+
+def timed(name: str, func, *, repeat: int = 3) -> None:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    print(f"{name:<50} {best * 1e3:>9.2f} ms")
+
+
+async def _peak_threads(coro) -> int:
+    peak = threading.active_count()
+    task = asyncio.ensure_future(coro)
+    while not task.done():
+        peak = max(peak, threading.active_count())
+        await asyncio.sleep(0.001)
+    await task
+    return peak
+
+
+async def _asyncio_to_thread(count: int) -> None:
+    # NB: What `AsyncioBuildkiteAgent` used to do
+    agent = BuildkiteAgent()
+    await asyncio.gather(
+        *(asyncio.to_thread(agent.get_meta_data, f"key{i}") for i in range(count))
+    )
+
+
+async def _asyncio_native(count: int, max_concurrency: int | None = None):
+    agent = AsyncioBuildkiteAgent(max_concurrency=max_concurrency)
+    await asyncio.gather(*(agent.get_meta_data(f"key{i}") for i in range(count)))
+    return agent.stats
+
+
+async def _trio_to_thread(count: int) -> None:
+    # NB: What `TrioBuildkiteAgent` used to do
+    agent = BuildkiteAgent()
+    async with trio.open_nursery() as nursery:
+        for i in range(count):
+            nursery.start_soon(trio.to_thread.run_sync, agent.get_meta_data, f"key{i}")
+
+
+async def _trio_native(count: int, max_concurrency: int | None = None) -> None:
+    agent = TrioBuildkiteAgent(max_concurrency=max_concurrency)
+    async with trio.open_nursery() as nursery:
+        for i in range(count):
+            nursery.start_soon(agent.get_meta_data, f"key{i}")
+
+
+def _sync_sequential(count: int) -> None:
+    agent = BuildkiteAgent()
+    for i in range(count):
+        agent.get_meta_data(f"key{i}")
+
+
+def _sync_bulk(count: int) -> None:
+    BuildkiteAgent().get_meta_data_many([f"key{i}" for i in range(count)])
+
+
+def _sync_repeated(count: int, cache: MetaDataCache | None = None) -> None:
+    # NB: The same few keys, as when several libraries look them up
+    agent = BuildkiteAgent(meta_data_cache=cache)
+    for i in range(count):
+        agent.meta_data_exists(f"key{i % 5}")
+        agent.get_meta_data(f"key{i % 5}")
+
+
+def peak_threads(name: str, func, count: int) -> None:
+    peak = asyncio.run(_peak_threads(func(count)))
+    print(f"{f'peak threads: {name}':<50} {peak:>12}")
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        fake_agent = FakeBKAgent(Path(tmpdir) / "fake-agent")
+        fake_agent.stdout = "value"
+        os.environ["PATH"] = f"{fake_agent.path}:{os.environ.get('PATH', '')}"
+
+        for count in CALLS:
+            timed(
+                f"asyncio, to_thread ({count} concurrent calls)",
+                lambda: asyncio.run(_asyncio_to_thread(count)),
+            )
+            timed(
+                f"asyncio, native ({count} concurrent calls)",
+                lambda: asyncio.run(_asyncio_native(count)),
+            )
+            timed(
+                f"trio, to_thread ({count} concurrent calls)",
+                lambda: trio.run(_trio_to_thread, count),
+            )
+            timed(
+                f"trio, native ({count} concurrent calls)",
+                lambda: trio.run(_trio_native, count),
+            )
+            timed(
+                f"trio, native, max 16 ({count} concurrent calls)",
+                lambda: trio.run(_trio_native, count, 16),
+            )
+            timed(
+                f"asyncio, native, max 16 ({count} concurrent calls)",
+                lambda: asyncio.run(_asyncio_native(count, 16)),
+            )
+        timed(
+            f"sync, sequential get_meta_data ({CALLS[0]} keys)",
+            lambda: _sync_sequential(CALLS[0]),
+        )
+        timed(
+            f"sync, get_meta_data_many ({CALLS[0]} keys)",
+            lambda: _sync_bulk(CALLS[0]),
+        )
+        timed(
+            f"sync, repeated exists+get ({CALLS[0]} times, 5 keys)",
+            lambda: _sync_repeated(CALLS[0]),
+        )
+        timed(
+            f"sync, repeated exists+get, cached ({CALLS[0]} times, 5 keys)",
+            lambda: _sync_repeated(CALLS[0], MetaDataCache()),
+        )
+        stats = asyncio.run(_asyncio_native(CALLS[-1], 16))
+        print(
+            f"stats (max 16, {CALLS[-1]} calls): peak waiting={stats.peak_waiting}, "
+            f"mean wait={stats.total_wait_time / stats.calls * 1e3:.1f} ms, "
+            f"max wait={stats.max_wait_time * 1e3:.1f} ms"
+        )
+        peak_threads("asyncio, to_thread", _asyncio_to_thread, CALLS[-1])
+        peak_threads("asyncio, native", _asyncio_native, CALLS[-1])
+
+
+if __name__ == "__main__":
+    main()
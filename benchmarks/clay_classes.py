@@ -0,0 +1,111 @@
+"""
+Benchmarks for `Model` class creation (`ModelMeta`) and cold import of many models.
+
+Per-class creation is measured for synthetic models of increasing width (number of fields)
+and depth (levels of inheritance). Cold import runs a fresh interpreter importing a generated
+module of models, which is what short-lived CLI invocations pay on every run.
+"""
+
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from _harness import bench
+
+
+SRC_DIR = Path(__file__).parent.parent / "src"
+
+FIELD_TYPES = [
+    ("str", '"value"'),
+    ("NonEmptyString", '"value"'),
+    ("list[NonEmptyString]", "field(default_factory=list)"),
+    ("Annotated[int, Ge(0)]", "0"),
+    ("dict[str, str]", "field(default_factory=dict)"),
+    ('Literal["a", "b"]', '"a"'),
+    ("bool | None", "None"),
+    ("Annotated[str, Not[uuid.UUID]] | None", "None"),
+]
+
+PREAMBLE = """\
+import uuid
+from typing import Annotated, Literal
+
+from shimbboleth.internal.clay.model import Model, field
+from shimbboleth.internal.clay.validation import Ge, Not, NonEmptyString
+"""
+
+
+def model_source(
+    name: str, base: str, width: int, *, offset: int = 0, kwargs: str = ""
+) -> str:
+    lines = [f"class {name}({base}{kwargs}):"]
+    for index in range(width):
+        annotation, default = FIELD_TYPES[(offset + index) % len(FIELD_TYPES)]
+        lines.append(f"    field_{offset + index}: {annotation} = {default}")
+    return "\n".join(lines) + "\n"
+
+
+def module_source(count: int, *, kwargs: str = "") -> str:
+    return PREAMBLE + "\n\n".join(
+        model_source(f"Model{index}", "Model", 10, kwargs=kwargs)
+        for index in range(count)
+    )
+
+
+def define(source: str) -> None:
+    exec(source, {"__name__": "synthetic"})
+
+
+def cold_import_time(source: str, *, repeat: int = 5) -> float:
+    with tempfile.TemporaryDirectory() as tmpdir:
+        Path(tmpdir, "synthetic_models.py").write_text(source)
+        env_path = f"{SRC_DIR}:{tmpdir}"
+        best = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            subprocess.run(
+                [sys.executable, "-c", "import synthetic_models"],
+                check=True,
+                env={"PYTHONPATH": env_path, "PYTHONDONTWRITEBYTECODE": "1"},
+            )
+            best = min(best, time.perf_counter() - start)
+        return best
+
+
+def main():
+    for width in (5, 20, 80):
+        source = PREAMBLE + model_source("Wide", "Model", width)
+        bench(f"define a Model ({width} fields)", lambda: define(source), number=20)
+        source = PREAMBLE + model_source("Wide", "Model", width, kwargs=", lazy=True")
+        bench(
+            f"define a lazy Model ({width} fields)", lambda: define(source), number=20
+        )
+
+    for depth in (1, 4, 16):
+        source = PREAMBLE + "\n".join(
+            model_source(
+                f"Level{level}",
+                f"Level{level - 1}" if level else "Model",
+                5,
+                offset=level * 5,
+            )
+            for level in range(depth)
+        )
+        bench(
+            f"define a Model hierarchy ({depth} levels, 5 fields each)",
+            lambda: define(source),
+            number=10,
+        )
+
+    baseline = cold_import_time(PREAMBLE)
+    for count in (100, 400):
+        for label, kwargs in (("", ""), ("lazy ", ", lazy=True")):
+            elapsed = cold_import_time(module_source(count, kwargs=kwargs)) - baseline
+            name = f"cold import {count} {label}models (10 fields each)"
+            print(f"{name:<50} {elapsed * 1e3:>9.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
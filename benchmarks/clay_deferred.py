@@ -0,0 +1,50 @@
+"""
+Benchmarks for deferred loading of nested models (`Model.model_load(..., defer_nested=True)`).
+
+Compares loading a document and reading only a top-level field, vs. loading it eagerly.
+NB: The memory rows exclude the input document, which a deferred model holds on to.
+"""
+
+import tracemalloc
+
+from _harness import bench
+from clay_load import PIPELINE, Pipeline
+
+BIG_PIPELINE = {**PIPELINE, "steps": PIPELINE["steps"] * 40}
+
+
+def load_eager():
+    return Pipeline.model_load(BIG_PIPELINE).env
+
+
+def load_deferred():
+    return Pipeline.model_load(BIG_PIPELINE, defer_nested=True).env
+
+
+def load_deferred_all():
+    return Pipeline.model_load(BIG_PIPELINE, defer_nested=True).steps
+
+
+def main():
+    bench("eager load, read top-level (1000 steps)", load_eager, number=20)
+    bench("deferred load, read top-level (1000 steps)", load_deferred, number=20)
+    bench("deferred load, read all steps (1000 steps)", load_deferred_all, number=20)
+
+    for name, load in (
+        ("eager", lambda: Pipeline.model_load(BIG_PIPELINE)),
+        ("deferred", lambda: Pipeline.model_load(BIG_PIPELINE, defer_nested=True)),
+    ):
+        tracemalloc.start()
+        model = load()
+        retained, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del model
+        # NB: Only what the load allocated. The deferred model also keeps (references to)
+        #   the input's sub-documents alive until its fields are loaded.
+        print(
+            f"{f'memory allocated by the load: {name}':<50} {retained / 1024:>9.0f} KiB"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+"""
+Benchmarks for `clay` JSON dumping (`Model.model_dump` / `Model.model_dump_json`).
+"""
+
+import json
+
+from _harness import bench
+from clay_load import PIPELINE, STEP, CommandStep, Pipeline
+
+STEP_MODEL = CommandStep.model_load(STEP)
+DEFAULT_STEP_MODEL = CommandStep()
+PIPELINE_MODEL = Pipeline.model_load(PIPELINE)
+
+
+def main():
+    bench("CommandStep.model_dump", STEP_MODEL.model_dump, number=5000)
+    bench(
+        "CommandStep().model_dump (all defaults)",
+        DEFAULT_STEP_MODEL.model_dump,
+        number=5000,
+    )
+    bench("Pipeline.model_dump (25 steps)", PIPELINE_MODEL.model_dump, number=500)
+    bench(
+        "json.dumps(Pipeline.model_dump()) (25 steps)",
+        lambda: json.dumps(
+            PIPELINE_MODEL.model_dump(), separators=(",", ":"), ensure_ascii=False
+        ).encode("utf-8"),
+        number=500,
+    )
+    bench(
+        "Pipeline.model_dump_json (25 steps)",
+        PIPELINE_MODEL.model_dump_json,
+        number=500,
+    )
+
+
+if __name__ == "__main__":
+    main()
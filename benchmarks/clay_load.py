@@ -0,0 +1,116 @@
+"""
+Benchmarks for `clay` JSON loading (`Model.model_load`).
+
+Uses a small "pipeline-shaped" set of models, exercising aliases,
+`json_alias`, unions, literals, lists, dicts, and nested models.
+"""
+
+from typing import Annotated, ClassVar, Literal
+
+from _harness import bench
+
+from shimbboleth.internal.clay.json_load import load
+from shimbboleth.internal.clay.model import FieldAlias, Model, field
+from shimbboleth.internal.clay.validation import NonEmptyString, Ge
+
+
+class Plugin(Model, extra=True):
+    name: str
+    version: str = "latest"
+
+
+class CommandStep(Model):
+    type: Literal["command", "script"] = "command"
+    label: str | None = None
+    key: NonEmptyString | None = None
+    command: list[str] = field(default_factory=list)
+    env: dict[str, str] = field(default_factory=dict)
+    depends_on: list[str] = field(default_factory=list)
+    if_condition: str | None = field(default=None, json_alias="if")
+    parallelism: Annotated[int, Ge(1)] = 1
+    soft_fail: bool = False
+    plugins: list[Plugin] = field(default_factory=list)
+    state: Literal["passed", "failed", "running", "blocked", "skipped"] = "passed"
+
+    name: ClassVar = FieldAlias("label")
+    commands: ClassVar = FieldAlias("command")
+
+
+class Pipeline(Model):
+    env: dict[str, str] = field(default_factory=dict)
+    steps: list[CommandStep | str] = field(default_factory=list)
+
+
+STEP = {
+    "label": ":pytest: Tests",
+    "key": "tests",
+    "commands": ["pip install -e .", "pytest -q"],
+    "env": {"PYTHONUNBUFFERED": "1", "CI": "true"},
+    "depends_on": ["lint", "build"],
+    "if": "build.branch == 'main'",
+    "parallelism": 4,
+    "plugins": [{"name": "docker#v5", "image": "python:3.11"}],
+    "state": "running",
+}
+PIPELINE = {
+    "env": {"FOO": "bar"},
+    "steps": [STEP] * 20 + ["wait"] * 5,
+}
+BIG_DICT = {f"key{i}": list(range(10)) for i in range(1000)}
+BIG_LIST = [STEP] * 1000
+STATES = tuple(f"state_{i}" for i in range(40))
+LITERAL_LIST = list(STATES) * 250
+UNION_LIST = ["a", ["b", "c"], True, None] * 2500
+
+
+def main():
+    bench("CommandStep.model_load", lambda: CommandStep.model_load(STEP), number=5000)
+    bench(
+        "Pipeline.model_load (25 steps)",
+        lambda: Pipeline.model_load(PIPELINE),
+        number=500,
+    )
+    bench(
+        "Pipeline.model_validate_json_data (25 steps)",
+        lambda: Pipeline.model_validate_json_data(PIPELINE),
+        number=500,
+    )
+    bench(
+        "load(dict[str, list[int]]) (1000 keys)",
+        lambda: load(dict[str, list[int]], data=BIG_DICT),
+        number=100,
+    )
+    bench(
+        "load(list[CommandStep]) (1000 items)",
+        lambda: load(list[CommandStep], data=BIG_LIST),
+        number=10,
+    )
+    bench(
+        "[CommandStep.model_load(...)] (1000 items)",
+        lambda: [CommandStep.model_load(step) for step in BIG_LIST],
+        number=10,
+    )
+    bench(
+        "CommandStep.model_load_many(...) (1000 items)",
+        lambda: CommandStep.model_load_many(BIG_LIST),
+        number=10,
+    )
+    bench(
+        "CommandStep.model_validate_json_data (1000 items)",
+        lambda: [CommandStep.model_validate_json_data(step) for step in BIG_LIST],
+        number=10,
+    )
+    bench(
+        "load(list[str | list[str] | bool | None]) (10k items)",
+        lambda: load(list[str | list[str] | bool | None], data=UNION_LIST),
+        number=20,
+    )
+    bench(
+        "load(list[Literal[<40 states>]]) (10k items)",
+        lambda: load(list[Literal[STATES]], data=LITERAL_LIST),
+        number=20,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""
+Benchmarks for loading a large batch of models across processes (`Model.model_load_many_in_processes`).
+
+Also measures the pickle round trip of loaded models (which is how the models get back from the workers).
+"""
+
+import concurrent.futures
+import os
+import pickle
+
+from _harness import bench
+from clay_load import PIPELINE, STEP, CommandStep, Pipeline
+
+VALUES = [STEP] * 50_000
+PIPELINE_MODEL = Pipeline.model_load(PIPELINE)
+
+
+def main():
+    bench(
+        "pickle round trip Pipeline (25 steps)",
+        lambda: pickle.loads(pickle.dumps(PIPELINE_MODEL)),
+        number=500,
+    )
+
+    bench(
+        "model_load_many (50k steps)",
+        lambda: CommandStep.model_load_many(VALUES),
+        number=1,
+    )
+    for workers in (2, 4, os.cpu_count()):
+        with concurrent.futures.ProcessPoolExecutor(workers) as executor:
+            # NB: Warm up the workers (process startup, imports)
+            CommandStep.model_load_many_in_processes(VALUES[:100], executor=executor)
+            bench(
+                f"model_load_many_in_processes (50k steps, {workers} workers)",
+                lambda: CommandStep.model_load_many_in_processes(
+                    VALUES, executor=executor, max_workers=workers
+                ),
+                number=1,
+            )
+
+
+if __name__ == "__main__":
+    main()
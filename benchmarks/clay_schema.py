@@ -0,0 +1,65 @@
+"""
+Benchmarks for `clay` JSON schema generation (`Model.model_json_schema`) and validation.
+"""
+
+from _harness import bench
+from clay_load import PIPELINE, Pipeline
+
+from shimbboleth.internal.clay.json_schema import schema
+from shimbboleth.internal.clay.json_schema_compile import (
+    compile_model_schema,
+    model_schema_document,
+)
+
+SCHEMA = model_schema_document(Pipeline)
+
+
+def build_schema():
+    model_defs = {}
+    schema(Pipeline, model_defs=model_defs)
+    return {**model_defs.pop(Pipeline.__name__), "$defs": model_defs}
+
+
+def main():
+    bench("build the Pipeline schema (uncached)", build_schema, number=2000)
+    bench(
+        "Pipeline.model_json_schema (cached, copied)",
+        lambda: Pipeline.model_json_schema,
+        number=2000,
+    )
+    bench(
+        "Pipeline.model_json_schema_json (cached bytes)",
+        lambda: Pipeline.model_json_schema_json,
+        number=2000,
+    )
+
+    validate = compile_model_schema(Pipeline)
+    bench(
+        "compile_model_schema(Pipeline)",
+        lambda: compile_model_schema(Pipeline),
+        number=200,
+    )
+    bench("validate (25 steps): compiled", lambda: validate(PIPELINE), number=500)
+
+    # NB: The comparison needs `jsonschema` (which isn't a dependency)
+    try:
+        import jsonschema
+    except ImportError:
+        print("(jsonschema not installed, skipping the comparison)")
+        return
+
+    validator = jsonschema.Draft202012Validator(SCHEMA)
+    bench(
+        "validate (25 steps): jsonschema (prebuilt)",
+        lambda: validator.validate(PIPELINE),
+        number=20,
+    )
+    bench(
+        "validate (25 steps): jsonschema.validate",
+        lambda: jsonschema.validate(PIPELINE, SCHEMA),
+        number=20,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""
+Benchmarks for loading many models from a JSON document, whole vs. streamed.
+
+Reports the time, and the peak traced memory (of parsing + loading, not of
+holding the resulting models).
+"""
+
+import io
+import json
+import tracemalloc
+
+from _harness import bench
+from clay_load import STEP, CommandStep
+
+DOCUMENT = json.dumps([STEP] * 20_000).encode("utf-8")
+
+
+def load_whole():
+    for _ in CommandStep.model_load_many(json.loads(DOCUMENT)):
+        pass
+
+
+def load_streamed():
+    for _ in CommandStep.model_iter_load_json(io.BytesIO(DOCUMENT)):
+        pass
+
+
+def peak_memory(func) -> str:
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return f"{peak / 1024 / 1024:.1f} MiB"
+
+
+def main():
+    print(f"document size: {len(DOCUMENT) / 1024 / 1024:.1f} MiB")
+    bench("whole document (json.loads + model_load_many)", load_whole, number=1)
+    bench("streamed (model_iter_load_json)", load_streamed, number=1)
+    print(f"{'peak memory: whole document':<50} {peak_memory(load_whole):>12}")
+    print(f"{'peak memory: streamed':<50} {peak_memory(load_streamed):>12}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+Benchmarks for `clay` validation (the `Annotated` validators, run on model construction).
+"""
+
+import uuid
+from typing import Annotated
+
+from _harness import bench
+
+from shimbboleth.internal.clay._validators import get_validators
+from shimbboleth.internal.clay.model import Model, field
+from shimbboleth.internal.clay.validation import Ge, Le, NonEmpty, NonEmptyString, Not
+
+StringsT = list[Annotated[str, NonEmpty]]
+STRINGS = [f"value{i}" for i in range(100_000)]
+INTS = list(range(100_000))
+STRINGS_BY_KEY = {f"key{i}": f"value{i}" for i in range(100_000)}
+
+
+class Strings(Model):
+    strings: StringsT
+
+
+class Validated(Model):
+    name: NonEmptyString
+    label: NonEmptyString
+    count: Annotated[int, Ge(0)]
+    parallelism: Annotated[int, Ge(1)] = 1
+    tags: StringsT = field(default_factory=list)
+    branch: str = "main"
+    soft_fail: bool = False
+
+
+VALIDATED_ANNOTATIONS = {
+    "name": NonEmptyString,
+    "tags": StringsT,
+    "count": Annotated[int, Ge(0)],
+    "env": dict[str, NonEmptyString],
+    "key": Annotated[str, Not[uuid.UUID]],
+    "ids": list[Annotated[str, uuid.UUID]] | None,
+}
+
+
+def define_model():
+    type("MyModel", (Model,), {"__annotations__": VALIDATED_ANNOTATIONS})
+
+
+VALIDATED = {"name": "a", "label": "b", "count": 1, "tags": ["a", "b"]}
+
+
+def main():
+    (validate_list,) = get_validators(StringsT)
+    (validate_dict,) = get_validators(dict[str, Annotated[str, NonEmpty]])
+    bench(
+        "validate list[NonEmptyString] (100k items)",
+        lambda: validate_list(STRINGS),
+        number=20,
+    )
+    bench(
+        "validate dict[str, NonEmptyString] (100k items)",
+        lambda: validate_dict(STRINGS_BY_KEY),
+        number=20,
+    )
+    (validate_ranges,) = get_validators(list[Annotated[int, Ge(0), Le(100_000)]])
+    bench(
+        "validate list[Annotated[int, Ge, Le]] (100k items)",
+        lambda: validate_ranges(INTS),
+        number=20,
+    )
+    bench(
+        "Strings(strings=...) (100k items)",
+        lambda: Strings(strings=STRINGS),
+        number=20,
+    )
+    bench(
+        "Validated(...) (7 fields, 4 validated)",
+        lambda: Validated(**VALIDATED),
+        number=20_000,
+    )
+    bench(
+        "Validated.model_load (7 fields, 4 validated)",
+        lambda: Validated.model_load(VALIDATED),
+        number=20_000,
+    )
+    bench("define a Model (6 validated fields)", define_model, number=200)
+
+
+if __name__ == "__main__":
+    main()
@@ -7,9 +7,15 @@ Each command is mapped to the corresponding buildkite-agent CLI command and hand
 argument formatting and execution.
 """
 
+import concurrent.futures
+import contextlib
 import functools
-from dataclasses import dataclass
+import inspect
+from dataclasses import dataclass, field
 import itertools
+import threading
+import time
+import weakref
 from typing import (
     Callable,
     ParamSpec,
@@ -19,6 +25,9 @@ from typing import (
     Iterable,
     Any,
     Container,
+    Iterator,
+    AsyncIterator,
+    Mapping,
 )
 import subprocess
 
@@ -37,10 +46,191 @@ def _make_flags(kwargs: dict[str, Any]) -> Iterable[str]:
 P = ParamSpec("P")
 T = TypeVar("T")
 
+_MISSING: Any = object()
+
+
+@dataclass
+class MetaDataCache:
+    """
+    An (opt-in) read-through cache of an agent's `meta-data get`, `exists` and `keys` results.
+
+    Values set with `set_meta_data` (through an agent using this cache) are written through.
+    Values set by anything else (e.g. other jobs) are only seen once the cached entries expire
+    (see `ttl`) or are invalidated (see `invalidate`).
+
+    NB: Can be shared by several agents (of any flavor) within the same job.
+    """
+
+    ttl: float | None = None
+    """How long (in seconds) entries are cached for (`None` to cache them until invalidated)."""
+
+    hits: int = 0
+    """The number of calls answered from the cache (i.e. `buildkite-agent` processes saved)."""
+    misses: int = 0
+
+    _entries: dict[tuple[str, ...], tuple[Any, float]] = field(
+        default_factory=dict, repr=False, compare=False
+    )
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, repr=False, compare=False
+    )
+
+    def invalidate(self, key: str | None = None) -> None:
+        """
+        Drop cached entries.
+
+        :param key: The meta-data key to drop the entries of (along with the list of keys).
+            If not provided, every entry is dropped.
+        """
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                for entry in (("get", key), ("exists", key), ("keys",)):
+                    self._entries.pop(entry, None)
+
+    def _lookup(self, kind: str, args: tuple[Any, ...]) -> Any:
+        if kind == "set":
+            return _MISSING
+
+        entry = (kind, *map(str, args))
+        with self._lock:
+            value, expires_at = self._entries.get(entry, (_MISSING, None))
+            if value is not _MISSING and expires_at < time.monotonic():
+                del self._entries[entry]
+                value = _MISSING
+            if value is _MISSING:
+                self.misses += 1
+                return _MISSING
+            self.hits += 1
+        # NB: Copied, so callers can't change the cached list of keys
+        return list(value) if kind == "keys" else value
+
+    def _store(self, kind: str, args: tuple[Any, ...], value: Any) -> None:
+        expires_at = float("inf") if self.ttl is None else time.monotonic() + self.ttl
+        with self._lock:
+            if kind == "set":
+                key, value = map(str, args)
+                # NB: What `meta-data get` would now return
+                self._entries[("get", key)] = (value.strip(), expires_at)
+                self._entries[("exists", key)] = (True, expires_at)
+                self._entries.pop(("keys",), None)
+            elif kind == "keys":
+                self._entries[("keys",)] = (list(value), expires_at)
+            else:
+                self._entries[(kind, *map(str, args))] = (value, expires_at)
+                if kind == "get":
+                    (key,) = args
+                    self._entries[("exists", str(key))] = (True, expires_at)
+
+
+@dataclass(frozen=True)
+class _CommandSpec:
+    """
+    How to run a `buildkite-agent` command, and interpret its result.
+
+    NB: Shared by each of the flavors (which only differ in how the process is run).
+    """
+
+    names: tuple[str, ...]
+    allowed_exit_codes: Container[int]
+    post: Callable[[subprocess.CompletedProcess], Any] | None
+    cache: str | None = None
+    """How the command interacts with the agent's `meta_data_cache` (if any)."""
+    signature: inspect.Signature | None = None
+
+    def argv(
+        self,
+        bkagent: "_BuildkiteAgentBase",
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+    ) -> list[str]:
+        return [
+            bkagent.agent_path,
+            *self.names,
+            *map(str, args),
+            *_make_flags(kwargs),
+        ]
+
+    def cache_args(
+        self,
+        bkagent: "_BuildkiteAgentBase",
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+    ) -> tuple[Any, ...] | None:
+        """
+        The command's arguments, as the agent's `meta_data_cache` is keyed by them
+        (`None` if the command isn't cached).
+        """
+        if bkagent.meta_data_cache is None or self.cache is None:
+            return None
+        if not kwargs:
+            return args
+        # NB: Bound (before running), so keyword calls are keyed like positional ones
+        bound = self.signature.bind(bkagent, *args, **kwargs)  # type: ignore
+        return tuple(bound.arguments.values())[1:]
+
+    def cached(
+        self, bkagent: "_BuildkiteAgentBase", cache_args: tuple[Any, ...] | None
+    ) -> Any:
+        """The cached result of the command (or `_MISSING`)."""
+        if cache_args is None:
+            return _MISSING
+        return bkagent.meta_data_cache._lookup(self.cache, cache_args)  # type: ignore
+
+    def finish(
+        self,
+        bkagent: "_BuildkiteAgentBase",
+        cache_args: tuple[Any, ...] | None,
+        result: subprocess.CompletedProcess,
+    ) -> Any:
+        if result.returncode not in self.allowed_exit_codes:
+            raise bkagent.CalledProcessError(
+                result.returncode, result.args, result.stdout, result.stderr
+            )
+
+        value = self.post(result) if self.post else None
+        if cache_args is not None:
+            bkagent.meta_data_cache._store(self.cache, cache_args, value)  # type: ignore
+        return value
+
+    def run(
+        self,
+        bkagent: "_BuildkiteAgentBase",
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+    ) -> Any:
+        cache_args = self.cache_args(bkagent, args, kwargs)
+        cached = self.cached(bkagent, cache_args)
+        if cached is not _MISSING:
+            return cached
+
+        with bkagent._slot():
+            result = subprocess.run(
+                self.argv(bkagent, args, kwargs),
+                check=False,
+                text=True,
+                encoding="utf-8",
+                stdout=subprocess.PIPE,
+            )
+        return self.finish(bkagent, cache_args, result)
+
+
+def _decode_stdout(stdout: bytes) -> str:
+    # NB: The same as `subprocess.run(..., text=True)` (which uses universal newlines)
+    return stdout.decode("utf-8").replace("\r\n", "\n").replace("\r", "\n")
+
+
+def _get_command_spec(func: Callable) -> _CommandSpec:
+    return func.__command_spec__  # type: ignore
+
 
 @overload
 def _command(
-    *names: str, allowed_exit_codes: Container[int] = (0,), post: None = None
+    *names: str,
+    allowed_exit_codes: Container[int] = (0,),
+    post: None = None,
+    cache: str | None = None,
 ) -> Callable[[Callable[P, None]], Callable[P, None]]: ...
 
 
@@ -49,50 +239,153 @@ def _command(
     *names: str,
     allowed_exit_codes: Container[int] = (0,),
     post: Callable[[subprocess.CompletedProcess], T],
+    cache: str | None = None,
 ) -> Callable[[Callable[P, T]], Callable[P, T]]: ...
 def _command(
     *names: str,
     allowed_exit_codes: Container[int] = (0,),
     post: Callable[[subprocess.CompletedProcess], T] | None = None,
+    cache: str | None = None,
 ) -> Callable[[Callable[P, T]], Callable[P, T]]:
     def decorator(func: Callable[P, T]) -> Callable[P, T]:
+        spec = _CommandSpec(
+            names, allowed_exit_codes, post, cache, inspect.signature(func)
+        )
+
         @functools.wraps(func)
         def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
-            nonlocal names
-
-            bkagent: "_BuildkiteAgentBase" = args[0]  # type: ignore
-            result = subprocess.run(
-                [
-                    bkagent.agent_path,
-                    *names,
-                    *map(str, args[1:]),
-                    *_make_flags(kwargs),
-                ],
-                check=False,
-                text=True,
-                encoding="utf-8",
-                stdout=subprocess.PIPE,
-            )
-            if result.returncode not in allowed_exit_codes:
-                raise bkagent.CalledProcessError(
-                    result.returncode, result.args, result.stdout, result.stderr
-                )
-
-            if post:
-                return post(result)
-            return None  # type: ignore
+            return spec.run(args[0], args[1:], kwargs)  # type: ignore
 
+        wrapper.__command_spec__ = spec  # type: ignore
         return wrapper
 
     return decorator
 
 
+@dataclass
+class AgentCallStats:
+    """
+    Statistics of an agent's `buildkite-agent` calls (see `max_concurrency`).
+    """
+
+    calls: int = 0
+    """The number of calls started (i.e. which got a slot)."""
+    running: int = 0
+    waiting: int = 0
+    """The number of calls waiting for a slot (the queue depth)."""
+    peak_running: int = 0
+    peak_waiting: int = 0
+    total_wait_time: float = 0.0
+    """The total time (in seconds) calls spent waiting for a slot."""
+    max_wait_time: float = 0.0
+
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, repr=False, compare=False
+    )
+
+    def _wait(self) -> float:
+        with self._lock:
+            self.waiting += 1
+            self.peak_waiting = max(self.peak_waiting, self.waiting)
+        return time.perf_counter()
+
+    def _start(self, waiting_since: float | None = None) -> None:
+        with self._lock:
+            if waiting_since is not None:
+                waited = time.perf_counter() - waiting_since
+                self.waiting -= 1
+                self.total_wait_time += waited
+                self.max_wait_time = max(self.max_wait_time, waited)
+            self.calls += 1
+            self.running += 1
+            self.peak_running = max(self.peak_running, self.running)
+
+    def _stop_waiting(self) -> None:
+        with self._lock:
+            self.waiting -= 1
+
+    def _finish(self) -> None:
+        with self._lock:
+            self.running -= 1
+
+
 @dataclass(frozen=True)
 class _BuildkiteAgentBase:
     class CalledProcessError(subprocess.CalledProcessError):
         pass
 
     agent_path: str = "buildkite-agent"
+    max_concurrency: int | None = None
+    """
+    The maximum number of `buildkite-agent` processes this agent runs at once (`None` for no limit).
+    Further calls wait for a slot (see `stats`). For `AsyncioBuildkiteAgent`, this is per event loop.
+    """
+    meta_data_cache: MetaDataCache | None = field(default=None, compare=False)
+    """
+    Cache `meta-data` results in (`None` to not cache). See `MetaDataCache`.
+    """
+
+    stats: AgentCallStats = field(
+        default_factory=AgentCallStats, init=False, repr=False, compare=False
+    )
+    _limiter: Any = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        if self.max_concurrency is not None:
+            # NB: Frozen, so set via `object`
+            object.__setattr__(
+                self, "_limiter", self._make_limiter(self.max_concurrency)
+            )
+
+    @staticmethod
+    def _make_limiter(max_concurrency: int) -> Any:
+        return threading.BoundedSemaphore(max_concurrency)
+
+    @contextlib.contextmanager
+    def _slot(self) -> Iterator[None]:
+        limiter = self._limiter
+        if limiter is None:
+            self.stats._start()
+        else:
+            waiting_since = self.stats._wait()
+            try:
+                limiter.acquire()
+            except BaseException:
+                self.stats._stop_waiting()
+                raise
+            self.stats._start(waiting_since)
+
+        try:
+            yield
+        finally:
+            if limiter is not None:
+                limiter.release()
+            self.stats._finish()
+
+    def _async_limiter(self) -> Any:
+        return self._limiter
+
+    @contextlib.asynccontextmanager
+    async def _async_slot(self) -> AsyncIterator[None]:
+        # NB: `asyncio.Semaphore` and `trio.CapacityLimiter` share this interface
+        limiter = self._async_limiter()
+        if limiter is None:
+            self.stats._start()
+        else:
+            waiting_since = self.stats._wait()
+            try:
+                await limiter.acquire()
+            except BaseException:
+                self.stats._stop_waiting()
+                raise
+            self.stats._start(waiting_since)
+
+        try:
+            yield
+        finally:
+            if limiter is not None:
+                limiter.release()
+            self.stats._finish()
 
     @_command("annotate")
     def _annotate(
@@ -146,7 +439,9 @@ class _BuildkiteAgentBase:
         """
         raise AssertionError
 
-    @_command("meta-data", "get", post=lambda result: result.stdout.strip())
+    @_command(
+        "meta-data", "get", post=lambda result: result.stdout.strip(), cache="get"
+    )
     def _get_meta_data(self, key: str) -> str:
         """
         Get data from a build.
@@ -156,7 +451,7 @@ class _BuildkiteAgentBase:
         """
         raise AssertionError
 
-    @_command("meta-data", "set")
+    @_command("meta-data", "set", cache="set")
     def _set_meta_data(self, key: str, value: str) -> None:
         """
         Set data from a build.
@@ -172,6 +467,7 @@ class _BuildkiteAgentBase:
         "exists",
         allowed_exit_codes=(0, 100),
         post=lambda result: result.returncode == 0,
+        cache="exists",
     )
     def _meta_data_exists(self, key: str) -> bool:
         """
@@ -183,7 +479,10 @@ class _BuildkiteAgentBase:
         raise AssertionError
 
     @_command(
-        "meta-data", "keys", post=lambda result: result.stdout.strip().splitlines()
+        "meta-data",
+        "keys",
+        post=lambda result: result.stdout.strip().splitlines(),
+        cache="keys",
     )
     def _meta_data_keys(self) -> list[str]:
         """
@@ -209,6 +508,33 @@ class _BuildkiteAgentBase:
         raise AssertionError
 
 
+_BULK_MAX_CONCURRENCY = 8
+"""The default number of concurrent `buildkite-agent` processes for the `*_meta_data_many` methods."""
+
+
+def _bulk_results(
+    keys: list[str], results: Iterable[Any], *, action: str
+) -> dict[str, Any]:
+    """
+    Map each key to its result, skipping missing keys.
+
+    Raises an `ExceptionGroup` of every key's error (if any), with the key added as a note.
+    """
+    values = {}
+    errors = []
+    for key, result in zip(keys, results):
+        if isinstance(result, BaseException):
+            result.add_note(f"meta-data key: {key!r}")
+            errors.append(result)
+        elif result is not _MISSING:
+            values[key] = result
+    if errors:
+        raise ExceptionGroup(
+            f"Failed to {action} {len(errors)} meta-data key(s)", errors
+        )
+    return values
+
+
 @dataclass(frozen=True)
 class BuildkiteAgent(_BuildkiteAgentBase):
     @staticmethod
@@ -228,16 +554,130 @@ class BuildkiteAgent(_BuildkiteAgentBase):
     meta_data_keys = _make(_BuildkiteAgentBase._meta_data_keys)
     upload_pipeline = _make(_BuildkiteAgentBase._upload_pipeline)
 
+    def _get_meta_data_or_missing(self, key: str) -> str:
+        try:
+            return self.get_meta_data(key)
+        except self.CalledProcessError:
+            if self.meta_data_exists(key):
+                raise
+            return _MISSING
+
+    def _run_many(
+        self, func: Callable[..., Any], *args: Iterable[Any], max_concurrency: int
+    ) -> list[Any]:
+        def run(*arg: Any) -> Any:
+            try:
+                return func(*arg)
+            except (self.CalledProcessError, OSError) as e:
+                return e
+
+        with concurrent.futures.ThreadPoolExecutor(max_concurrency) as executor:
+            futures = [executor.submit(run, *arg) for arg in zip(*args)]
+        return [future.result() for future in futures]
+
+    def get_meta_data_many(
+        self, keys: Iterable[str], *, max_concurrency: int = _BULK_MAX_CONCURRENCY
+    ) -> dict[str, str]:
+        """
+        Get the data for many keys (concurrently).
+
+        :param keys: Keys to retrieve metadata for
+        :param max_concurrency: The maximum number of `buildkite-agent` processes to run at once
+        :return: Value stored for each key. Keys which don't exist are omitted.
+        :raises ExceptionGroup: Of each failed key's `CalledProcessError`/`OSError` (after every key is done)
+        """
+        keys = list(dict.fromkeys(keys))
+        results = self._run_many(
+            self._get_meta_data_or_missing, keys, max_concurrency=max_concurrency
+        )
+        return _bulk_results(keys, results, action="get")
+
+    def set_meta_data_many(
+        self,
+        items: Mapping[str, str],
+        *,
+        max_concurrency: int = _BULK_MAX_CONCURRENCY,
+    ) -> None:
+        """
+        Set the data for many keys (concurrently).
+
+        :param items: Value to store for each key (see `set_meta_data`)
+        :param max_concurrency: The maximum number of `buildkite-agent` processes to run at once
+        :raises ExceptionGroup: Of each failed key's `CalledProcessError`/`OSError` (after every key is done)
+        """
+        keys = list(items)
+        results = self._run_many(
+            self.set_meta_data,
+            keys,
+            items.values(),
+            max_concurrency=max_concurrency,
+        )
+        _bulk_results(keys, results, action="set")
+
 
 @dataclass(frozen=True)
 class AsyncioBuildkiteAgent(_BuildkiteAgentBase):
+    @staticmethod
+    def _make_limiter(max_concurrency: int) -> Any:
+        # NB: An `asyncio.Semaphore` binds to the event loop it's first contended in,
+        #   so there's one per loop (e.g. so the agent can be reused across `asyncio.run`s).
+        #   `max_concurrency` therefore applies per event loop.
+        return weakref.WeakKeyDictionary()
+
+    def _async_limiter(self) -> Any:
+        import asyncio
+
+        limiters = self._limiter
+        if limiters is None:
+            return None
+        loop = asyncio.get_running_loop()
+        limiter = limiters.get(loop)
+        if limiter is None:
+            limiter = limiters.setdefault(
+                loop,
+                asyncio.Semaphore(self.max_concurrency),  # type: ignore
+            )
+        return limiter
+
     @staticmethod
     def _make_async(func: Callable[P, T]) -> Callable[P, Coroutine[None, None, T]]:
+        spec = _get_command_spec(func)
+
         @functools.wraps(func)
         async def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
             import asyncio
 
-            return await asyncio.to_thread(func, *args, **kwargs)
+            bkagent: _BuildkiteAgentBase = args[0]  # type: ignore
+            cache_args = spec.cache_args(bkagent, args[1:], kwargs)
+            cached = spec.cached(bkagent, cache_args)
+            if cached is not _MISSING:
+                return cached
+
+            argv = spec.argv(bkagent, args[1:], kwargs)
+            # NB: The pipes are read on the event loop (no thread per call)
+            async with bkagent._async_slot():
+                process = await asyncio.create_subprocess_exec(
+                    *argv, stdout=asyncio.subprocess.PIPE
+                )
+                try:
+                    stdout, _ = await process.communicate()
+                except BaseException:
+                    # NB: E.g. cancelled. Don't leave the process running (or unreaped),
+                    #   like `trio.run_process`.
+                    with contextlib.suppress(ProcessLookupError):
+                        process.kill()
+                    await process.wait()
+                    raise
+            return spec.finish(
+                bkagent,
+                cache_args,
+                subprocess.CompletedProcess(
+                    argv,
+                    process.returncode,  # type: ignore
+                    _decode_stdout(stdout),
+                    None,
+                ),
+            )
 
         return wrapper
 
@@ -250,16 +690,102 @@ class AsyncioBuildkiteAgent(_BuildkiteAgentBase):
     meta_data_keys = _make_async(_BuildkiteAgentBase._meta_data_keys)
     upload_pipeline = _make_async(_BuildkiteAgentBase._upload_pipeline)
 
+    async def _get_meta_data_or_missing(self, key: str) -> str:
+        try:
+            return await self.get_meta_data(key)
+        except self.CalledProcessError:
+            if await self.meta_data_exists(key):
+                raise
+            return _MISSING
+
+    async def _run_many(
+        self,
+        func: Callable[..., Coroutine[None, None, Any]],
+        *args: Iterable[Any],
+        max_concurrency: int,
+    ) -> list[Any]:
+        import asyncio
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def run(*arg: Any) -> Any:
+            async with semaphore:
+                try:
+                    return await func(*arg)
+                except (self.CalledProcessError, OSError) as e:
+                    return e
+
+        # NB: Like a nursery, any other error cancels the rest and is raised
+        async with asyncio.TaskGroup() as task_group:
+            tasks = [task_group.create_task(run(*arg)) for arg in zip(*args)]
+        return [task.result() for task in tasks]
+
+    async def get_meta_data_many(
+        self, keys: Iterable[str], *, max_concurrency: int = _BULK_MAX_CONCURRENCY
+    ) -> dict[str, str]:
+        """
+        Get the data for many keys (concurrently). See `BuildkiteAgent.get_meta_data_many`.
+        """
+        keys = list(dict.fromkeys(keys))
+        results = await self._run_many(
+            self._get_meta_data_or_missing, keys, max_concurrency=max_concurrency
+        )
+        return _bulk_results(keys, results, action="get")
+
+    async def set_meta_data_many(
+        self,
+        items: Mapping[str, str],
+        *,
+        max_concurrency: int = _BULK_MAX_CONCURRENCY,
+    ) -> None:
+        """
+        Set the data for many keys (concurrently). See `BuildkiteAgent.set_meta_data_many`.
+        """
+        keys = list(items)
+        results = await self._run_many(
+            self.set_meta_data,
+            keys,
+            items.values(),
+            max_concurrency=max_concurrency,
+        )
+        _bulk_results(keys, results, action="set")
+
 
 @dataclass(frozen=True)
 class TrioBuildkiteAgent(_BuildkiteAgentBase):
+    @staticmethod
+    def _make_limiter(max_concurrency: int) -> Any:
+        import trio  # type: ignore
+
+        return trio.CapacityLimiter(max_concurrency)
+
     @staticmethod
     def _make_async(func: Callable[P, T]) -> Callable[P, Coroutine[None, None, T]]:
+        spec = _get_command_spec(func)
+
         @functools.wraps(func)
         async def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
             import trio  # type: ignore
 
-            return await trio.to_thread.run_sync(lambda: func(*args, **kwargs))
+            bkagent: TrioBuildkiteAgent = args[0]  # type: ignore
+            cache_args = spec.cache_args(bkagent, args[1:], kwargs)
+            cached = spec.cached(bkagent, cache_args)
+            if cached is not _MISSING:
+                return cached
+
+            argv = spec.argv(bkagent, args[1:], kwargs)
+            # NB: `stdin=None` inherits stdin (like `subprocess.run`), e.g. for `pipeline upload`
+            async with bkagent._async_slot():
+                result = await trio.run_process(
+                    argv, stdin=None, capture_stdout=True, check=False
+                )
+            return spec.finish(
+                bkagent,
+                cache_args,
+                subprocess.CompletedProcess(
+                    argv, result.returncode, _decode_stdout(result.stdout), None
+                ),
+            )
 
         return wrapper
 
@@ -271,3 +797,65 @@ class TrioBuildkiteAgent(_BuildkiteAgentBase):
     meta_data_exists = _make_async(_BuildkiteAgentBase._meta_data_exists)
     meta_data_keys = _make_async(_BuildkiteAgentBase._meta_data_keys)
     upload_pipeline = _make_async(_BuildkiteAgentBase._upload_pipeline)
+
+    async def _get_meta_data_or_missing(self, key: str) -> str:
+        try:
+            return await self.get_meta_data(key)
+        except self.CalledProcessError:
+            if await self.meta_data_exists(key):
+                raise
+            return _MISSING
+
+    async def _run_many(
+        self,
+        func: Callable[..., Coroutine[None, None, Any]],
+        *args: Iterable[Any],
+        max_concurrency: int,
+    ) -> list[Any]:
+        import trio  # type: ignore
+
+        limiter = trio.CapacityLimiter(max_concurrency)
+        arg_list = list(zip(*args))
+        results: list[Any] = [None] * len(arg_list)
+
+        async def run(index: int, *arg: Any) -> None:
+            async with limiter:
+                try:
+                    results[index] = await func(*arg)
+                except (self.CalledProcessError, OSError) as e:
+                    results[index] = e
+
+        async with trio.open_nursery() as nursery:
+            for index, arg in enumerate(arg_list):
+                nursery.start_soon(run, index, *arg)
+        return results
+
+    async def get_meta_data_many(
+        self, keys: Iterable[str], *, max_concurrency: int = _BULK_MAX_CONCURRENCY
+    ) -> dict[str, str]:
+        """
+        Get the data for many keys (concurrently). See `BuildkiteAgent.get_meta_data_many`.
+        """
+        keys = list(dict.fromkeys(keys))
+        results = await self._run_many(
+            self._get_meta_data_or_missing, keys, max_concurrency=max_concurrency
+        )
+        return _bulk_results(keys, results, action="get")
+
+    async def set_meta_data_many(
+        self,
+        items: Mapping[str, str],
+        *,
+        max_concurrency: int = _BULK_MAX_CONCURRENCY,
+    ) -> None:
+        """
+        Set the data for many keys (concurrently). See `BuildkiteAgent.set_meta_data_many`.
+        """
+        keys = list(items)
+        results = await self._run_many(
+            self.set_meta_data,
+            keys,
+            items.values(),
+            max_concurrency=max_concurrency,
+        )
+        _bulk_results(keys, results, action="set")
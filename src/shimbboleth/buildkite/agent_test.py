@@ -1,16 +1,22 @@
 from textwrap import dedent
 from dataclasses import dataclass
 from pathlib import Path
+import concurrent.futures
+import itertools
 import os
+import time
 from typing import Any
 from unittest.mock import call, _Call
 
 import pytest
 
 from shimbboleth.buildkite.agent import (
+    AgentCallStats,
     BuildkiteAgent,
+    MetaDataCache,
     AsyncioBuildkiteAgent,
     TrioBuildkiteAgent,
+    _CommandSpec,
 )
 
 
@@ -244,3 +250,310 @@ async def test_meta_data_exists(fake_agent: FakeBKAgent, client_agent: ClientAge
 async def test_meta_data_keys(fake_agent: FakeBKAgent, client_agent: ClientAgent):
     fake_agent.stdout = "key1\nkey2\n"
     assert BuildkiteAgent().meta_data_keys() == ["key1", "key2"]
+
+
+@pytest.mark.asyncio
+async def test_asyncio__concurrent(fake_agent: FakeBKAgent, monkeypatch):
+    import asyncio
+
+    # NB: Calls run on the event loop, not in threads
+    monkeypatch.setattr(asyncio, "to_thread", None)
+
+    fake_agent.stdout = "value\r\n"
+    agent = AsyncioBuildkiteAgent()
+    assert (
+        await asyncio.gather(
+            *(agent.get_meta_data(f"key{index}") for index in range(100))
+        )
+        == ["value"] * 100
+    )
+    assert sorted(fake_agent.args) == sorted(
+        itertools.chain.from_iterable(
+            ["meta-data", "get", f"key{index}"] for index in range(100)
+        )
+    )
+
+
+@pytest.mark.asyncio
+async def test_asyncio__cancelled(fake_agent: FakeBKAgent):
+    import asyncio
+
+    pidfile = fake_agent.path / "pid"
+    (fake_agent.path / "buildkite-agent").write_text(
+        f'#!/bin/bash\necho $$ > "{pidfile}"\nexec sleep 60\n'
+    )
+
+    task = asyncio.create_task(AsyncioBuildkiteAgent().get_meta_data("key"))
+    while not pidfile.exists() or not pidfile.read_text():
+        await asyncio.sleep(0.01)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    # NB: Killed and reaped (so there's no such process, not even a zombie)
+    with pytest.raises(ProcessLookupError):
+        os.kill(int(pidfile.read_text()), 0)
+
+
+@pytest.mark.trio
+async def test_trio__concurrent(fake_agent: FakeBKAgent, monkeypatch):
+    import trio
+
+    running = peak = 0
+    run_process = trio.run_process
+
+    async def counting_run_process(*args, **kwargs):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        try:
+            return await run_process(*args, **kwargs)
+        finally:
+            running -= 1
+
+    monkeypatch.setattr(trio, "run_process", counting_run_process)
+
+    fake_agent.stdout = "value\r\n"
+    agent = TrioBuildkiteAgent(max_concurrency=4)
+    results = []
+
+    async def get(key):
+        results.append(await agent.get_meta_data(key))
+
+    async with trio.open_nursery() as nursery:
+        for index in range(50):
+            nursery.start_soon(get, f"key{index}")
+
+    assert results == ["value"] * 50
+    assert peak == 4
+    assert agent.stats.peak_running == 4
+    assert agent.stats.calls == 50
+
+
+def _assert_limited_stats(stats: AgentCallStats, *, calls: int, limit: int):
+    assert stats.calls == calls
+    assert stats.peak_running == limit
+    assert stats.peak_waiting > 0
+    assert stats.running == stats.waiting == 0
+    assert 0 < stats.max_wait_time <= stats.total_wait_time
+
+
+def test_max_concurrency__sync(fake_agent: FakeBKAgent):
+    agent = BuildkiteAgent(max_concurrency=2)
+    with concurrent.futures.ThreadPoolExecutor(8) as executor:
+        list(executor.map(agent.get_meta_data, [f"key{i}" for i in range(20)]))
+
+    _assert_limited_stats(agent.stats, calls=20, limit=2)
+
+
+@pytest.mark.asyncio
+async def test_max_concurrency__asyncio(fake_agent: FakeBKAgent):
+    import asyncio
+
+    agent = AsyncioBuildkiteAgent(max_concurrency=3)
+    await asyncio.gather(*(agent.get_meta_data(f"key{i}") for i in range(20)))
+
+    _assert_limited_stats(agent.stats, calls=20, limit=3)
+
+
+def test_max_concurrency__asyncio_reused_across_loops(fake_agent: FakeBKAgent):
+    import asyncio
+
+    agent = AsyncioBuildkiteAgent(max_concurrency=2)
+
+    async def fan_out():
+        await asyncio.gather(*(agent.get_meta_data(f"key{i}") for i in range(10)))
+
+    asyncio.run(fan_out())
+    asyncio.run(fan_out())
+
+    _assert_limited_stats(agent.stats, calls=20, limit=2)
+
+
+def test_max_concurrency__unlimited(fake_agent: FakeBKAgent):
+    agent = BuildkiteAgent()
+    agent.get_meta_data("key")
+    assert agent.stats.calls == 1
+    assert agent.stats.peak_waiting == 0
+    assert agent == BuildkiteAgent()
+
+
+async def test_get_meta_data_many(fake_agent: FakeBKAgent, client_agent: ClientAgent):
+    fake_agent.stdout = "value"
+    assert await client_agent.get_meta_data_many(
+        ["key1", "key2", "key1"], max_concurrency=2
+    ) == {"key1": "value", "key2": "value"}
+    assert sorted(fake_agent.args) == sorted(
+        ["meta-data", "get", "key1", "meta-data", "get", "key2"]
+    )
+    assert await client_agent.get_meta_data_many([]) == {}
+
+
+async def test_get_meta_data_many__missing(
+    fake_agent: FakeBKAgent, client_agent: ClientAgent
+):
+    # NB: `get` fails, but `exists` says the key doesn't exist
+    fake_agent.returncode = 100
+    assert await client_agent.get_meta_data_many(["key1", "key2"]) == {}
+
+
+async def test_get_meta_data_many__errors(
+    fake_agent: FakeBKAgent, client_agent: ClientAgent
+):
+    fake_agent.returncode = 1
+    with pytest.raises(ExceptionGroup) as e:
+        await client_agent.get_meta_data_many(["key1", "key2"])
+
+    assert len(e.value.exceptions) == 2
+    assert all(
+        isinstance(error, BuildkiteAgent.CalledProcessError)
+        for error in e.value.exceptions
+    )
+    assert sorted(error.__notes__[0] for error in e.value.exceptions) == [
+        "meta-data key: 'key1'",
+        "meta-data key: 'key2'",
+    ]
+
+
+async def test_get_meta_data_many__bug(
+    fake_agent: FakeBKAgent, client_agent: ClientAgent, monkeypatch
+):
+    def argv(*args, **kwargs):
+        raise TypeError("bug")
+
+    monkeypatch.setattr(_CommandSpec, "argv", argv)
+    with pytest.raises(Exception) as e:
+        await client_agent.get_meta_data_many(["key"])
+
+    error = e.value
+    # NB: asyncio's `TaskGroup` always raises a group
+    if isinstance(error, ExceptionGroup):
+        (error,) = error.exceptions
+    assert isinstance(error, TypeError)
+    # NB: Raised as-is, not collected as the key's error
+    assert not hasattr(error, "__notes__")
+
+
+async def test_set_meta_data_many(fake_agent: FakeBKAgent, client_agent: ClientAgent):
+    await client_agent.set_meta_data_many({"key1": "value1", "key2": "value2"})
+    assert sorted(fake_agent.args) == sorted(
+        ["meta-data", "set", "key1", "value1", "meta-data", "set", "key2", "value2"]
+    )
+
+    fake_agent.returncode = 1
+    with pytest.raises(ExceptionGroup, match=r"Failed to set 1 meta-data key\(s\)"):
+        await client_agent.set_meta_data_many({"key1": "value1"})
+
+
+async def test_meta_data_cache(fake_agent: FakeBKAgent, client_agent: ClientAgent):
+    cache = MetaDataCache()
+    client_agent.obj = type(client_agent.obj)(meta_data_cache=cache)
+    fake_agent.stdout = "value"
+
+    assert await client_agent.get_meta_data("key") == "value"
+    assert await client_agent.get_meta_data("key") == "value"
+    assert await client_agent.meta_data_exists("key") is True
+    assert fake_agent.args == ["meta-data", "get", "key"]
+    assert (cache.hits, cache.misses) == (2, 1)
+
+    # NB: Written through
+    await client_agent.set_meta_data("key", "new")
+    assert await client_agent.get_meta_data("key") == "new"
+    assert fake_agent.args == [
+        "meta-data",
+        "get",
+        "key",
+        "meta-data",
+        "set",
+        "key",
+        "new",
+    ]
+
+    fake_agent.argsfile.unlink()
+    fake_agent.stdout = "key\nother\n"
+    assert await client_agent.meta_data_keys() == ["key", "other"]
+    (await client_agent.meta_data_keys()).append("mutated")
+    assert await client_agent.meta_data_keys() == ["key", "other"]
+    assert fake_agent.args == ["meta-data", "keys"]
+
+    cache.invalidate("key")
+    await client_agent.meta_data_keys()
+    await client_agent.get_meta_data("key")
+    assert fake_agent.args == ["meta-data", "keys"] * 2 + ["meta-data", "get", "key"]
+
+
+async def test_meta_data_cache__errors(
+    fake_agent: FakeBKAgent, client_agent: ClientAgent
+):
+    cache = MetaDataCache()
+    client_agent.obj = type(client_agent.obj)(meta_data_cache=cache)
+
+    fake_agent.returncode = 100
+    assert await client_agent.meta_data_exists("key") is False
+    assert await client_agent.meta_data_exists("key") is False
+    with pytest.raises(BuildkiteAgent.CalledProcessError):
+        await client_agent.get_meta_data("key")
+    with pytest.raises(BuildkiteAgent.CalledProcessError):
+        await client_agent.get_meta_data("key")
+
+    # NB: Failures aren't cached
+    assert (
+        fake_agent.args
+        == ["meta-data", "exists", "key"]
+        + [
+            "meta-data",
+            "get",
+            "key",
+        ]
+        * 2
+    )
+    assert (cache.hits, cache.misses) == (1, 3)
+
+
+async def test_meta_data_cache__keywords(
+    fake_agent: FakeBKAgent, client_agent: ClientAgent
+):
+    cache = MetaDataCache()
+    client_agent.obj = type(client_agent.obj)(meta_data_cache=cache)
+    fake_agent.stdout = "value"
+
+    await client_agent.set_meta_data(key="key", value="new")
+    assert await client_agent.get_meta_data("key") == "new"
+    assert await client_agent.get_meta_data(key="key") == "new"
+    assert await client_agent.meta_data_exists(key="key") is True
+    assert (cache.hits, cache.misses) == (3, 0)
+
+
+def test_meta_data_cache__ttl(fake_agent: FakeBKAgent, monkeypatch):
+    now = [0.0]
+    monkeypatch.setattr(time, "monotonic", lambda: now[0])
+    cache = MetaDataCache(ttl=10)
+    agent = BuildkiteAgent(meta_data_cache=cache)
+    fake_agent.stdout = "value"
+
+    agent.get_meta_data("key")
+    now[0] = 10
+    agent.get_meta_data("key")
+    now[0] = 10.5
+    agent.get_meta_data("key")
+    assert fake_agent.args == ["meta-data", "get", "key"] * 2
+    assert (cache.hits, cache.misses) == (1, 2)
+
+    cache.invalidate()
+    agent.get_meta_data("key")
+    assert fake_agent.args == ["meta-data", "get", "key"] * 3
+
+
+async def test_meta_data_cache__bulk(
+    fake_agent: FakeBKAgent, client_agent: ClientAgent
+):
+    cache = MetaDataCache()
+    client_agent.obj = type(client_agent.obj)(meta_data_cache=cache)
+    fake_agent.stdout = "value"
+
+    await client_agent.set_meta_data_many({"key1": "value1"})
+    assert await client_agent.get_meta_data_many(["key1", "key2"]) == {
+        "key1": "value1",
+        "key2": "value",
+    }
+    assert (cache.hits, cache.misses) == (1, 1)
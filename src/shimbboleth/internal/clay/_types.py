@@ -1,4 +1,6 @@
-from typing import Literal, Annotated, TypeAlias, Union
+from typing import Any, Callable, Literal, Annotated, TypeAlias, TypeVar, Union
+
+T = TypeVar("T")
 
 AnnotationType: TypeAlias = type(Annotated[None, None])  # type: ignore
 """The "type" of an Annotated type. E.g. return type of `Annotated.__class_getitem__`."""
@@ -16,3 +18,59 @@ def get_origin(t, /):
     while hasattr(ret, "__origin__"):
         ret = ret.__origin__
     return ret
+
+
+def _memo_key(t, models: list[type]):
+    if isinstance(t, AnnotationType):
+        return (
+            AnnotationType,
+            _memo_key(t.__origin__, models),
+            tuple(_memo_key(arg, models) for arg in t.__metadata__),
+        )
+    args = getattr(t, "__args__", None)
+    if isinstance(args, tuple):
+        # NB: Unions (and Literals) compare equal regardless of arg order, but the arg order matters.
+        return (
+            getattr(t, "__origin__", type(t)),
+            tuple(_memo_key(arg, models) for arg in args),
+        )
+    if isinstance(t, type):
+        if "__model_memo__" in vars(t):
+            models.append(t)
+        return t
+    # NB: E.g. `Literal` values or `Annotated` metadata (`1` and `True` compare equal)
+    return (type(t), t)
+
+
+def memoized(memo: dict, make: Callable[[Any], T], field_type) -> T:
+    """
+    Return `make(field_type)`, memoized per annotation in `memo`.
+
+    Annotations are keyed by an order-preserving form (E.g. `list[int | str]` and `list[str | int]`
+    are memoized separately). Annotations referencing models are memoized on the models themselves
+    (in `__model_memo__`), so they're freed along with the models.
+    """
+    models: list[type] = []
+    try:
+        key = _memo_key(field_type, models)
+        hash(key)
+    except TypeError:
+        # NB: Unhashable annotation (e.g. `Annotated[int, []]`)
+        return make(field_type)
+
+    if models:
+        key = (make, key)
+        memo = models[0].__model_memo__ or {}
+    try:
+        return memo[key]
+    except KeyError:
+        pass
+
+    value = make(field_type)
+    if not models:
+        memo[key] = value
+    for model in models:
+        if model.__model_memo__ is None:
+            model.__model_memo__ = {}
+        model.__model_memo__[key] = value
+    return value
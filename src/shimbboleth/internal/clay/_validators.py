@@ -12,6 +12,7 @@ from shimbboleth.internal.clay._types import (
     AnnotationType,
     GenericUnionType,
     get_origin,
+    memoized,
 )
 from shimbboleth.internal.clay.validation import (
     ValidationError,
@@ -32,35 +33,111 @@ K = TypeVar("K")
 V = TypeVar("V")
 
 
+@dataclasses.dataclass(slots=True, frozen=True)
+class ChainValidator:
+    """Runs each of `validators` in turn (as one callable). See `fuse_validators`."""
+
+    validators: tuple[Validator, ...]
+
+    def __call__(self, value):
+        for validator in self.validators:
+            validator(value)
+
+
+@dataclasses.dataclass(slots=True, frozen=True)
+class RangeValidator:
+    """A `Ge` and `Le` as a single range check. See `fuse_validators`."""
+
+    lower: int
+    upper: int
+    validators: tuple[Validator, ...]
+    """The original validators, re-run on failure for their (exact) error."""
+
+    def __call__(self, value: int):
+        if not (self.lower <= value <= self.upper):
+            for validator in self.validators:
+                validator(value)
+
+
+def fuse_validators(validators: Iterable[Validator]) -> Validator | None:
+    """
+    Return a single validator equivalent to running each of `validators` (or `None` if empty).
+
+    Adjacent `Ge`/`Le` pairs become a single `RangeValidator`.
+    """
+    validators = tuple(validators)
+    if len(validators) == 1:
+        return validators[0]
+
+    fused: list[Validator] = []
+    for validator in validators:
+        previous = fused[-1] if fused else None
+        if isinstance(previous, Ge) and isinstance(validator, Le):
+            fused[-1] = RangeValidator(
+                previous.bound, validator.bound, (previous, validator)
+            )
+        elif isinstance(previous, Le) and isinstance(validator, Ge):
+            fused[-1] = RangeValidator(
+                validator.bound, previous.bound, (previous, validator)
+            )
+        else:
+            fused.append(validator)
+
+    if not fused:
+        return None
+    if len(fused) == 1:
+        return fused[0]
+    return ChainValidator(tuple(fused))
+
+
 @dataclasses.dataclass(slots=True, frozen=True)
 class ListElementsValidator:
-    element_validators: tuple[Validator, ...]
+    element_validator: Validator
 
     def __call__(self, value: list):
-        for index, element in enumerate(value):
-            with ValidationError.context(index=index):
-                for validator in self.element_validators:
-                    validator(element)
+        element_validator = self.element_validator
+        # NB: Elements are type-correct, so they're non-empty iff they're truthy
+        if element_validator is NonEmpty and all(value):
+            return
+
+        # NB: The path is only added on failure (instead of a context manager per element)
+        index = 0
+        try:
+            for index, element in enumerate(value):
+                element_validator(element)
+        except ValidationError as e:
+            e.add_context(index=index)
+            raise
 
 
 @dataclasses.dataclass(slots=True, frozen=True)
 class DictValidator:
-    keys_validators: tuple[Validator, ...]
-    values_validators: tuple[Validator, ...]
+    key_validator: Validator | None
+    value_validator: Validator | None
 
     def __call__(self, value: dict[K, Any]):
-        for validator in self.keys_validators:
-            for key in value.keys():
-                try:
-                    validator(key)
-                except ValidationError as e:
-                    e.qualifier = "key"
-                    raise
-        for validator in self.values_validators:
-            for key, value in value.items():
+        # NB: See `ListElementsValidator`
+        if self.key_validator is NonEmpty and all(value):
+            pass
+        elif self.key_validator is not None:
+            try:
+                for key in value.keys():
+                    self.key_validator(key)
+            except ValidationError as e:
+                e.qualifier = "key"
+                raise
+        if self.value_validator is NonEmpty and all(value.values()):
+            pass
+        elif self.value_validator is not None:
+            value_validator = self.value_validator
+            key = None
+            try:
+                for key, item in value.items():
+                    value_validator(item)
+            except ValidationError as e:
                 assert isinstance(key, str)
-                with ValidationError.context(key=key):
-                    validator(value)
+                e.add_context(key=key)
+                raise
 
 
 @dataclasses.dataclass(slots=True, frozen=True)
@@ -77,36 +154,52 @@ class UUIDValidator:
 @dataclasses.dataclass(slots=True, frozen=True)
 class UnionValidator:
     # NB: This is an incomplete map, only types with validators will be included.
-    validators_by_type: Mapping[type, tuple[Validator, ...]]
+    validator_by_type: Mapping[type, Validator]
 
     def __call__(self, value: str):
         # NB: Remember, we assume data type-correctness
-        validators = self.validators_by_type.get(type(value), [])
-        for validator in validators:
+        validator = self.validator_by_type.get(type(value))
+        if validator is not None:
             validator(value)
 
 
+_VALIDATORS: dict[Any, tuple[Validator, ...]] = {}
+
+
+def get_validators(field_type) -> tuple[Validator, ...]:
+    """
+    Return the validators for `field_type` (at most one, see `fuse_validators`).
+
+    Memoized per annotation, so equal annotations (E.g. `NonEmptyString`) share validators.
+    """
+    return memoized(_VALIDATORS, _make_validators_tuple, field_type)
+
+
+def _make_validators_tuple(field_type) -> tuple[Validator, ...]:
+    return tuple(make_validators(field_type))
+
+
 @singledispatch
-def get_validators(field_type: type) -> Iterable[Validator]:
+def make_validators(field_type: type) -> Iterable[Validator]:
     return ()
 
 
-@get_validators.register
+@make_validators.register
 def get_generic_alias_validators(field_type: GenericAlias) -> Iterable[Validator]:
     container_t = field_type.__origin__
     argTs = field_type.__args__
     if container_t is list:
-        element_validators = tuple(get_validators(argTs[0]))
-        if element_validators:
-            yield ListElementsValidator(element_validators)
+        element_validator = fuse_validators(get_validators(argTs[0]))
+        if element_validator is not None:
+            yield ListElementsValidator(element_validator)
     elif container_t is dict:
-        key_validators = tuple(get_validators(argTs[0]))
-        value_validators = tuple(get_validators(argTs[1]))
-        if key_validators or value_validators:
-            yield DictValidator(key_validators, value_validators)
+        key_validator = fuse_validators(get_validators(argTs[0]))
+        value_validator = fuse_validators(get_validators(argTs[1]))
+        if key_validator is not None or value_validator is not None:
+            yield DictValidator(key_validator, value_validator)
 
 
-@get_validators.register
+@make_validators.register
 def get_union_type_validators(field_type: UnionType) -> Iterable[Validator]:
     validators_by_type = {
         get_origin(argT): list(get_validators(argT)) for argT in field_type.__args__
@@ -117,35 +210,50 @@ def get_union_type_validators(field_type: UnionType) -> Iterable[Validator]:
             f"Overlapping outer types in Union is unsupported: Input: `{field_type.__args__}`. Result: `{validators_by_type}`."
         )
 
-    validators_by_type = {
-        key: tuple(value) for key, value in validators_by_type.items() if value
+    validator_by_type = {
+        key: fuse_validators(value)
+        for key, value in validators_by_type.items()
+        if value
     }
-    if validators_by_type:
-        yield UnionValidator(validators_by_type)
+    if validator_by_type:
+        yield UnionValidator(validator_by_type)  # type: ignore
 
 
-@get_validators.register
+@make_validators.register
 def _get_generic_union_type_validators(
     field_type: GenericUnionType,
 ) -> Iterable[Validator]:
     yield from get_union_type_validators(field_type)
 
 
+_UUID_VALIDATOR = UUIDValidator()
+
+_NOT_VALIDATORS: dict[Any, Not] = {}
+
+
+def _get_not_validator(argT: _NotGenericAlias) -> Not:
+    return memoized(_NOT_VALIDATORS, _make_not_validator, argT.inner)
+
+
+def _make_not_validator(inner) -> Not:
+    return Not(list(_get_annotation_arg_validators(inner)))
+
+
 def _get_annotation_arg_validators(argT) -> Iterable[Validator]:
     if argT is NonEmpty or isinstance(argT, (MatchesRegex, Ge, Le, MaxLength)):
         yield argT
     elif isinstance(argT, _NotGenericAlias):
-        yield Not(list(_get_annotation_arg_validators(argT.inner)))
+        yield _get_not_validator(argT)
     elif argT is uuid.UUID:
-        yield UUIDValidator()
+        yield _UUID_VALIDATOR
     else:
         yield from get_validators(argT)
 
 
-@get_validators.register
+@make_validators.register
 def get_annotation_validators(field_type: AnnotationType) -> Iterable[Validator]:
     originT = field_type.__origin__
-    yield from get_validators(originT)
+    validators = list(get_validators(originT))
     for annotation in field_type.__metadata__:
         annotation_validators = list(_get_annotation_arg_validators(annotation))
         if annotation_validators and isinstance(originT, (UnionType, GenericUnionType)):
@@ -153,7 +261,12 @@ def get_annotation_validators(field_type: AnnotationType) -> Iterable[Validator]
                 f"Valiating union types is unsupported. (For type '{originT}')"
             )
 
-        yield from annotation_validators
+        validators.extend(annotation_validators)
+
+    # NB: The whole chain is called as one validator
+    validator = fuse_validators(validators)
+    if validator is not None:
+        yield validator
 
 
 class ValidationDescriptor:
@@ -163,12 +276,49 @@ class ValidationDescriptor:
         self.field_descriptor = field_descriptor
         assert validators
         self.validators = validators
+        self.validator: Validator = fuse_validators(validators)  # type: ignore
 
     def __get__(self, instance, owner):
         return self.field_descriptor.__get__(instance, owner)
 
     def __set__(self, instance, value):
-        for validator in self.validators:
-            with ValidationError.context(attr=self.field_descriptor.__name__):
-                validator(value)
+        self.validate(value)
         self.field_descriptor.__set__(instance, value)
+
+    def validate(self, value):
+        """Run the field's validators on `value` (without setting it)."""
+        try:
+            self.validator(value)
+        except ValidationError as e:
+            e.add_context(attr=self.field_descriptor.__name__)
+            raise
+
+
+class LazyValidationDescriptor:
+    """
+    Stands in for a field's `ValidationDescriptor` on "lazy" models, until the field is first set.
+
+    Then the field's validators are computed, and this replaces itself (on `owner`) with the
+    `ValidationDescriptor` (or just the slot's descriptor, if the field has no validators).
+    """
+
+    def __init__(self, owner: type, field_descriptor: MemberDescriptorType, field_type):
+        self.owner = owner
+        self.field_descriptor = field_descriptor
+        self.field_type = field_type
+
+    def resolve(self) -> ValidationDescriptor | MemberDescriptorType:
+        validators = get_validators(self.field_type)
+        descriptor = (
+            ValidationDescriptor(self.field_descriptor, validators)
+            if validators
+            else self.field_descriptor
+        )
+        setattr(self.owner, self.field_descriptor.__name__, descriptor)
+        return descriptor
+
+    def __get__(self, instance, owner):
+        return self.field_descriptor.__get__(instance, owner)
+
+    def __set__(self, instance, value):
+        self.resolve().__set__(instance, value)
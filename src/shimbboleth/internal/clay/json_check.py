@@ -0,0 +1,531 @@
+"""
+Validate-only JSON loading: checking JSON data is loadable, without building anything.
+
+Mirrors `json_load.py` (and the model's `Annotated` validators), raising the same errors
+(with the same paths) that loading would, in the same order.
+"""
+
+from functools import singledispatch
+from typing import Any, Callable, Iterable, Iterator, TypeAlias
+from types import UnionType, GenericAlias
+import dataclasses
+import functools
+import itertools
+import re
+import uuid
+
+from shimbboleth.internal.clay.model import Model
+from shimbboleth.internal.clay._types import (
+    AnnotationType,
+    LiteralType,
+    GenericUnionType,
+    get_origin,
+    memoized,
+)
+from shimbboleth.internal.clay._validators import (
+    _get_annotation_arg_validators,
+    get_validators,
+)
+from shimbboleth.internal.clay.json_load import (
+    _PASSTHROUGH_LOADERS,
+    Loader,
+    MissingFieldsError,
+    NotAValidUUIDError,
+    WrongTypeError,
+    _FieldLoader,
+    _ensure_is,
+    _get_jsontype,
+    _get_model_loader,
+    _load_unsupported,
+    get_loader,
+    load_any,
+    load_bool,
+    load_int,
+    load_none,
+    load_pattern,
+    load_str,
+)
+from shimbboleth.internal.clay.validation import ValidationError, Validator
+
+Checker: TypeAlias = Callable[[Any], Any]
+
+_CHECKERS: dict[Any, Checker] = {}
+
+
+def get_checker(field_type) -> Checker:
+    """
+    Return the checker for `field_type`, a callable taking the JSON data.
+
+    A checker raises the same error its loader would, and otherwise returns nothing useful.
+    (Like loaders, checkers are specialized and memoized per annotation)
+    """
+    return memoized(_CHECKERS, make_checker, field_type)
+
+
+def check(field_type, *, data) -> None:
+    get_checker(field_type)(data)
+
+
+@singledispatch
+def make_checker(field_type) -> Checker:
+    if field_type is bool:
+        return load_bool
+    if field_type is int:
+        return load_int
+    if field_type is str:
+        return load_str
+    if field_type is None or field_type is type(None):
+        return load_none
+    if field_type is re.Pattern:
+        # NB: There's no way to check a pattern without compiling it (`re` caches it, at least).
+        return load_pattern
+    if field_type is uuid.UUID:
+        return check_uuid
+    if field_type is Any:
+        return load_any
+    # NB: Dispatched manually, so we can avoid ciruclar definition with `Model.model_validate_json_data`
+    if isinstance(field_type, type) and issubclass(field_type, Model):
+        return field_type.model_validate_json_data
+
+    return functools.partial(_load_unsupported, field_type)
+
+
+@make_checker.register
+def make_generic_alias_checker(field_type: GenericAlias) -> Checker:
+    container_t = field_type.__origin__
+    if container_t is list:
+        return _make_list_checker(field_type)
+    if container_t is dict:
+        return _make_dict_checker(field_type)
+    return functools.partial(_load_unsupported, field_type)
+
+
+@make_checker.register(UnionType)
+@make_checker.register(GenericUnionType)
+def make_union_type_checker(field_type) -> Checker:
+    checkers_by_jsontype: dict[type, Checker] = {}
+    for argT in field_type.__args__:
+        # NB: First matching arm wins (just like loading)
+        checkers_by_jsontype.setdefault(_get_jsontype(argT), get_checker(argT))
+
+    def check_union_type(data: Any):
+        try:
+            checker = checkers_by_jsontype[type(data)]
+        except KeyError:
+            raise WrongTypeError(field_type, data) from None
+        checker(data)
+
+    return check_union_type
+
+
+@make_checker.register
+def make_literal_checker(field_type: LiteralType) -> Checker:
+    # NB: Loading a literal doesn't build anything
+    return get_loader(field_type)
+
+
+@make_checker.register
+def make_annotation_checker(field_type: AnnotationType) -> Checker:
+    return get_checker(field_type.__origin__)
+
+
+def check_uuid(data: Any) -> None:
+    _ensure_is(data, str)
+    # NB: The same parsing `uuid.UUID(hex)` does, minus building the `UUID`.
+    hex = data.replace("urn:", "").replace("uuid:", "")
+    hex = hex.strip("{}").replace("-", "")
+    try:
+        if len(hex) != 32:
+            raise ValueError
+        int(hex, 16)
+    except ValueError:
+        raise NotAValidUUIDError(data)
+
+
+def _make_list_checker(field_type: GenericAlias) -> Checker:
+    (argT,) = field_type.__args__
+    check_item = get_checker(argT)
+    passthrough_type = _PASSTHROUGH_LOADERS.get(check_item, ...)
+
+    def check_list(data: Any) -> None:
+        _ensure_is(data, list)
+        if passthrough_type is None:
+            return
+        if passthrough_type is not ... and all(
+            type(item) is passthrough_type for item in data
+        ):
+            return
+
+        index = 0
+        try:
+            for index, item in enumerate(data):
+                check_item(item)
+        except ValidationError as e:
+            e.add_context(index=index)
+            raise
+
+    return check_list
+
+
+def _make_dict_checker(field_type: GenericAlias) -> Checker:
+    keyT, valueT = field_type.__args__
+    check_key = get_checker(keyT)
+    check_value = get_checker(valueT)
+    passthrough_type = (
+        _PASSTHROUGH_LOADERS.get(check_value, ...) if check_key is load_str else ...
+    )
+
+    def check_dict(data: Any) -> None:
+        _ensure_is(data, dict)
+        if passthrough_type is not ... and all(type(key) is str for key in data):
+            if passthrough_type is None or all(
+                type(value) is passthrough_type for value in data.values()
+            ):
+                return
+
+        for key, value in data.items():
+            check_key(key)
+            try:
+                check_value(value)
+            except ValidationError as e:
+                e.add_context(key=key)
+                raise
+
+    return check_dict
+
+
+_NO_DEFAULT: Any = object()
+
+
+@dataclasses.dataclass(slots=True, frozen=True)
+class _FieldValidators:
+    name: str
+    field_loader: _FieldLoader | None
+    """The field's loader (`None` if the field isn't loaded from JSON, E.g. `init=False`)."""
+    validators: tuple[Validator, ...]
+    default: Any
+    """The value validated if the field isn't provided (`_NO_DEFAULT` if required)."""
+    load: Loader | None
+    """Loads the value to report, if the loaded value differs from the JSON value."""
+
+    def validate(self, value: Any) -> None:
+        try:
+            for validator in self.validators:
+                validator(value)
+        except ValidationError as e:
+            e.add_context(attr=self.name)
+            raise
+
+    def validate_json(self, value: Any) -> None:
+        """
+        Validate the (type-correct) JSON `value`, without loading it.
+
+        NB: Validators only look at the "shape" of values (lengths, strings, numbers), which the
+            JSON value shares with the loaded value. Only once a validator has failed is the value
+            loaded, so the error reports the loaded value (just like loading would).
+        """
+        try:
+            self.validate(value)
+        except ValidationError:
+            if self.load is None:
+                raise
+            self.validate(self.load(value))
+            raise
+
+
+def _is_plain_json(field_type) -> bool:
+    """Return whether values of type `field_type` load as-is (as the same JSON value)."""
+    if isinstance(field_type, AnnotationType):
+        return _is_plain_json(field_type.__origin__)
+    if isinstance(field_type, LiteralType):
+        return True
+    if isinstance(field_type, (UnionType, GenericUnionType, GenericAlias)):
+        return all(_is_plain_json(argT) for argT in field_type.__args__)
+    return field_type in (bool, int, str, None, type(None), Any)
+
+
+class _ModelChecker:
+    """
+    A `Model` checker, "compiled" once per model class (on first check).
+
+    Runs the same checks as loading, in the same order:
+        - The extras check
+        - The JSON type checks of each field (checking nested models fully)
+        - The required fields check
+        - Each field's validators (as the model's constructor would, but on the JSON value)
+    """
+
+    __slots__ = ("model_loader", "fields", "field_validators")
+
+    def __init__(self, model_type: type[Model]):
+        self.model_loader = model_loader = _get_model_loader(model_type)
+        self.fields = tuple(
+            (
+                field,
+                None
+                if field.json_loader
+                else get_checker(model_type.__dataclass_fields__[field.name].type),
+            )
+            for field in model_loader.fields
+        )
+
+        field_loaders = {field.name: field for field in model_loader.fields}
+        field_validators = []
+        for field in dataclasses.fields(model_type):
+            validators = tuple(get_validators(field.type))
+            if not validators:
+                continue
+
+            if field.default is not dataclasses.MISSING:
+                default = field.default
+            elif field.default_factory is not dataclasses.MISSING:
+                default = field.default_factory()
+            else:
+                default = _NO_DEFAULT
+
+            field_validators.append(
+                _FieldValidators(
+                    name=field.name,
+                    field_loader=field_loaders.get(field.name),
+                    validators=validators,
+                    default=default,
+                    load=None if _is_plain_json(field.type) else get_loader(field.type),
+                )
+            )
+        self.field_validators = tuple(field_validators)
+
+    def __call__(self, data: Any) -> None:
+        model_loader = self.model_loader
+        _ensure_is(data, dict)
+
+        extra_keys = data.keys() - model_loader.known_keys
+        if extra_keys:
+            model_loader._get_extras(data, extra_keys)
+
+        # NB: Values from `json_loader`s (which we have no choice but to call)
+        loaded = {}
+        missing_fields = []
+        for field, checker in self.fields:
+            value = field.get_json_value(data)
+            if value is dataclasses.MISSING:
+                if field.required:
+                    missing_fields.append(field.name)
+                continue
+
+            try:
+                if checker is None:
+                    loaded[field.name] = field.json_loader(field.load(value))  # type: ignore
+                else:
+                    checker(value)
+            except ValidationError as e:
+                e.add_context(attr=field.json_name)
+                raise
+
+        if missing_fields:
+            raise MissingFieldsError(model_loader.model_type.__name__, *missing_fields)
+
+        for field_validators in self.field_validators:
+            field_loader = field_validators.field_loader
+            try:
+                if field_validators.name in loaded:
+                    value = loaded[field_validators.name]
+                else:
+                    value = (
+                        dataclasses.MISSING
+                        if field_loader is None
+                        else field_loader.get_json_value(data)
+                    )
+                    if value is not dataclasses.MISSING:
+                        field_validators.validate_json(value)
+                        continue
+                    value = field_validators.default
+                    if value is _NO_DEFAULT:
+                        continue
+                field_validators.validate(value)
+            except ValidationError as e:
+                # NB: Matches the renaming in `_ModelLoader`
+                json_alias_paths = model_loader.json_alias_paths
+                if e.path and e.path[-1] in json_alias_paths:
+                    e.path[-1] = json_alias_paths[e.path[-1]]
+                raise
+
+
+def _get_model_checker(model_type: type[Model]) -> _ModelChecker:
+    model_checker = model_type.__model_checker__
+    if model_checker is None:
+        model_checker = model_type.__model_checker__ = _ModelChecker(model_type)
+    return model_checker  # type: ignore
+
+
+def check_model(model_type: type[Model], data: Any) -> None:
+    _get_model_checker(model_type)(data)
+
+
+def _iter_type_errors(field_type, data: Any) -> Iterator[ValidationError]:
+    """
+    Yield every JSON type error in `data` (which loading would raise the first of).
+
+    Errors in nested models include their validation errors (since loading fully loads them).
+    """
+    if isinstance(field_type, type) and issubclass(field_type, Model):
+        yield from _iter_model_errors(field_type, data)
+    elif isinstance(field_type, AnnotationType):
+        yield from _iter_type_errors(field_type.__origin__, data)
+    elif isinstance(field_type, GenericAlias) and field_type.__origin__ is list:
+        if type(data) is not list:
+            yield WrongTypeError(list.__name__, data)
+            return
+        (argT,) = field_type.__args__
+        for index, item in enumerate(data):
+            for error in _iter_type_errors(argT, item):
+                error.add_context(index=index)
+                yield error
+    elif isinstance(field_type, GenericAlias) and field_type.__origin__ is dict:
+        if type(data) is not dict:
+            yield WrongTypeError(dict.__name__, data)
+            return
+        keyT, valueT = field_type.__args__
+        check_key = get_checker(keyT)
+        for key, value in data.items():
+            try:
+                check_key(key)
+            except ValidationError as error:
+                yield error
+            for error in _iter_type_errors(valueT, value):
+                error.add_context(key=key)
+                yield error
+    elif isinstance(field_type, (UnionType, GenericUnionType)):
+        for argT in field_type.__args__:
+            if _get_jsontype(argT) is type(data):
+                yield from _iter_type_errors(argT, data)
+                return
+        yield WrongTypeError(field_type, data)
+    else:
+        try:
+            get_checker(field_type)(data)
+        except ValidationError as error:
+            yield error
+
+
+def _iter_validation_errors(field_type, value: Any) -> Iterator[ValidationError]:
+    """
+    Yield every `Annotated` validation error in (the type-correct) `value`.
+
+    Mirrors the validators from `get_validators`, but continues past each error.
+    """
+    if isinstance(field_type, AnnotationType):
+        yield from _iter_validation_errors(field_type.__origin__, value)
+        for annotation in field_type.__metadata__:
+            for validator in _get_annotation_arg_validators(annotation):
+                try:
+                    validator(value)
+                except ValidationError as error:
+                    yield error
+    elif isinstance(field_type, GenericAlias) and field_type.__origin__ is list:
+        (argT,) = field_type.__args__
+        for index, item in enumerate(value):
+            for error in _iter_validation_errors(argT, item):
+                error.add_context(index=index)
+                yield error
+    elif isinstance(field_type, GenericAlias) and field_type.__origin__ is dict:
+        keyT, valueT = field_type.__args__
+        for key in value.keys():
+            for error in _iter_validation_errors(keyT, key):
+                error.qualifier = "key"
+                yield error
+        for key, item in value.items():
+            for error in _iter_validation_errors(valueT, item):
+                error.add_context(key=key)
+                yield error
+    elif isinstance(field_type, (UnionType, GenericUnionType)):
+        for argT in field_type.__args__:
+            if get_origin(argT) is type(value):
+                yield from _iter_validation_errors(argT, value)
+                return
+
+
+def _iter_model_errors(model_type: type[Model], data: Any) -> Iterator[ValidationError]:
+    model_checker = _get_model_checker(model_type)
+    model_loader = model_checker.model_loader
+    if type(data) is not dict:
+        yield WrongTypeError(dict.__name__, data)
+        return
+
+    extra_keys = data.keys() - model_loader.known_keys
+    if extra_keys:
+        try:
+            model_loader._get_extras(data, extra_keys)
+        except ValidationError as error:
+            yield error
+
+    loaded = {}
+    invalid_fields = set()
+    missing_fields = []
+    for field, checker in model_checker.fields:
+        value = field.get_json_value(data)
+        if value is dataclasses.MISSING:
+            if field.required:
+                missing_fields.append(field.name)
+            continue
+
+        if checker is None:
+            try:
+                loaded[field.name] = field.json_loader(field.load(value))  # type: ignore
+            except ValidationError as error:
+                errors: Iterable[ValidationError] = (error,)
+            else:
+                continue
+        else:
+            errors = _iter_type_errors(
+                model_type.__dataclass_fields__[field.name].type, value
+            )
+
+        for error in errors:
+            invalid_fields.add(field.name)
+            error.add_context(attr=field.json_name)
+            yield error
+
+    if missing_fields:
+        yield MissingFieldsError(model_type.__name__, *missing_fields)
+
+    for field_validators in model_checker.field_validators:
+        # NB: Loading would've failed before validating these
+        if field_validators.name in invalid_fields:
+            continue
+
+        field_loader = field_validators.field_loader
+        if field_validators.name in loaded:
+            value = loaded[field_validators.name]
+        else:
+            value = (
+                dataclasses.MISSING
+                if field_loader is None
+                else field_loader.get_json_value(data)
+            )
+            if value is dataclasses.MISSING:
+                value = field_validators.default
+                if value is _NO_DEFAULT:
+                    continue
+            elif field_validators.load is not None:
+                value = field_validators.load(value)
+
+        field_type = model_type.__dataclass_fields__[field_validators.name].type
+        for error in _iter_validation_errors(field_type, value):
+            error.add_context(attr=field_validators.name)
+            # NB: Matches the renaming in `_ModelLoader`
+            json_alias_paths = model_loader.json_alias_paths
+            if error.path[-1] in json_alias_paths:
+                error.path[-1] = json_alias_paths[error.path[-1]]
+            yield error
+
+
+def collect_model_errors(
+    model_type: type[Model], data: Any, *, max_errors: int | None = None
+) -> list[ValidationError]:
+    """
+    Return all of the errors (up to `max_errors`) loading `data` as a `model_type` would have.
+
+    Unlike loading (or checking), this doesn't stop at the first error. The walk stops
+    once `max_errors` have been found.
+    """
+    return list(itertools.islice(_iter_model_errors(model_type, data), max_errors))
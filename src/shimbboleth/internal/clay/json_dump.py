@@ -1,9 +1,18 @@
+from typing import IO, Any, Callable, TypeAlias
+from types import GenericAlias, UnionType
 import dataclasses
+import json
 import uuid
 import re
 
 from shimbboleth.internal.clay.jsonT import JSONArray, JSONObject
 from shimbboleth.internal.clay.model import Model
+from shimbboleth.internal.clay._types import (
+    AnnotationType,
+    GenericUnionType,
+    LiteralType,
+    get_origin,
+)
 from functools import singledispatch
 
 
@@ -35,27 +44,315 @@ def dump_pattern(obj: re.Pattern) -> str:
     return obj.pattern
 
 
-def dump_model(obj: Model) -> JSONObject:
-    ret = {}
-    for field in dataclasses.fields(obj):
-        value = getattr(obj, field.name)
-        if value == field.default or (
-            field.default_factory is not dataclasses.MISSING
-            and value == field.default_factory()
-        ):
-            continue
+Dumper: TypeAlias = Callable[[Any], Any]
 
-        json_dumper = field.metadata.get("json_dumper", None)
-        if json_dumper:
-            dumped_value = json_dumper(value)
+
+def _dump_model_value(obj: Model) -> JSONObject:
+    return obj.model_dump()
+
+
+@singledispatch
+def _make_field_dumper(field_type) -> Dumper | None:
+    """
+    Return the dumper for values of (field) type `field_type`.
+
+    `None` means the value is dumped as-is.
+
+    NB: This is only an optimization (over the dispatching `dump`), so anything unusual
+        uses `dump`.
+    """
+    if field_type in (bool, int, str, None, type(None)):
+        return None
+    if field_type is uuid.UUID:
+        return str
+    if field_type is re.Pattern:
+        return dump_pattern
+    if isinstance(field_type, type) and issubclass(field_type, Model):
+        return _dump_model_value
+    return dump
+
+
+@_make_field_dumper.register
+def _make_literal_field_dumper(field_type: LiteralType) -> Dumper | None:
+    return None
+
+
+@_make_field_dumper.register
+def _make_annotation_field_dumper(field_type: AnnotationType) -> Dumper | None:
+    return _make_field_dumper(field_type.__origin__)
+
+
+@_make_field_dumper.register(UnionType)
+@_make_field_dumper.register(GenericUnionType)
+def _make_union_field_dumper(field_type) -> Dumper | None:
+    if all(_make_field_dumper(argT) is None for argT in field_type.__args__):
+        return None
+    return dump
+
+
+@_make_field_dumper.register
+def _make_generic_alias_field_dumper(field_type: GenericAlias) -> Dumper | None:
+    container_t = field_type.__origin__
+    if container_t is list:
+        item_dumper = _make_field_dumper(field_type.__args__[0])
+        if item_dumper is None:
+            return list
+        return lambda obj: [item_dumper(item) for item in obj]
+    if container_t is dict:
+        value_dumper = _make_field_dumper(field_type.__args__[1])
+        if value_dumper is None:
+            return dict
+        return lambda obj: {key: value_dumper(value) for key, value in obj.items()}
+    return dump
+
+
+Encoder: TypeAlias = Callable[[Any], str]
+
+_encode_str: Encoder = json.encoder.encode_basestring  # type: ignore
+
+
+def _make_json_encoder() -> Encoder:
+    """
+    Return an encoder matching `json.dumps(..., separators=(",", ":"), ensure_ascii=False)`.
+    """
+    encoder = json.JSONEncoder(
+        ensure_ascii=False, separators=(",", ":"), check_circular=False
+    )
+    c_make_encoder = json.encoder.c_make_encoder  # type: ignore
+    if c_make_encoder is None:
+        return encoder.encode
+
+    # NB: `JSONEncoder.encode` makes a new C encoder per-call, which dominates small values
+    c_encoder = c_make_encoder(
+        None, encoder.default, _encode_str, None, ":", ",", False, False, True
+    )
+    return lambda obj: "".join(c_encoder(obj, 0))
+
+
+_encode_json: Encoder = _make_json_encoder()
+
+
+def _encode_model(obj: Model) -> str:
+    if type(obj).model_dump is not Model.model_dump:
+        # NB: Encode what the overridden `model_dump` returns (like `json.dumps` would)
+        return _encode_json(obj.model_dump())
+    return _get_model_dumper(type(obj)).encode(obj)
+
+
+def _encode_any(obj: Any) -> str:
+    return _encode_json(dump(obj))
+
+
+@singledispatch
+def _make_field_encoder(field_type) -> Encoder:
+    """
+    Return the JSON encoder for values of (field) type `field_type`.
+
+    The encoder returns the same JSON as `json.dumps(dump(value))`, but without
+    building the intermediate dumped value.
+
+    NB: This is only an optimization, so anything unusual uses `_encode_any`.
+    """
+    if field_type is str:
+        return _encode_str
+    if field_type is uuid.UUID:
+        return lambda obj: _encode_str(str(obj))
+    if field_type is re.Pattern:
+        return lambda obj: _encode_str(obj.pattern)
+    if isinstance(field_type, type) and issubclass(field_type, Model):
+        return _encode_model
+    if _make_field_dumper(field_type) is None:
+        return _encode_json
+    return _encode_any
+
+
+@_make_field_encoder.register
+def _make_annotation_field_encoder(field_type: AnnotationType) -> Encoder:
+    return _make_field_encoder(field_type.__origin__)
+
+
+@_make_field_encoder.register(LiteralType)
+@_make_field_encoder.register(UnionType)
+@_make_field_encoder.register(GenericUnionType)
+def _make_union_field_encoder(field_type) -> Encoder:
+    if _make_field_dumper(field_type) is None:
+        return _encode_json
+
+    encoders_by_type = {
+        get_origin(argT): _make_field_encoder(argT) for argT in field_type.__args__
+    }
+
+    def encode_union(obj) -> str:
+        encoder = encoders_by_type.get(type(obj), _encode_any)
+        return encoder(obj)
+
+    return encode_union
+
+
+@_make_field_encoder.register
+def _make_generic_alias_field_encoder(field_type: GenericAlias) -> Encoder:
+    container_t = field_type.__origin__
+    if container_t is list:
+        (argT,) = field_type.__args__
+        if _make_field_dumper(argT) is None:
+            return _encode_json
+        encode_item = _make_field_encoder(argT)
+        return lambda obj: "[" + ",".join(map(encode_item, obj)) + "]"
+    if container_t is dict:
+        keyT, valueT = field_type.__args__
+        if _make_field_dumper(valueT) is None:
+            return _encode_json
+        if get_origin(keyT) is not str:
+            return _encode_any
+        encode_value = _make_field_encoder(valueT)
+        return lambda obj: (
+            "{"
+            + ",".join(
+                [
+                    _encode_str(key) + ":" + encode_value(value)
+                    for key, value in obj.items()
+                ]
+            )
+            + "}"
+        )
+    return _encode_any
+
+
+_NO_DEFAULT: Any = object()
+
+
+@dataclasses.dataclass(slots=True, frozen=True)
+class _FieldDumper:
+    name: str
+    key: str
+    default: Any
+    """The field's default value (`_NO_DEFAULT` if none). `default_factory` is called once, up-front."""
+    json_dumper: Dumper | None
+    dump: Dumper | None
+    encode: Encoder
+    encoded_key: str
+    """The JSON-encoded key (and separator), for encoding directly to JSON."""
+
+    @classmethod
+    def from_field(cls, field: dataclasses.Field) -> "_FieldDumper":
+        if field.default is not dataclasses.MISSING:
+            default = field.default
+        elif field.default_factory is not dataclasses.MISSING:
+            default = field.default_factory()
         else:
-            dumped_value = dump(value)
+            default = _NO_DEFAULT
+
+        key = field.metadata.get("json_alias", field.name)
+        json_dumper = field.metadata.get("json_dumper", None)
+        return cls(
+            name=field.name,
+            key=key,
+            default=default,
+            json_dumper=json_dumper,
+            dump=json_dumper or _make_field_dumper(field.type),
+            encode=_make_field_encoder(field.type),
+            encoded_key=_encode_str(key) + ":",
+        )
+
+
+class _ModelDumper:
+    """
+    A `Model` dumper, "compiled" once per model class (on first dump).
+    """
+
+    __slots__ = ("fields", "keys")
+
+    def __init__(self, model_type: type[Model]):
+        self.fields = tuple(
+            _FieldDumper.from_field(field) for field in dataclasses.fields(model_type)
+        )
+        self.keys = frozenset(field.key for field in self.fields)
+
+    def __call__(self, obj: Model) -> JSONObject:
+        ret = {}
+        for field in self.fields:
+            value = getattr(obj, field.name)
+            if value is field.default or value == field.default:
+                continue
+
+            if field.dump is not None:
+                value = field.dump(value)
+            if value is not None:
+                ret[field.key] = value
+
+        extra = obj.__dict__.get("_extra")
+        if extra:
+            ret.update(extra)
+
+        return ret
+
+    def encode_members(self, obj: Model) -> list[str]:
+        """
+        Return the encoded JSON members (`"key":value`) of the dumped `obj`.
+        """
+        members = []
+        for field in self.fields:
+            value = getattr(obj, field.name)
+            if value is field.default or value == field.default:
+                continue
+
+            if field.json_dumper is not None:
+                value = field.json_dumper(value)
+                if value is not None:
+                    members.append(field.encoded_key + _encode_json(value))
+            elif value is not None:
+                members.append(field.encoded_key + field.encode(value))
+
+        extra = obj.__dict__.get("_extra")
+        if extra:
+            if not self.keys.isdisjoint(extra.keys()):
+                # NB: Extras overwrite fields (in-place). Let `dict` handle that.
+                return [_encode_json(self(obj))[1:-1]]
+            members.extend(
+                _encode_str(key) + ":" + _encode_json(value)
+                for key, value in extra.items()
+            )
+
+        return members
+
+    def encode(self, obj: Model) -> str:
+        return "{" + ",".join(self.encode_members(obj)) + "}"
+
+
+def _get_model_dumper(model_type: type[Model]) -> _ModelDumper:
+    model_dumper = model_type.__model_dumper__
+    if model_dumper is None:
+        model_dumper = model_type.__model_dumper__ = _ModelDumper(model_type)
+    return model_dumper  # type: ignore
+
+
+def dump_model(obj: Model) -> JSONObject:
+    return _get_model_dumper(type(obj))(obj)
+
+
+def dump_model_json(obj: Model) -> bytes:
+    """
+    Dump `obj` directly to (compact, UTF-8 encoded) JSON.
+
+    Equivalent to `json.dumps(obj.model_dump(), separators=(",", ":"), ensure_ascii=False)`,
+    without building the intermediate dumped value (unless `model_dump` is overridden).
+    """
+    return _encode_model(obj).encode("utf-8")
+
 
-        if dumped_value is not None:
-            key = field.metadata.get("json_alias", field.name)
-            ret[key] = dumped_value
+def dump_model_to(obj: Model, fp: IO[bytes]) -> None:
+    """
+    Write `obj` as JSON (see `dump_model_json`) to the binary file-like `fp`.
 
-    if hasattr(obj, "_extra") and obj._extra:
-        ret.update(obj._extra)
+    Top-level members are written as they are encoded.
+    """
+    if type(obj).model_dump is not Model.model_dump:
+        fp.write(_encode_model(obj).encode("utf-8"))
+        return
 
-    return ret
+    fp.write(b"{")
+    for index, member in enumerate(_get_model_dumper(type(obj)).encode_members(obj)):
+        if index:
+            fp.write(b",")
+        fp.write(member.encode("utf-8"))
+    fp.write(b"}")
@@ -1,12 +1,23 @@
-from contextlib import contextmanager
 from functools import singledispatch
-from typing import TYPE_CHECKING, Any, TypeVar
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    TypeVar,
+    Callable,
+    TypeAlias,
+    Iterable,
+    Iterator,
+    Sequence,
+)
 from types import UnionType, GenericAlias
 import re
-import copy
 import uuid
+import concurrent.futures
 import dataclasses
+import functools
+import inspect
 import logging
+import os
 
 from shimbboleth.internal.utils import is_shimbboleth_pytesting
 from shimbboleth.internal.clay.jsonT import JSONObject
@@ -16,8 +27,17 @@ from shimbboleth.internal.clay._types import (
     LiteralType,
     GenericUnionType,
     get_origin,
+    memoized,
+)
+from shimbboleth.internal.clay.validation import (
+    ValidationError,
+    ValidationErrors,
+    Validator,
+)
+from shimbboleth.internal.clay._validators import (
+    LazyValidationDescriptor,
+    ValidationDescriptor,
 )
-from shimbboleth.internal.clay.validation import ValidationError
 
 T = TypeVar("T")
 ModelT = TypeVar("ModelT", bound=Model)
@@ -69,37 +89,57 @@ def _ensure_is(data, expected: type[T]) -> T:
     return data
 
 
-@singledispatch
+Loader: TypeAlias = Callable[[Any], Any]
+
+_LOADERS: dict[Any, Loader] = {}
+
+
+def get_loader(field_type) -> Loader:
+    """
+    Return the loader for `field_type`, a callable taking the JSON data.
+
+    Loaders are specialized (and memoized) per annotation, so that loading
+    a value doesn't need to re-dispatch on its annotation (recursively).
+    """
+    return memoized(_LOADERS, make_loader, field_type)
+
+
 def load(field_type, *, data):  # type: ignore
+    return get_loader(field_type)(data)
+
+
+@singledispatch
+def make_loader(field_type) -> Loader:
     if field_type is bool:
-        return load_bool(data)
+        return load_bool
     if field_type is int:
-        return load_int(data)
+        return load_int
     if field_type is str:
-        return load_str(data)
+        return load_str
     # NB: type[None] from unions (e.g. `str | None`)
     if field_type is None or field_type is type(None):
-        return load_none(data)
+        return load_none
     if field_type is re.Pattern:
-        return load_pattern(data)
+        return load_pattern
     if field_type is uuid.UUID:
-        return load_uuid(data)
+        return load_uuid
     if field_type is Any:
-        return data
+        return load_any
     # NB: Dispatched manually, so we can avoid ciruclar definition with `Model.model_load`
-    if issubclass(field_type, Model):
-        return field_type.model_load(data)
+    if isinstance(field_type, type) and issubclass(field_type, Model):
+        return field_type.model_load
 
-    raise WrongTypeError(field_type, data)
+    return functools.partial(_load_unsupported, field_type)
 
 
-@load.register
-def load_generic_alias(field_type: GenericAlias, *, data: Any):
+@make_loader.register
+def make_generic_alias_loader(field_type: GenericAlias) -> Loader:
     container_t = field_type.__origin__
     if container_t is list:
-        return load_list(data, field_type=field_type)
+        return _make_list_loader(field_type)
     if container_t is dict:
-        return load_dict(data, field_type=field_type)
+        return _make_dict_loader(field_type)
+    return functools.partial(_load_unsupported, field_type)
 
 
 def _get_jsontype(field_type) -> type:
@@ -120,49 +160,68 @@ def _get_jsontype(field_type) -> type:
     return rawtype
 
 
-@load.register
-def load_union_type(field_type: UnionType, *, data: Any):
+@make_loader.register(UnionType)
+@make_loader.register(GenericUnionType)
+def make_union_type_loader(field_type) -> Loader:
+    argTs = field_type.__args__
+    jsontypes = [_get_jsontype(argT) for argT in argTs]
+
     # NB: This is safe, since we check for overlapping types in
     #  `src/shimbboleth/internal/clay/_validators.py` in `get_union_type_validators`.
     # (not true, JSON loaders)
-
     if is_shimbboleth_pytesting():
-        jsontypes = {_get_jsontype(argT) for argT in field_type.__args__}
-        assert len(field_type.__args__) == len(jsontypes), (
-            f"Overlapping outer types in Union is unsupported: Input: `{field_type.__args__}`. Result: `{jsontypes}`."
+        assert len(argTs) == len(set(jsontypes)), (
+            f"Overlapping outer types in Union is unsupported: Input: `{argTs}`. Result: `{set(jsontypes)}`."
         )
 
-    for argT in field_type.__args__:
-        expected_type = _get_jsontype(argT)
-        # NB: Have to use `is` instead of `isinstance` because `bool` inherits from `int`
-        if type(data) is expected_type:
-            return load(argT, data=data)
+    loaders_by_jsontype: dict[type, Loader] = {}
+    for jsontype, argT in zip(jsontypes, argTs):
+        # NB: First matching arm wins
+        if jsontype not in loaders_by_jsontype:
+            loaders_by_jsontype[jsontype] = get_loader(argT)
 
-    raise WrongTypeError(field_type, data)
+    def load_union_type(data: Any):
+        # NB: Have to use `type(...)` instead of `isinstance` because `bool` inherits from `int`
+        try:
+            loader = loaders_by_jsontype[type(data)]
+        except KeyError:
+            raise WrongTypeError(field_type, data) from None
+        return loader(data)
 
+    return load_union_type
 
-@load.register
-def _load_generic_union_type(field_type: GenericUnionType, *, data: Any):
-    return load_union_type(field_type, data=data)
 
+@make_loader.register
+def make_literal_loader(field_type: LiteralType) -> Loader:
+    # NB: Keyed by exact type, so bool/int aren't conflated (since `bool` inherits from `int`)
+    args = field_type.__args__
+    possibilities_by_type = {
+        argtype: frozenset(arg for arg in args if type(arg) is argtype)
+        for argtype in {type(arg) for arg in args}
+    }
 
-@load.register
-def load_literal(field_type: LiteralType, *, data: Any):
-    for possibility in field_type.__args__:
-        # NB: compare bool/int by identity (since `bool` inherits from `int`)
-        if data is possibility:
+    def load_literal(data: Any):
+        possibilities = possibilities_by_type.get(type(data))
+        if possibilities is not None and data in possibilities:
             return data
-        if isinstance(possibility, str) and isinstance(data, str):
-            if data == possibility:
-                return data
 
+        raise WrongTypeError(field_type, data)
+
+    return load_literal
+
+
+@make_loader.register
+def make_annotation_loader(field_type: AnnotationType) -> Loader:
+    # NB: Annotations are validated Python-side (on model construction)
+    return get_loader(field_type.__origin__)
+
+
+def _load_unsupported(field_type, data: Any):
     raise WrongTypeError(field_type, data)
 
 
-@load.register
-def load_annotation(field_type: AnnotationType, *, data: Any):
-    baseType = field_type.__origin__
-    return load(baseType, data=data)
+def load_any(data: Any) -> Any:
+    return data
 
 
 def load_bool(data: Any) -> bool:
@@ -181,25 +240,71 @@ def load_none(data: Any) -> None:
     return _ensure_is(data, type(None))
 
 
-def load_list(data: Any, *, field_type: GenericAlias) -> list:
-    data = _ensure_is(data, list)
+# NB: Loaders which return the data as-is (if it is of the given type).
+#   Containers of these can be checked and shallow-copied without a call per item.
+_PASSTHROUGH_LOADERS: dict[Loader, type | None] = {
+    load_bool: bool,
+    load_str: str,
+    load_int: int,
+    load_any: None,
+}
+
+
+def _make_list_loader(field_type: GenericAlias) -> Loader:
     (argT,) = field_type.__args__
-    ret = []
-    for index, item in enumerate(data):
-        with ValidationError.context(index=index):
-            ret.append(load(argT, data=item))
-    return ret
+    load_item = get_loader(argT)
+    passthrough_type = _PASSTHROUGH_LOADERS.get(load_item, ...)
+
+    def load_list(data: Any) -> list:
+        data = _ensure_is(data, list)
+        if passthrough_type is not ...:
+            if passthrough_type is None or all(
+                type(item) is passthrough_type for item in data
+            ):
+                return data.copy()
+
+        ret = []
+        # NB: The path is only added on failure (instead of a context manager per item)
+        index = 0
+        try:
+            for index, item in enumerate(data):
+                ret.append(load_item(item))
+        except ValidationError as e:
+            e.add_context(index=index)
+            raise
+        return ret
+
+    return load_list
 
 
-def load_dict(data: Any, *, field_type: GenericAlias) -> dict:
-    data = _ensure_is(data, dict)
+def _make_dict_loader(field_type: GenericAlias) -> Loader:
     keyT, valueT = field_type.__args__
-    ret = {}
-    for key, value in data.items():
-        loaded_key = load(keyT, data=key)
-        with ValidationError.context(key=key):
-            ret[loaded_key] = load(valueT, data=value)
-    return ret
+    load_key = get_loader(keyT)
+    load_value = get_loader(valueT)
+    passthrough_type = (
+        _PASSTHROUGH_LOADERS.get(load_value, ...) if load_key is load_str else ...
+    )
+
+    def load_dict(data: Any) -> dict:
+        data = _ensure_is(data, dict)
+        if passthrough_type is not ...:
+            if all(type(key) is str for key in data) and (
+                passthrough_type is None
+                or all(type(value) is passthrough_type for value in data.values())
+            ):
+                return data.copy()
+
+        ret = {}
+        for key, value in data.items():
+            loaded_key = load_key(key)
+            try:
+                ret[loaded_key] = load_value(value)
+            except ValidationError as e:
+                e.add_context(key=key)
+                raise
+        return ret
+
+    return load_dict
 
 
 def load_pattern(data: Any) -> re.Pattern:
@@ -218,108 +323,455 @@ def load_uuid(data: Any) -> uuid.UUID:
         raise NotAValidUUIDError(data)
 
 
-class _LoadModelHelper:
-    @staticmethod
-    def handle_field_aliases(model_type: type[Model], data: JSONObject) -> dict:
-        data_copy = data
-        for field_alias_name, field_alias in model_type.__field_aliases__.items():
-            if field_alias_name in data:
-                if data_copy is data:
-                    data_copy = copy.copy(data)
-
-                value = data_copy.pop(field_alias_name)
-                if (
-                    field_alias.json_mode == "prepend"
-                    or data.get(field_alias.alias_of) is None
-                ):
-                    data_copy[field_alias.alias_of] = value
-
-        return data_copy
-
-    @staticmethod
-    def rename_json_aliases(model_type: type[Model], data: JSONObject):
-        for field in dataclasses.fields(model_type):
-            if not field.init:
-                continue
-            json_alias = field.metadata.get("json_alias")
-            if json_alias and json_alias in data:
-                data[field.name] = data.pop(json_alias)
-
-    @staticmethod
-    def get_extras(model_type: type[Model], data: JSONObject) -> JSONObject:
-        extras = {}
-        for data_key in frozenset(data.keys()):
-            if data_key not in model_type.__json_fieldnames__:
-                extras[data_key] = data.pop(data_key)
-
-        if extras and not model_type.__allow_extra_properties__:
-            raise ExtrasNotAllowedError(model_type, extras)
-
-        return extras
-
-    @staticmethod
-    def load_field(field: dataclasses.Field, data: JSONObject):
+@dataclasses.dataclass(slots=True, frozen=True)
+class _FieldLoader:
+    name: str
+    json_name: str
+    required: bool
+    load: Loader
+    json_loader: Callable[[Any], Any] | None
+    aliases: tuple[tuple[str, bool], ...]
+    """The field's aliases (in order), as `(alias name, is "prepend" mode)`."""
+
+    @classmethod
+    def from_field(
+        cls, field: dataclasses.Field, *, aliases: tuple[tuple[str, bool], ...]
+    ) -> "_FieldLoader":
         json_loader = field.metadata.get("json_loader", None)
         expected_type: Any = (
             json_loader.__annotations__["value"] if json_loader else field.type
         )
+        return cls(
+            name=field.name,
+            json_name=field.metadata.get("json_alias", field.name),
+            required=(
+                field.default is dataclasses.MISSING
+                and field.default_factory is dataclasses.MISSING
+            ),
+            load=get_loader(expected_type),
+            json_loader=json_loader,
+            aliases=aliases,
+        )
 
-        with ValidationError.context(attr=field.metadata.get("json_alias", field.name)):
-            value = load(expected_type, data=data[field.name])
-            if json_loader:
-                value = json_loader(value)
-
+    def get_json_value(self, data: JSONObject) -> Any:
+        value = data.get(self.json_name, dataclasses.MISSING)
+        if self.aliases:
+            # NB: "append" aliases only apply if the field's own value is missing/None
+            overridable = value is dataclasses.MISSING or value is None
+            for alias_name, prepend in self.aliases:
+                if alias_name in data and (prepend or overridable):
+                    value = data[alias_name]
         return value
 
-    @staticmethod
-    def check_required_fields(model_type: type[Model], data: JSONObject):
-        missing_fields = [
-            field.name
-            for field in dataclasses.fields(model_type)
-            if field.init
-            and field.name not in data
-            and field.default is dataclasses.MISSING
-            and field.default_factory is dataclasses.MISSING
-        ]
+
+_FieldSetter: TypeAlias = tuple[
+    str,
+    Callable[[Any, Any], None],
+    Validator | None,
+    Any,
+    Callable[[], Any] | None,
+]
+"""
+A field's `(name, slot setter, validator, default, default factory)`.
+
+The setter bypasses the field's `ValidationDescriptor` (if any).
+"""
+
+
+def _get_field_setters(model_type: type[Model]) -> tuple[_FieldSetter, ...] | None:
+    """
+    Return the setters to construct a `model_type` with (instead of its `__init__`).
+
+    Returns `None` if the model can't be constructed that way (e.g. it has a hand-written
+    `__init__` or `__setattr__`, which must see every load).
+    """
+    if (
+        model_type.__init__ is not model_type.__model_generated_init__
+        or model_type.__setattr__ is not object.__setattr__
+    ):
+        return None
+
+    for field in model_type.__dataclass_fields__.values():
+        if field.type is dataclasses.InitVar or isinstance(
+            field.type, dataclasses.InitVar
+        ):
+            return None
+
+    setters = []
+    for field in dataclasses.fields(model_type):
+        descriptor = inspect.getattr_static(model_type, field.name)
+        if isinstance(descriptor, LazyValidationDescriptor):
+            descriptor = descriptor.resolve()
+        validator = None
+        if isinstance(descriptor, ValidationDescriptor):
+            # NB: Defaults are validated once, here (assuming factories are deterministic).
+            #   If one is invalid, just use `__init__` (so the error is raised on each load).
+            try:
+                if field.default is not dataclasses.MISSING:
+                    descriptor.validate(field.default)
+                elif field.default_factory is not dataclasses.MISSING:
+                    descriptor.validate(field.default_factory())
+            except ValidationError:
+                return None
+            validator = descriptor.validator
+            descriptor = descriptor.field_descriptor
+        setters.append(
+            (
+                field.name,
+                descriptor.__set__,
+                validator,
+                field.default,
+                None
+                if field.default_factory is dataclasses.MISSING
+                else field.default_factory,
+            )
+        )
+    return tuple(setters)
+
+
+class _ModelLoader:
+    """
+    A `Model` loader, "compiled" once per model class (on first load).
+
+    All of the per-field decisions (field aliases, `json_alias` renames,
+    loaders, required fields) are resolved up-front, so loading is straight-line code.
+
+    The input data is only ever read (never copied or mutated).
+    """
+
+    __slots__ = (
+        "model_type",
+        "fields",
+        "field_setters",
+        "post_init",
+        "known_keys",
+        "json_alias_paths",
+    )
+
+    def __init__(self, model_type: type[Model]):
+        self.model_type = model_type
+
+        field_aliases = model_type.__field_aliases__
+        aliases_by_fieldname: dict[str, list[tuple[str, bool]]] = {}
+        for name, field_alias in field_aliases.items():
+            # NB: Aliases can be aliases of aliases
+            alias_of = field_alias.alias_of
+            for _ in range(len(field_aliases)):
+                if alias_of not in field_aliases:
+                    break
+                alias_of = field_aliases[alias_of].alias_of
+            aliases_by_fieldname.setdefault(alias_of, []).append(
+                (name, field_alias.json_mode == "prepend")
+            )
+
+        fields = [field for field in dataclasses.fields(model_type) if field.init]
+        self.fields = tuple(
+            _FieldLoader.from_field(
+                field, aliases=tuple(aliases_by_fieldname.get(field.name, ()))
+            )
+            for field in fields
+        )
+        self.field_setters = _get_field_setters(model_type)
+        self.post_init = getattr(model_type, "__post_init__", None)
+        self.known_keys = model_type.__json_fieldnames__ | field_aliases.keys()
+        self.json_alias_paths = {
+            f".{field.name}": f".{field.metadata['json_alias']}"
+            for field in fields
+            if field.metadata.get("json_alias")
+        }
+
+    def __call__(self, data: Any) -> Model:
+        model_type = self.model_type
+        _ensure_is(data, dict)
+
+        extra_keys = data.keys() - self.known_keys
+        extras = self._get_extras(data, extra_keys) if extra_keys else {}
+
+        init_kwargs = {}
+        missing_fields = []
+        for field in self.fields:
+            value = field.get_json_value(data)
+            if value is dataclasses.MISSING:
+                if field.required:
+                    missing_fields.append(field.name)
+                continue
+
+            try:
+                value = field.load(value)
+                if field.json_loader:
+                    value = field.json_loader(value)
+            except ValidationError as e:
+                e.add_context(attr=field.json_name)
+                raise
+            init_kwargs[field.name] = value
+
         if missing_fields:
             raise MissingFieldsError(model_type.__name__, *missing_fields)
 
-    @contextmanager
-    @staticmethod
-    def rename_field_alias_in_path(model_type: type[Model]):
         try:
-            yield
+            if self.field_setters is None:
+                instance = model_type(**init_kwargs)
+            else:
+                instance = self._construct(init_kwargs)
         except ValidationError as e:
-            if not e.path or not e.path[-1].startswith("."):
-                raise
+            if e.path and e.path[-1] in self.json_alias_paths:
+                e.path[-1] = self.json_alias_paths[e.path[-1]]
+            raise
 
-            field = model_type.__dataclass_fields__.get(e.path[-1][1:])
-            if field is not None:
-                json_alias = field.metadata.get("json_alias")
-                if json_alias:
-                    e.path[-1] = "." + json_alias
+        instance._extra = extras
+        return instance
+
+    def _construct(
+        self, init_kwargs: dict[str, Any], deferred: dict[str, Any] | None = None
+    ) -> Model:
+        """
+        Equivalent to `model_type(**init_kwargs)`, but in one pass over the fields.
+
+        Each value is validated then set directly on the slot, instead of one
+        `ValidationDescriptor.__set__` (and error context) per field.
+        Defaults aren't re-validated, they were validated when compiling.
+
+        :param deferred: Fields to leave unset (see `load_deferred`).
+        """
+        model_type = self.model_type
+        instance = model_type.__new__(model_type)
+        field_setters: tuple[_FieldSetter, ...] = self.field_setters  # type: ignore
+        name = ""
+        try:
+            for name, set_value, validator, default, factory in field_setters:
+                if deferred and name in deferred:
+                    deferred[name] = (deferred[name], set_value)
+                    continue
+                if name in init_kwargs:
+                    value = init_kwargs[name]
+                    if validator is not None:
+                        validator(value)
+                elif factory is not None:
+                    set_value(instance, factory())
+                    continue
+                elif default is not dataclasses.MISSING:
+                    value = default
+                else:
+                    continue
+                set_value(instance, value)
+        except ValidationError as e:
+            e.add_context(attr=name)
             raise
 
+        if self.post_init is not None:
+            self.post_init(instance)
+        return instance
+
+    def load_deferred(self, data: Any) -> Model:
+        """
+        Like loading `data`, but nested models and containers (`list`/`dict` values) are only
+        loaded on first access of their field.
+
+        All of `data` is still checked up front (raising what loading would).
+        The deferred values are held (not copied) until they're loaded, so `data` shouldn't be
+        mutated in the meantime.
+        """
+        from shimbboleth.internal.clay.json_check import check_model
+
+        # NB: Fields need to be left unset, so it's `_construct` or nothing.
+        #   (And `__post_init__` would see the unset fields)
+        if self.field_setters is None or self.post_init is not None:
+            return self(data)
+
+        check_model(self.model_type, data)
+
+        extra_keys = data.keys() - self.known_keys
+        extras = self._get_extras(data, extra_keys) if extra_keys else {}
+
+        init_kwargs = {}
+        deferred = {}
+        for field in self.fields:
+            value = field.get_json_value(data)
+            if value is dataclasses.MISSING:
+                continue
+            if field.json_loader is None and type(value) in (list, dict):
+                deferred[field.name] = (field.load, value)
+                continue
+
+            value = field.load(value)
+            if field.json_loader:
+                value = field.json_loader(value)
+            init_kwargs[field.name] = value
+
+        instance = self._construct(init_kwargs, deferred)
+        instance._extra = extras
+        if deferred:
+            self.model_type._enable_deferred_fields_()
+            # NB: `(load, value, set_value)`, loaded by `_getattr_deferred`
+            instance.__dict__["_deferred_fields_"] = {
+                name: (load, value, set_value)
+                for name, ((load, value), set_value) in deferred.items()
+            }
+        return instance
+
+    def _get_extras(self, data: JSONObject, extra_keys: set) -> JSONObject:
+        extras = {}
+        # NB: Iterate `data` (not `extra_keys`), to preserve the input order.
+        for key, value in data.items():
+            if key in extra_keys:
+                # NB: Field names are strings, so any non-string key is an extra.
+                _ensure_is(key, str)
+                extras[key] = value
+
+        if not self.model_type.__allow_extra_properties__:
+            raise ExtrasNotAllowedError(self.model_type, extras)
+
+        return extras
+
+
+def _get_model_loader(model_type: type[Model]) -> _ModelLoader:
+    model_loader = model_type.__model_loader__
+    if model_loader is None:
+        model_loader = model_type.__model_loader__ = _ModelLoader(model_type)
+    return model_loader  # type: ignore
+
 
 def load_model(model_type: type[ModelT], data: JSONObject) -> ModelT:
-    data = load(JSONObject, data=data)
-    data = _LoadModelHelper.handle_field_aliases(model_type, data)
+    return _get_model_loader(model_type)(data)  # type: ignore
 
-    extras = _LoadModelHelper.get_extras(model_type, data)
-    _LoadModelHelper.rename_json_aliases(model_type, data)
 
-    init_kwargs = {
-        field.name: _LoadModelHelper.load_field(field, data)
-        for field in dataclasses.fields(model_type)
-        if field.name in data
-    }
-    _LoadModelHelper.check_required_fields(model_type, init_kwargs)
+def load_model_deferred(model_type: type[ModelT], data: JSONObject) -> ModelT:
+    return _get_model_loader(model_type).load_deferred(data)  # type: ignore
+
+
+def load_models(
+    model_type: type[ModelT],
+    values: Iterable[JSONObject],
+    *,
+    collect_errors: bool = False,
+    start: int = 0,
+) -> Iterator[ModelT]:
+    """
+    Load each of `values` as a `model_type`, lazily.
 
-    with _LoadModelHelper.rename_field_alias_in_path(model_type):
-        instance = model_type(**init_kwargs)
+    Errors are raised with the item's index in their path. If `collect_errors`,
+    invalid items are skipped and all their errors are raised (as `ValidationErrors`)
+    once `values` is exhausted.
 
-    instance._extra = extras
-    return instance
+    :param start: The index of the first item (for error paths), if `values` is a slice.
+    """
+    model_loader = _get_model_loader(model_type)
+    errors = []
+    for index, value in enumerate(values, start):
+        try:
+            model = model_loader(value)
+        except ValidationError as e:
+            e.add_context(index=index)
+            if not collect_errors:
+                raise
+            errors.append(e)
+        else:
+            yield model  # type: ignore
+
+    if errors:
+        raise ValidationErrors(errors)
+
+
+def _load_models_chunk(
+    model_type: type[ModelT],
+    values: Sequence[JSONObject],
+    start: int,
+    collect_errors: bool,
+) -> tuple[list[ModelT], list[ValidationError]]:
+    models = []
+    try:
+        for model in load_models(
+            model_type, values, collect_errors=collect_errors, start=start
+        ):
+            models.append(model)
+    except ValidationErrors as e:
+        return models, e.errors
+    except ValidationError as e:
+        return models, [e]
+    return models, []
+
+
+_MIN_PROCESS_POOL_VALUES = 5_000
+"""
+Below this many values, `load_models_in_processes` loads in this process (when it would create the
+pool). Starting a pool costs about as much as loading a couple thousand (small) models.
+"""
+
+
+def load_models_in_processes(
+    model_type: type[ModelT],
+    values: Sequence[JSONObject],
+    *,
+    collect_errors: bool = False,
+    max_workers: int | None = None,
+    chunk_size: int | None = None,
+    executor: concurrent.futures.Executor | None = None,
+) -> list[ModelT]:
+    """
+    Load each of `values` as a `model_type`, spreading the work across a process pool.
+
+    The models are pickled back to this process (which doesn't re-run validators). Therefore
+    `model_type` must be importable (e.g. not defined in a function).
+
+    Errors are raised like `load_models` (with the item's index in `values` in their path).
+
+    If it would create the pool, but there's only one worker or fewer than `_MIN_PROCESS_POOL_VALUES`
+    values, the values are loaded in this process instead (the pool can't help).
+
+    :param max_workers: The number of worker processes (defaults to the number of CPUs).
+    :param chunk_size: How many values to send to a worker at a time. By default, each worker
+        gets ~4 chunks.
+    :param executor: The (process pool) executor to use. Otherwise, a pool is created (and shutdown).
+    """
+    if not values:
+        return []
+
+    workers = max_workers or os.cpu_count() or 1
+    if executor is None:
+        if workers == 1 or len(values) < _MIN_PROCESS_POOL_VALUES:
+            return list(load_models(model_type, values, collect_errors=collect_errors))
+
+        with concurrent.futures.ProcessPoolExecutor(workers) as pool:
+            return load_models_in_processes(
+                model_type,
+                values,
+                collect_errors=collect_errors,
+                max_workers=workers,
+                chunk_size=chunk_size,
+                executor=pool,
+            )
+
+    if chunk_size is None:
+        chunk_size = -(-len(values) // (workers * 4))
+
+    futures = [
+        executor.submit(
+            _load_models_chunk,
+            model_type,
+            values[start : start + chunk_size],
+            start,
+            collect_errors,
+        )
+        for start in range(0, len(values), chunk_size)
+    ]
+
+    models = []
+    errors = []
+    try:
+        # NB: In order, so the first error raised is the first (by index) invalid item
+        for future in futures:
+            chunk_models, chunk_errors = future.result()
+            if chunk_errors and not collect_errors:
+                raise chunk_errors[0]
+            models.extend(chunk_models)
+            errors.extend(chunk_errors)
+    finally:
+        for future in futures:
+            future.cancel()
+
+    if errors:
+        raise ValidationErrors(errors)
+    return models
 
 
 if TYPE_CHECKING:
@@ -0,0 +1,431 @@
+"""
+Compiles the JSON schemas produced by `json_schema.py` into specialized validator functions.
+
+This is much faster than validating with a generic JSON Schema library, because each keyword is
+compiled (once) into a closure, and `oneOf` unions of distinct JSON types dispatch on the value's
+type instead of trying each branch.
+
+NB: Only the constructs `json_schema.py` emits are supported (not the whole JSON Schema spec).
+    Anything else raises `NotImplementedError` when compiling (not when validating).
+"""
+
+from typing import Any, Callable, TypeAlias
+import re
+
+from shimbboleth.internal.clay.jsonT import JSONObject
+from shimbboleth.internal.clay.model import Model
+from shimbboleth.internal.clay.validation import ValidationError
+
+SchemaValidator: TypeAlias = Callable[[Any], None]
+
+_JSON_TYPES: dict[str, Callable[[Any], bool]] = {
+    "null": lambda value: value is None,
+    "boolean": lambda value: value is True or value is False,
+    "integer": lambda value: (
+        (isinstance(value, int) and not isinstance(value, bool))
+        or (isinstance(value, float) and value.is_integer())
+    ),
+    "number": lambda value: (
+        isinstance(value, (int, float)) and not isinstance(value, bool)
+    ),
+    "string": lambda value: isinstance(value, str),
+    "array": lambda value: isinstance(value, list),
+    "object": lambda value: isinstance(value, dict),
+}
+
+_PYTHON_TYPES: dict[str, tuple[type, ...]] = {
+    "null": (type(None),),
+    "boolean": (bool,),
+    "integer": (int,),
+    "number": (int, float),
+    "string": (str,),
+    "array": (list,),
+    "object": (dict,),
+}
+
+# NB: Keywords which don't affect validation
+_ANNOTATION_KEYWORDS = frozenset(
+    {"default", "format", "title", "description", "examples", "$defs"}
+)
+
+
+def _accept(value) -> None:
+    pass
+
+
+def _reject(value) -> None:
+    raise ValidationError(value, expectation="not be provided")
+
+
+def _is_number(value) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _json_equal(left, right) -> bool:
+    # NB: Unlike Python, JSON doesn't consider `true` and `1` equal
+    if isinstance(left, bool) or isinstance(right, bool):
+        return type(left) is type(right) and left == right
+    return left == right
+
+
+def _all_of(validators: list[SchemaValidator]) -> SchemaValidator:
+    if not validators:
+        return _accept
+    if len(validators) == 1:
+        return validators[0]
+
+    validators_tuple = tuple(validators)
+
+    def validate_all(value) -> None:
+        for validator in validators_tuple:
+            validator(value)
+
+    return validate_all
+
+
+def _type_validator(json_type: str | list[str]) -> SchemaValidator:
+    json_types = [json_type] if isinstance(json_type, str) else json_type
+    predicates = tuple(_JSON_TYPES[name] for name in json_types)
+    expectation = f"be of JSON type `{' | '.join(json_types)}`"
+
+    if len(json_types) == 1 and json_types[0] in ("string", "array", "object"):
+        (python_type,) = _PYTHON_TYPES[json_types[0]]
+
+        def validate_instance(value) -> None:
+            if not isinstance(value, python_type):
+                raise ValidationError(value, expectation=expectation)
+
+        return validate_instance
+
+    def validate_type(value) -> None:
+        for predicate in predicates:
+            if predicate(value):
+                return
+        raise ValidationError(value, expectation=expectation)
+
+    return validate_type
+
+
+def _enum_validator(options: list) -> SchemaValidator:
+    expectation = f"be one of {options!r}"
+
+    if all(type(option) is str for option in options):
+        options_set = frozenset(options)
+
+        def validate_str_enum(value) -> None:
+            if type(value) is not str or value not in options_set:
+                raise ValidationError(value, expectation=expectation)
+
+        return validate_str_enum
+
+    def validate_enum(value) -> None:
+        for option in options:
+            if _json_equal(value, option):
+                return
+        raise ValidationError(value, expectation=expectation)
+
+    return validate_enum
+
+
+def _length_validator(
+    keyword: str, bound: int, applies_to: type, *, is_max: bool
+) -> SchemaValidator:
+    expectation = f"satisfy `{keyword}: {bound}`"
+
+    def validate_length(value) -> None:
+        if isinstance(value, applies_to) and (
+            len(value) > bound if is_max else len(value) < bound
+        ):
+            raise ValidationError(value, expectation=expectation)
+
+    return validate_length
+
+
+def _bound_validator(keyword: str, bound: float) -> SchemaValidator:
+    expectation = f"be {'>=' if keyword == 'minimum' else '<='} {bound}"
+    is_minimum = keyword == "minimum"
+
+    def validate_bound(value) -> None:
+        if _is_number(value) and (value < bound if is_minimum else value > bound):
+            raise ValidationError(value, expectation=expectation)
+
+    return validate_bound
+
+
+def _pattern_validator(pattern: str) -> SchemaValidator:
+    # NB: JSON Schema patterns aren't anchored (hence `search`)
+    search = re.compile(pattern).search
+    expectation = f"match regex `{pattern}`"
+
+    def validate_pattern(value) -> None:
+        if isinstance(value, str) and search(value) is None:
+            raise ValidationError(value, expectation=expectation)
+
+    return validate_pattern
+
+
+def _not_validator(validator: SchemaValidator, schema: JSONObject) -> SchemaValidator:
+    expectation = f"not match schema `{schema}`"
+
+    def validate_not(value) -> None:
+        try:
+            validator(value)
+        except ValidationError:
+            return
+        raise ValidationError(value, expectation=expectation)
+
+    return validate_not
+
+
+def _items_validator(item_validator: SchemaValidator) -> SchemaValidator:
+    def validate_items(value) -> None:
+        if not isinstance(value, list):
+            return
+        index = 0
+        try:
+            for index, item in enumerate(value):
+                item_validator(item)
+        except ValidationError as e:
+            e.add_context(index=index)
+            raise
+
+    return validate_items
+
+
+def _object_validator(
+    properties: dict[str, SchemaValidator],
+    required: tuple[str, ...],
+    additional: SchemaValidator | bool,
+    property_names: SchemaValidator | None,
+) -> SchemaValidator:
+    def validate_object(value) -> None:
+        if not isinstance(value, dict):
+            return
+
+        for name in required:
+            if name not in value:
+                raise ValidationError(
+                    name, expectation="be provided", qualifier="required property"
+                )
+
+        for key, item in value.items():
+            if property_names is not None:
+                try:
+                    property_names(key)
+                except ValidationError as e:
+                    e.add_context(key=key)
+                    raise
+
+            property_validator = properties.get(key)
+            if property_validator is not None:
+                try:
+                    property_validator(item)
+                except ValidationError as e:
+                    e.add_context(attr=key)
+                    raise
+            elif additional is False:
+                raise ValidationError(
+                    key, expectation="not be provided", qualifier="extra property"
+                )
+            elif additional is not True:
+                try:
+                    additional(item)
+                except ValidationError as e:
+                    e.add_context(key=key)
+                    raise
+
+    return validate_object
+
+
+def _one_of_validator(
+    branches: list[SchemaValidator], branch_types: list[str | None]
+) -> SchemaValidator:
+    expectation = "match exactly one of the `oneOf` schemas"
+
+    # NB: `json_schema.py` unions are of distinct JSON types, so (usually) the value's type tells
+    #   us the only branch which could match. Otherwise (or for floats, which might be integers)
+    #   every branch is tried.
+    by_python_type: dict[type, SchemaValidator] = {}
+    if (
+        None not in branch_types
+        and len(set(branch_types)) == len(branch_types)
+        and not {"integer", "number"} <= set(branch_types)
+    ):
+        for branch_type, branch in zip(branch_types, branches):
+            for python_type in _PYTHON_TYPES[branch_type]:  # type: ignore
+                by_python_type[python_type] = branch
+        if "integer" in branch_types:
+            by_python_type.pop(float, None)
+
+    def validate_one_of(value) -> None:
+        branch = by_python_type.get(type(value))
+        if branch is not None:
+            branch(value)
+            return
+
+        matches = 0
+        for branch in branches:
+            try:
+                branch(value)
+            except ValidationError:
+                continue
+            matches += 1
+        if matches != 1:
+            raise ValidationError(value, expectation=expectation)
+
+    return validate_one_of
+
+
+class _SchemaCompiler:
+    def __init__(self, root: JSONObject):
+        self.root = root
+        self.refs: dict[str, SchemaValidator] = {}
+
+    def resolve(self, ref: str) -> JSONObject:
+        if not ref.startswith("#"):
+            raise NotImplementedError(f"Only local `$ref`s are supported. Got `{ref}`")
+        target: Any = self.root
+        for part in ref[1:].split("/")[1:]:
+            target = target[part.replace("~1", "/").replace("~0", "~")]
+        return target
+
+    def branch_type(self, schema: JSONObject) -> str | None:
+        """The (single) JSON type a schema requires (if any)."""
+        while "$ref" in schema:
+            schema = self.resolve(schema["$ref"])
+        json_type = schema.get("type")
+        return json_type if isinstance(json_type, str) else None
+
+    def compile_ref(self, ref: str) -> SchemaValidator:
+        if ref in self.refs:
+            return self.refs[ref]
+
+        validator: SchemaValidator | None = None
+
+        # NB: Recursive references see this (forwarding) validator while compiling
+        def validate_ref(value) -> None:
+            validator(value)  # type: ignore
+
+        self.refs[ref] = validate_ref
+        validator = self.compile(self.resolve(ref))
+        self.refs[ref] = validator
+        return validator
+
+    def compile(self, schema: JSONObject | bool) -> SchemaValidator:
+        if schema is True:
+            return _accept
+        if schema is False:
+            return _reject
+
+        validators: list[SchemaValidator] = []
+        for keyword, argument in schema.items():
+            if keyword in _ANNOTATION_KEYWORDS:
+                continue
+            elif keyword == "$ref":
+                validators.append(self.compile_ref(argument))
+            elif keyword == "type":
+                # NB: Type first, so the other keywords see the expected type
+                validators.insert(0, _type_validator(argument))
+            elif keyword == "enum":
+                validators.append(_enum_validator(argument))
+            elif keyword == "const":
+                validators.append(_enum_validator([argument]))
+            elif keyword == "pattern":
+                validators.append(_pattern_validator(argument))
+            elif keyword in ("minimum", "maximum"):
+                validators.append(_bound_validator(keyword, argument))
+            elif keyword in ("minLength", "maxLength"):
+                validators.append(
+                    _length_validator(
+                        keyword, argument, str, is_max=keyword == "maxLength"
+                    )
+                )
+            elif keyword in ("minItems", "maxItems"):
+                validators.append(
+                    _length_validator(
+                        keyword, argument, list, is_max=keyword == "maxItems"
+                    )
+                )
+            elif keyword in ("minProperties", "maxProperties"):
+                validators.append(
+                    _length_validator(
+                        keyword, argument, dict, is_max=keyword == "maxProperties"
+                    )
+                )
+            elif keyword == "not":
+                validators.append(_not_validator(self.compile(argument), argument))
+            elif keyword == "items":
+                validators.append(_items_validator(self.compile(argument)))
+            elif keyword == "oneOf":
+                validators.append(
+                    _one_of_validator(
+                        [self.compile(branch) for branch in argument],
+                        [self.branch_type(branch) for branch in argument],
+                    )
+                )
+            elif keyword in (
+                "properties",
+                "required",
+                "additionalProperties",
+                "propertyNames",
+            ):
+                continue  # NB: Handled together, below
+            else:
+                raise NotImplementedError(
+                    f"Compiling JSON schema keyword `{keyword}` is not implemented"
+                )
+
+        if {"properties", "required", "additionalProperties", "propertyNames"} & (
+            schema.keys()
+        ):
+            additional = schema.get("additionalProperties", True)
+            validators.append(
+                _object_validator(
+                    {
+                        name: self.compile(property_schema)
+                        for name, property_schema in schema.get(
+                            "properties", {}
+                        ).items()
+                    },
+                    tuple(schema.get("required", ())),
+                    additional
+                    if isinstance(additional, bool)
+                    else self.compile(additional),
+                    self.compile(schema["propertyNames"])
+                    if "propertyNames" in schema
+                    else None,
+                )
+            )
+
+        return _all_of(validators)
+
+
+def compile_schema(schema: JSONObject) -> SchemaValidator:
+    """
+    Compile `schema` (as produced by `json_schema.py`) into a function which raises a
+    `ValidationError` (with the path to the offending value) if given invalid data.
+
+    :param schema: The (root) JSON schema. `$ref`s are resolved relative to it.
+    """
+    return _SchemaCompiler(schema).compile(schema)
+
+
+def model_schema_document(model_type: type[Model]) -> JSONObject:
+    """
+    The JSON schema for `model_type`, with the model itself (also) in `$defs`.
+
+    NB: `Model.model_json_schema` hoists the model out of `$defs`, however (recursive) references
+        to the model and its `FieldAlias`es still point into `$defs`.
+    """
+    schema = model_type.model_json_schema
+    schema["$defs"][model_type.__name__] = {
+        key: value for key, value in schema.items() if key != "$defs"
+    }
+    return schema
+
+
+def compile_model_schema(model_type: type[Model]) -> SchemaValidator:
+    """
+    Compile `model_type`'s JSON schema (see `compile_schema`).
+    """
+    return compile_schema(model_schema_document(model_type))
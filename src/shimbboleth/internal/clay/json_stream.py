@@ -0,0 +1,117 @@
+"""
+Incremental reading of JSON values from a file-like object.
+
+Supports either:
+    - A top-level JSON array (each element is yielded)
+    - A stream of JSON values (e.g. NDJSON / JSON Lines), each value is yielded
+
+Only one value (plus one chunk of input) is held in memory at a time.
+"""
+
+import codecs
+import io
+import json
+from typing import IO, Iterator
+
+from shimbboleth.internal.clay.jsonT import JSON
+
+_WHITESPACE = " \t\n\r"
+
+
+class _JSONStreamReader:
+    def __init__(self, fp: IO[bytes] | IO[str], chunk_size: int):
+        self.fp = fp
+        self.chunk_size = chunk_size
+        self.decoder = json.JSONDecoder()
+        self.bytes_decoder = codecs.getincrementaldecoder("utf-8")()
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+
+    def _read_more(self, size: int) -> bool:
+        if self.eof:
+            return False
+
+        chunk = self.fp.read(size)
+        if isinstance(chunk, bytes):
+            raw_chunk = chunk
+            chunk = self.bytes_decoder.decode(raw_chunk, final=not raw_chunk)
+            # NB: The chunk might've only been part of a multi-byte character
+            while raw_chunk and not chunk:
+                raw_chunk = self.fp.read(size)
+                chunk = self.bytes_decoder.decode(raw_chunk, final=not raw_chunk)  # type: ignore
+        if not chunk:
+            self.eof = True
+            return False
+
+        # NB: Drop what's already been consumed, to keep memory flat
+        self.buffer = self.buffer[self.pos :] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self) -> str | None:
+        """Skip whitespace, and return the next character (or `None` at EOF)."""
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self._read_more(self.chunk_size):
+                return None
+
+    def expect(self, chars: str, message: str) -> str:
+        char = self.peek()
+        if char is None or char not in chars:
+            raise json.JSONDecodeError(message, self.buffer, self.pos)
+        self.pos += 1
+        return char
+
+    def decode_value(self) -> JSON:
+        self.peek()
+        read_size = self.chunk_size
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                # NB: Likely a value split across chunks
+                if not self._read_more(read_size):
+                    raise
+            else:
+                # NB: A number at the end of the buffer might continue in the next chunk
+                if end < len(self.buffer) or not self._read_more(read_size):
+                    self.pos = end
+                    return value
+            # NB: Grow reads, so huge values aren't re-parsed once per chunk
+            read_size *= 2
+
+
+def iter_json_values(
+    fp: IO[bytes] | IO[str] | bytes | str, *, chunk_size: int = 64 * 1024
+) -> Iterator[JSON]:
+    """
+    Yield the values of a top-level JSON array, or of a stream of JSON values (e.g. NDJSON).
+
+    `fp` is a (binary or text) file-like object. Binary input is decoded as UTF-8.
+    """
+    if isinstance(fp, bytes):
+        fp = io.BytesIO(fp)
+    elif isinstance(fp, str):
+        fp = io.StringIO(fp)
+
+    reader = _JSONStreamReader(fp, chunk_size)
+    if reader.peek() != "[":
+        while reader.peek() is not None:
+            yield reader.decode_value()
+        return
+
+    reader.pos += 1
+    if reader.peek() == "]":
+        reader.pos += 1
+    else:
+        while True:
+            yield reader.decode_value()
+            if reader.expect(",]", "Expecting ',' delimiter") == "]":
+                break
+
+    if reader.peek() is not None:
+        raise json.JSONDecodeError("Extra data", reader.buffer, reader.pos)
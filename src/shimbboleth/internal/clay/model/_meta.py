@@ -1,24 +1,80 @@
-from typing import Any, TypeVar
+from typing import Any, TypeVar, Callable
 import dataclasses
+import json
 from typing import dataclass_transform, ClassVar
-from types import MappingProxyType
+from types import MappingProxyType, MemberDescriptorType
 
 from shimbboleth.internal.clay.jsonT import JSONObject
 from shimbboleth.internal.clay.model._field_alias import FieldAlias
 from shimbboleth.internal.clay.model._field import field
-from shimbboleth.internal.clay._validators import ValidationDescriptor, get_validators
+from shimbboleth.internal.clay._validators import (
+    LazyValidationDescriptor,
+    ValidationDescriptor,
+    get_validators,
+)
 
 T = TypeVar("T")
 
 
+def _is_lazy(bases: tuple[type, ...], lazy: bool | None) -> bool:
+    if lazy is not None:
+        return lazy
+    return any(getattr(base, "__lazy__", False) for base in bases)
+
+
+class _LazyDataclassDoc:
+    """
+    A (lazy) stand-in for the docstring `dataclass` would've generated.
+
+    NB: `type.__doc__` calls `__get__` of whatever is in the class's `__doc__`.
+    """
+
+    PLACEHOLDER = "<lazy>"
+
+    def __get__(self, instance, owner) -> str:
+        import inspect
+
+        doc = owner.__name__ + str(inspect.signature(owner)).replace(" -> None", "")
+        owner.__doc__ = doc
+        return doc
+
+
 @dataclass_transform(kw_only_default=True, field_specifiers=(dataclasses.field, field))
 class ModelMeta(type):
     __dataclass_fields__: ClassVar[dict[str, dataclasses.Field[Any]]]
     __allow_extra_properties__: bool
     __field_aliases__: MappingProxyType[str, FieldAlias] = MappingProxyType({})
     __json_fieldnames__: frozenset[str]
+    __model_loader__: Callable[[Any], Any] | None
+    """The "compiled" JSON loader for this model. Built on first load (see `json_load.py`)."""
+    __model_dumper__: Callable[[Any], Any] | None
+    """The "compiled" JSON dumper for this model. Built on first dump (see `json_dump.py`)."""
+    __model_checker__: Callable[[Any], Any] | None
+    """The "compiled" JSON checker for this model. Built on first check (see `json_check.py`)."""
+    __model_json_schema__: bytes | None
+    """The (serialized) JSON schema for this model. Built on first access of the schema."""
+    __model_slots__: tuple[MemberDescriptorType, ...] | None
+    """The (raw) slot descriptors of this model's fields. Built on first pickle/copy."""
+    __model_memo__: dict[Any, Any] | None
+    """Memoized loaders/checkers/validators of annotations referencing this model (see `_types.memoized`)."""
+    __model_generated_init__: Callable[..., None] | None
+    """The `__init__` `dataclass` generated for this model (`None` if it has a hand-written one)."""
+
+    __lazy__: bool
+    """
+    Whether this model's metadata (field validators, docstring) is built on first use (instead of
+    at class creation). Set with the `lazy=True` class keyword, and inherited by subclasses.
+    """
 
-    def __new__(mcls, name, bases, namespace, *, extra: bool | None = None):
+    def __new__(
+        mcls,
+        name,
+        bases,
+        namespace,
+        *,
+        extra: bool | None = None,
+        lazy: bool | None = None,
+    ):
         cls = super().__new__(
             mcls,
             name,
@@ -37,10 +93,42 @@ class ModelMeta(type):
         #   We can tell if it's a dataclass if it has the magic attribute.
         if "__dataclass_fields__" in cls.__dict__:
             return cls
-        return dataclasses.dataclass(slots=True, kw_only=True)(cls)
 
-    def __init__(cls, name, bases, namespace, *, extra: bool | None = None):
+        lazy_doc = _is_lazy(bases, lazy) and not cls.__dict__.get("__doc__")
+        if lazy_doc:
+            # NB: Otherwise `dataclass` sets the docstring to the `__init__` signature (which is slow)
+            cls.__doc__ = _LazyDataclassDoc.PLACEHOLDER
+        cls = dataclasses.dataclass(slots=True, kw_only=True)(cls)
+        if lazy_doc:
+            cls.__doc__ = _LazyDataclassDoc()  # type: ignore
+        # NB: `dataclass` doesn't replace an `__init__` defined in the class body.
+        cls.__model_generated_init__ = (
+            None if "__init__" in namespace else cls.__dict__["__init__"]
+        )
+        return cls
+
+    def __init__(
+        cls,
+        name,
+        bases,
+        namespace,
+        *,
+        extra: bool | None = None,
+        lazy: bool | None = None,
+    ):
+        # NB: This is `dataclass` re-creating the class (with `__slots__`). `__init__` is called
+        #   again (with our keywords) once `__new__` returns, so don't do the work twice.
+        if "__dataclass_fields__" in namespace:
+            return
+
         cls.__allow_extra_properties__ = bool(extra)
+        cls.__lazy__ = _is_lazy(bases, lazy)
+        cls.__model_loader__ = None
+        cls.__model_dumper__ = None
+        cls.__model_checker__ = None
+        cls.__model_json_schema__ = None
+        cls.__model_slots__ = None
+        cls.__model_memo__ = None
 
         cls.__field_aliases__ = MappingProxyType(
             {
@@ -60,6 +148,16 @@ class ModelMeta(type):
 
         # Replace the fields with validators with descriptors which invoke the validators before setting
         for field_attr in dataclasses.fields(cls):  # type: ignore
+            if cls.__lazy__:
+                setattr(
+                    cls,
+                    field_attr.name,
+                    LazyValidationDescriptor(
+                        cls, getattr(cls, field_attr.name), field_attr.type
+                    ),
+                )
+                continue
+
             field_validators = tuple(get_validators(field_attr.type))
             if field_validators:
                 setattr(
@@ -72,11 +170,32 @@ class ModelMeta(type):
 
     @property
     def model_json_schema(cls) -> JSONObject:
-        from shimbboleth.internal.clay.json_schema import schema
+        """
+        The JSON schema for this model.
+
+        NB: This is a fresh copy on every access (so callers are free to mutate it).
+        """
+        return json.loads(cls.model_json_schema_json)
+
+    @property
+    def model_json_schema_json(cls) -> bytes:
+        """
+        The JSON schema for this model, serialized as (compact) JSON bytes.
+
+        NB: This is built once per class. Redefining a field's loader (`_json_loader_`)
+            resets it, however changes to other models (e.g. nested models) are NOT reflected.
+        """
+        if cls.__model_json_schema__ is None:
+            from shimbboleth.internal.clay.json_schema import schema
 
-        model_defs = {}
-        schema(cls, model_defs=model_defs)
-        return {**model_defs.pop(cls.__name__), "$defs": model_defs}
+            model_defs = {}
+            schema(cls, model_defs=model_defs)
+            cls.__model_json_schema__ = json.dumps(
+                {**model_defs.pop(cls.__name__), "$defs": model_defs},
+                separators=(",", ":"),
+                ensure_ascii=False,
+            ).encode("utf-8")
+        return cls.__model_json_schema__
 
     def model_load(cls: T, data: Any) -> T:
         # NB: Implemented in `Model`
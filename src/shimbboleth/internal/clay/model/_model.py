@@ -2,16 +2,50 @@
 Module defining the `Model` base class for all shimbboleth modeling.
 """
 
-from typing import Self, TypeVar, Callable
+from typing import (
+    IO,
+    Any,
+    Self,
+    TypeVar,
+    Callable,
+    Iterable,
+    Iterator,
+    Literal,
+    Sequence,
+    overload,
+)
 from collections.abc import Mapping
+from concurrent.futures import Executor
+from types import MemberDescriptorType
 import dataclasses
+import inspect
+import json
+from itertools import repeat
+from operator import is_
 
 from shimbboleth.internal.clay.jsonT import JSON, JSONObject
 from shimbboleth.internal.clay.model._meta import ModelMeta
+from shimbboleth.internal.clay.validation import ValidationError, ValidationErrors
 
 
 T = TypeVar("T")
 
+_get_slot = MemberDescriptorType.__get__
+_set_slot = MemberDescriptorType.__set__
+
+
+class _UnsetSlot:
+    """
+    Pickled in place of a field which isn't set (e.g. an `init=False` field without a default).
+    """
+
+
+def _get_slot_or_unset(slot: MemberDescriptorType, instance: Any) -> Any:
+    try:
+        return _get_slot(slot, instance)
+    except AttributeError:
+        return _UnsetSlot
+
 
 class _ModelBase:
     _extra: Mapping[str, JSON]
@@ -20,6 +54,29 @@ class _ModelBase:
     """
 
 
+def _getattr_deferred(self: "Model", name: str) -> Any:
+    """
+    The `__getattr__` of models with deferred fields (see `Model._enable_deferred_fields_`).
+
+    NB: Only called when normal lookup fails, which includes the (unset) deferred fields.
+    """
+    deferred = self.__dict__.get("_deferred_fields_")
+    entry = None if deferred is None else deferred.get(name)
+    if entry is None:
+        raise AttributeError(
+            f"{type(self).__name__!r} object has no attribute {name!r}"
+        )
+
+    load, value, set_value = entry
+    set_value(self, load(value))
+    # NB: Removed only once set, so concurrent readers either load it too or read the slot
+    deferred.pop(name, None)  # type: ignore
+    if not deferred:
+        self.__dict__.pop("_deferred_fields_", None)
+    # NB: Whatever was set last (if loaded concurrently)
+    return object.__getattribute__(self, name)
+
+
 class Model(_ModelBase, metaclass=ModelMeta):
     @classmethod
     def _json_loader_(cls, field: str, *, json_schema_type=None) -> Callable[[T], T]:
@@ -41,6 +98,15 @@ class Model(_ModelBase, metaclass=ModelMeta):
                     else json_schema_type,
                 }
             )
+            # NB: The compiled loader/checker and the schema (if any) are now stale.
+            #   Subclasses share the field, so theirs are too.
+            stale = [cls]
+            while stale:
+                model = stale.pop()
+                model.__model_loader__ = None
+                model.__model_checker__ = None
+                model.__model_json_schema__ = None
+                stale.extend(model.__subclasses__())
             return func
 
         return decorator
@@ -62,12 +128,255 @@ class Model(_ModelBase, metaclass=ModelMeta):
         return decorator
 
     @classmethod
-    def model_load(cls: type[Self], value: JSONObject) -> Self:
-        from shimbboleth.internal.clay.json_load import load_model
+    def model_load(
+        cls: type[Self],
+        value: JSONObject,
+        *,
+        max_errors: int | None = 1,
+        defer_nested: bool = False,
+    ) -> Self:
+        """
+        Load `value` (JSON data) as this model.
+
+        :param max_errors: How many errors to collect (`None` for no limit). If not 1, all of the
+            errors (up to `max_errors`) are raised together as a `ValidationErrors`.
+            NB: `ValidationErrors` is a `ValueError`, NOT a `ValidationError`, so callers passing
+            `max_errors` must catch `ValidationErrors` (or `ValueError`) instead.
+            (Collecting only happens after loading has failed, so valid data costs nothing extra)
+        :param defer_nested: Only load nested models/containers on first access of their field.
+            All of `value` is still validated up front, but must not be mutated until the
+            deferred fields are loaded.
+        """
+        from shimbboleth.internal.clay.json_load import load_model, load_model_deferred
+
+        try:
+            if defer_nested:
+                return load_model_deferred(cls, value)
+            return load_model(cls, value)
+        except ValidationError as e:
+            if max_errors == 1:
+                raise
+            raise cls._collect_errors_(value, e, max_errors=max_errors) from None
+
+    @classmethod
+    def model_validate_json_data(
+        cls, value: Any, *, max_errors: int | None = 1
+    ) -> None:
+        """
+        Check that `value` would load as this model, without loading it.
+
+        Raises the same `ValidationError` (with the same path) `model_load` would.
+
+        :param max_errors: See `model_load`.
+        """
+        from shimbboleth.internal.clay.json_check import check_model
+
+        try:
+            check_model(cls, value)
+        except ValidationError as e:
+            if max_errors == 1:
+                raise
+            raise cls._collect_errors_(value, e, max_errors=max_errors) from None
+
+    @classmethod
+    def _collect_errors_(
+        cls, value: Any, error: ValidationError, *, max_errors: int | None
+    ) -> ValidationErrors:
+        from shimbboleth.internal.clay.json_check import collect_model_errors
+
+        if max_errors is not None and max_errors < 1:
+            raise ValueError(f"`max_errors` must be at least 1. Got: {max_errors}")
+        # NB: `error` is the first error, which the collecting walk should also find
+        return ValidationErrors(
+            collect_model_errors(cls, value, max_errors=max_errors) or [error]
+        )
+
+    @overload
+    @classmethod
+    def model_load_many(
+        cls: type[Self],
+        values: Iterable[JSONObject],
+        *,
+        collect_errors: bool = False,
+        stream: Literal[False] = False,
+    ) -> list[Self]: ...
+
+    @overload
+    @classmethod
+    def model_load_many(
+        cls: type[Self],
+        values: Iterable[JSONObject],
+        *,
+        collect_errors: bool = False,
+        stream: Literal[True],
+    ) -> Iterator[Self]: ...
+
+    @classmethod
+    def model_load_many(
+        cls: type[Self],
+        values: Iterable[JSONObject],
+        *,
+        collect_errors: bool = False,
+        stream: bool = False,
+    ) -> list[Self] | Iterator[Self]:
+        """
+        Load many JSON objects as this model (sharing the per-model setup).
+
+        :param collect_errors: Instead of raising on the first invalid item, skip invalid items
+            and raise all of their errors (as a `ValidationErrors`) at the end.
+        :param stream: Return an iterator which loads items lazily (instead of a list).
+        """
+        from shimbboleth.internal.clay.json_load import load_models
+
+        models = load_models(cls, values, collect_errors=collect_errors)
+        return models if stream else list(models)
+
+    @classmethod
+    def model_load_many_in_processes(
+        cls: type[Self],
+        values: Sequence[JSONObject],
+        *,
+        collect_errors: bool = False,
+        max_workers: int | None = None,
+        chunk_size: int | None = None,
+        executor: Executor | None = None,
+    ) -> list[Self]:
+        """
+        Like `model_load_many`, but spreads the (CPU-bound) loading across a process pool.
+
+        Only worth it with several CPUs, and batches of (many) thousands of models which are
+        expensive to load. Every model is still unpickled in this process, which bounds the speedup.
+        Otherwise this is slower than `model_load_many` (E.g. ~2x slower on a single CPU).
+        Small batches, or a single worker, are loaded in this process (unless given an `executor`).
+
+        See `json_load.load_models_in_processes` for the parameters.
+        """
+        from shimbboleth.internal.clay.json_load import load_models_in_processes
+
+        return load_models_in_processes(
+            cls,
+            values,
+            collect_errors=collect_errors,
+            max_workers=max_workers,
+            chunk_size=chunk_size,
+            executor=executor,
+        )
+
+    @classmethod
+    def model_load_json(
+        cls: type[Self], data: bytes | str | IO[bytes] | IO[str]
+    ) -> Self:
+        """
+        Load this model from a JSON document (as `bytes`/`str`, or a file-like object).
+        """
+        if isinstance(data, (bytes, str)):
+            value = json.loads(data)
+        else:
+            value = json.load(data)
+        return cls.model_load(value)
+
+    @classmethod
+    def model_iter_load_json(
+        cls: type[Self],
+        data: bytes | str | IO[bytes] | IO[str],
+        *,
+        collect_errors: bool = False,
+    ) -> Iterator[Self]:
+        """
+        Incrementally load models from a top-level JSON array, or from NDJSON.
+
+        Only one record is parsed/loaded at a time, so peak memory is bounded
+        by the largest record (instead of the entire document).
+
+        :param collect_errors: See `model_load_many`.
+        """
+        from shimbboleth.internal.clay.json_load import load_models
+        from shimbboleth.internal.clay.json_stream import iter_json_values
+
+        return load_models(
+            cls,
+            iter_json_values(data),  # type: ignore
+            collect_errors=collect_errors,
+        )
+
+    @classmethod
+    def _field_slots_(cls) -> tuple[MemberDescriptorType, ...]:
+        if cls.__model_slots__ is None:
+            slots = []
+            for field in dataclasses.fields(cls):
+                descriptor = inspect.getattr_static(cls, field.name)
+                # NB: Unwrap `ValidationDescriptor`/`LazyValidationDescriptor`
+                slots.append(getattr(descriptor, "field_descriptor", descriptor))
+            cls.__model_slots__ = tuple(slots)
+        return cls.__model_slots__
+
+    @classmethod
+    def _enable_deferred_fields_(cls) -> None:
+        """
+        Install the `__getattr__` which loads deferred fields (on first access) on this model.
+
+        NB: Only done on the model's first deferred load (`model_load(..., defer_nested=True)`),
+            since `__getattr__` slows down every failed attribute lookup on the model's instances.
+        """
+        if getattr(cls, "__getattr__", None) is not _getattr_deferred:
+            cls.__getattr__ = _getattr_deferred  # type: ignore
+
+    def _load_deferred_fields_(self) -> None:
+        deferred = self.__dict__.get("_deferred_fields_")
+        if deferred is not None:
+            for name in list(deferred):
+                getattr(self, name)
+            # NB: Fields assigned before being accessed are never loaded (so never removed)
+            self.__dict__.pop("_deferred_fields_", None)
 
-        return load_model(cls, value)
+    def __getstate__(self) -> tuple[tuple[Any, ...], dict[str, Any] | None]:
+        """
+        Pickle just the field values (and `_extra`, if any).
+
+        NB: Unpickling sets the fields directly (without re-running validators), since they were
+            validated when set on the pickled instance.
+        """
+        self._load_deferred_fields_()
+        slots = type(self)._field_slots_()
+        try:
+            # NB: `map` over the slot descriptors' methods, to keep the per-field loop in C
+            values = tuple(map(_get_slot, slots, repeat(self)))
+        except AttributeError:
+            values = tuple(map(_get_slot_or_unset, slots, repeat(self)))
+        return (values, self.__dict__ or None)
+
+    def __setstate__(self, state: tuple[tuple[Any, ...], dict[str, Any] | None]):
+        values, instance_dict = state
+        slots = type(self)._field_slots_()
+        if any(map(is_, values, repeat(_UnsetSlot))):
+            for slot, value in zip(slots, values):
+                if value is not _UnsetSlot:
+                    slot.__set__(self, value)
+        else:
+            any(map(_set_slot, slots, repeat(self), values))
+        if instance_dict:
+            self.__dict__.update(instance_dict)
 
     def model_dump(self) -> JSONObject:
         from shimbboleth.internal.clay.json_dump import dump_model
 
         return dump_model(self)
+
+    def model_dump_json(self) -> bytes:
+        """
+        Dump this model as compact UTF-8 encoded JSON.
+
+        Same output as `json.dumps(self.model_dump(), separators=(",", ":"), ensure_ascii=False)`,
+        but encoded directly (without the intermediate `dict`s).
+        """
+        from shimbboleth.internal.clay.json_dump import dump_model_json
+
+        return dump_model_json(self)
+
+    def model_dump_to(self, fp: IO[bytes]) -> None:
+        """
+        Write this model as JSON (see `model_dump_json`) to the binary file-like `fp`.
+        """
+        from shimbboleth.internal.clay.json_dump import dump_model_to
+
+        dump_model_to(self, fp)
@@ -0,0 +1,267 @@
+"""
+Tests related to `json_check.py` (`Model.model_validate_json_data`).
+
+Checking should raise exactly what loading would.
+"""
+
+import re
+import uuid
+from typing import Annotated, Any, ClassVar, Literal
+
+import pytest
+from pytest import param
+
+from shimbboleth.internal.clay.json_check import check, get_checker
+from shimbboleth.internal.clay.model import Model, field, FieldAlias
+from shimbboleth.internal.clay.validation import (
+    Ge,
+    MatchesRegex,
+    MaxLength,
+    NonEmpty,
+    NonEmptyList,
+    NonEmptyString,
+    ValidationError,
+    ValidationErrors,
+)
+
+
+def str_to_int(value: str) -> int:
+    return int(value)
+
+
+class Inner(Model):
+    name: NonEmptyString
+    count: Annotated[int, Ge(1)] = 1
+
+
+class Outer(Model, extra=False):
+    label: str | None = None
+    key: Annotated[str, MatchesRegex(r"^[a-z]+$")] | None = None
+    if_condition: NonEmptyString = field(default="true", json_alias="if")
+    tags: list[Annotated[str, NonEmpty]] = field(default_factory=list)
+    env: dict[str, Annotated[str, NonEmpty]] = field(default_factory=dict)
+    inners: NonEmptyList[Inner] = field(default_factory=lambda: [Inner(name="a")])
+    inner: Inner | str | None = None
+    state: Literal["passed", "failed"] = "passed"
+    id: uuid.UUID | None = None
+    pattern: re.Pattern | None = None
+    number: Annotated[int, Ge(0)] = field(default=0, json_loader=str_to_int)
+    anything: Any = None
+    required: bool
+
+    name: ClassVar = FieldAlias("label")
+    condition: ClassVar = FieldAlias("if_condition", json_mode="prepend")
+
+
+VALID = {"required": True}
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        param(VALID, id="minimal"),
+        param(
+            {
+                **VALID,
+                "name": "label",
+                "key": "abc",
+                "if": "x",
+                "condition": "y",
+                "tags": ["a", "b"],
+                "env": {"A": "b"},
+                "inners": [{"name": "a", "count": 2}],
+                "inner": "b",
+                "state": "failed",
+                "id": "{12345678-1234-5678-1234-567812345678}",
+                "pattern": "a+",
+                "number": "10",
+                "anything": {"a": [1]},
+            },
+            id="full",
+        ),
+        param({**VALID, "inner": {"name": "a"}}, id="union-model"),
+        param({**VALID, "id": "urn:uuid:12345678123456781234567812345678"}, id="uuid"),
+    ],
+)
+def test_valid(data):
+    Outer.model_load(data)
+    assert Outer.model_validate_json_data(data) is None
+
+
+INVALID = [
+    param([], id="not-an-object"),
+    param({}, id="missing-required"),
+    param({**VALID, "extra": 1}, id="extras"),
+    param({**VALID, "label": 1}, id="wrong-type"),
+    param({**VALID, "name": 1}, id="wrong-type-alias"),
+    param({**VALID, "key": "ABC"}, id="validator"),
+    param({**VALID, "key": 1}, id="validator-wrong-type"),
+    param({**VALID, "if": ""}, id="validator-json-alias"),
+    param({**VALID, "condition": ""}, id="validator-field-alias"),
+    param({**VALID, "tags": ["a", ""]}, id="list-validator"),
+    param({**VALID, "tags": ["a", 1]}, id="list-type"),
+    param({**VALID, "env": {"A": ""}}, id="dict-validator"),
+    param({**VALID, "env": {"A": None}}, id="dict-type"),
+    param({**VALID, "inners": []}, id="nonempty-list"),
+    param({**VALID, "inners": [{"name": "a"}, {"name": ""}]}, id="nested-validator"),
+    param({**VALID, "inners": [{"name": "a", "count": "1"}]}, id="nested-type"),
+    param({**VALID, "inners": [{}]}, id="nested-missing"),
+    param({**VALID, "inner": 1}, id="union-type"),
+    param({**VALID, "inner": {"name": ""}}, id="union-model-validator"),
+    param({**VALID, "state": "running"}, id="literal"),
+    param({**VALID, "id": "not-a-uuid"}, id="uuid"),
+    param({**VALID, "id": "1234567812345678123456781234567z"}, id="uuid"),
+    param({**VALID, "pattern": "("}, id="pattern"),
+    param({**VALID, "number": 1}, id="json-loader-type"),
+    param({**VALID, "number": "-1"}, id="json-loader-validator"),
+    param({"label": 1}, id="wrong-type-and-missing"),
+    param({"key": "ABC"}, id="validator-and-missing"),
+    param({**VALID, "key": "ABC", "label": 1}, id="validator-and-wrong-type"),
+]
+
+
+@pytest.mark.parametrize("data", INVALID)
+def test_invalid(data):
+    with pytest.raises(ValidationError) as load_error:
+        Outer.model_load(data)
+    with pytest.raises(ValidationError) as check_error:
+        Outer.model_validate_json_data(data)
+
+    assert type(check_error.value) is type(load_error.value)
+    assert str(check_error.value) == str(load_error.value)
+
+
+@pytest.mark.parametrize("data", INVALID)
+def test_invalid__max_errors(data):
+    with pytest.raises(ValidationError) as load_error:
+        Outer.model_load(data)
+    with pytest.raises(ValidationErrors) as collected:
+        Outer.model_load(data, max_errors=None)
+    with pytest.raises(ValidationErrors) as checked:
+        Outer.model_validate_json_data(data, max_errors=None)
+
+    # NB: The first error is always found (not necessarily first)
+    assert str(load_error.value) in [str(error) for error in collected.value.errors]
+    assert str(collected.value) == str(checked.value)
+
+
+def test_max_errors():
+    data = {
+        "label": 1,
+        "if": "",
+        "tags": ["", "a", ""],
+        "inners": [{"name": ""}, {}],
+        "extra": True,
+    }
+    with pytest.raises(ValidationErrors) as e:
+        Outer.model_load(data, max_errors=None)
+
+    assert [error.path for error in e.value.errors] == [
+        [],
+        [".label"],
+        [".inners", "[0]", ".name"],
+        [".inners", "[1]"],
+        [],
+        [".if"],
+        [".tags", "[0]"],
+        [".tags", "[2]"],
+    ]
+
+    with pytest.raises(ValidationErrors) as e:
+        Outer.model_load(data, max_errors=3)
+    assert len(e.value.errors) == 3
+
+    assert Outer.model_load(VALID, max_errors=None) == Outer.model_load(VALID)
+
+
+@pytest.mark.parametrize("max_errors", [None, 2])
+def test_max_errors__exception_type(max_errors):
+    # NB: Callers catching `ValidationError` don't catch the collected errors
+    with pytest.raises(ValidationErrors) as e:
+        Outer.model_load({"label": 1}, max_errors=max_errors)
+    assert not isinstance(e.value, ValidationError)
+    assert isinstance(e.value, ValueError)
+
+    with pytest.raises(ValidationErrors) as e:
+        Outer.model_validate_json_data({"label": 1}, max_errors=max_errors)
+    assert not isinstance(e.value, ValidationError)
+
+
+def test_invalid_default():
+    class MyModel(Model):
+        field: NonEmptyString = ""
+
+    with pytest.raises(ValidationError, match=r"Path: \.field"):
+        MyModel.model_validate_json_data({})
+
+
+def test_json_loader_after_first_check():
+    class MyModel(Model):
+        field: int = field(default=0)
+
+    MyModel.model_validate_json_data({"field": 1})
+
+    @MyModel._json_loader_("field")
+    def _load_field(value: str) -> int:
+        return int(value)
+
+    MyModel.model_validate_json_data({"field": "1"})
+
+
+def test_recursive_model():
+    class Node(Model):
+        name: NonEmptyString
+        children: list["Node"] = field(default_factory=list)
+
+    Node.__dataclass_fields__["children"].type = list[Node]
+
+    Node.model_validate_json_data({"name": "a", "children": [{"name": "b"}]})
+    with pytest.raises(ValidationError, match=r"Path: \.children\[0\]\.name"):
+        Node.model_validate_json_data({"name": "a", "children": [{"name": ""}]})
+
+
+def test_builds_no_models(monkeypatch):
+    class Leaf(Model):
+        name: NonEmptyString
+
+    class Tree(Model):
+        leaves: NonEmptyList[Leaf]
+        by_name: Annotated[dict[str, Leaf], MaxLength(2)] = field(default_factory=dict)
+        maybe: NonEmptyList[Leaf] | None = None
+
+    built = []
+
+    def new(cls, *args, **kwargs):
+        built.append(cls)
+        return object.__new__(cls)
+
+    monkeypatch.setattr(Leaf, "__new__", staticmethod(new))
+
+    data = {
+        "leaves": [{"name": "a"}, {"name": "b"}],
+        "by_name": {"a": {"name": "a"}},
+        "maybe": [{"name": "c"}],
+    }
+    Tree.model_validate_json_data(data)
+    assert built == []
+    Tree.model_load(data)
+    assert built == [Leaf] * 4
+
+    # NB: Once invalid, the error reports the loaded value (just like loading)
+    data["by_name"] = {"a": {"name": "a"}, "b": {"name": "b"}, "c": {"name": "c"}}
+    with pytest.raises(ValidationError) as load_error:
+        Tree.model_load(data)
+    with pytest.raises(ValidationError) as check_error:
+        Tree.model_validate_json_data(data)
+    assert str(check_error.value) == str(load_error.value)
+    assert "Leaf(name='a')" in str(check_error.value)
+
+
+def test_get_checker__memoized_nested_unions(monkeypatch):
+    # NB: Overlapping unions are (only) disallowed under test
+    monkeypatch.delenv("SHIMBBOLETH_PYTESTING")
+    # NB: Nested unions compare equal regardless of order
+    check(list[Literal["a"] | str], data=["a"])
+    check(list[str | Literal["a"]], data=["b"])
+    assert get_checker(list[int | str]) is not get_checker(list[str | int])
+    assert get_checker(list[int]) is get_checker(list[int])
@@ -1,11 +1,14 @@
+import io
+import json
 import pytest
 import uuid
 import re
-from typing import ClassVar
+from typing import Annotated, Any, ClassVar, Literal
 from pytest import param
 
 from shimbboleth.internal.clay.model import Model, field, FieldAlias
 from shimbboleth.internal.clay.json_dump import dump
+from shimbboleth.internal.clay.validation import NonEmpty
 
 
 def make_model(attrs, **kwargs):
@@ -130,3 +133,133 @@ def test_json_alias():
 
     instance = MyModel(if_condition="value")
     assert dump(instance) == {"if": "value"}
+
+
+class _Nested(Model):
+    field: str = ""
+
+
+class _NestedWithExtras(Model, extra=True):
+    field: str = ""
+
+
+@pytest.mark.parametrize(
+    ("field_type", "value", "expected"),
+    [
+        param(list[str], ["a"], ["a"], id="list"),
+        param(list[uuid.UUID], [uuid.UUID(int=0)], [str(uuid.UUID(int=0))], id="list"),
+        param(list[_Nested], [_Nested(field="a")], [{"field": "a"}], id="list"),
+        param(dict[str, re.Pattern], {"a": re.compile("a")}, {"a": "a"}, id="dict"),
+        param(dict[str, list[int]], {"a": [1]}, {"a": [1]}, id="dict"),
+        param(_Nested | str, _Nested(field="a"), {"field": "a"}, id="union"),
+        param(_Nested | str, "a", "a", id="union"),
+        param(Annotated[list[_Nested], NonEmpty], [_Nested()], [{}], id="annotated"),
+        param(Literal["a", "b"], "b", "b", id="literal"),
+        param(Any, {"a": _Nested()}, {"a": {}}, id="any"),
+    ],
+)
+def test_model_dump__field_types(field_type, value, expected):
+    model_def = make_model({"__annotations__": {"field": field_type}})
+    assert model_def(field=value).model_dump() == {"field": expected}
+    assert json.loads(model_def(field=value).model_dump_json()) == {"field": expected}
+
+
+def _dumps(obj) -> bytes:
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+@pytest.mark.parametrize(
+    "instance",
+    [
+        param(_Nested(), id="defaults"),
+        param(_Nested(field='a "quoted" ✨ string\n'), id="escaping"),
+        param(_NestedWithExtras.model_load({"field": "a", "extra": [1]}), id="extras"),
+    ],
+)
+def test_model_dump_json(instance):
+    assert instance.model_dump_json() == _dumps(instance.model_dump())
+
+    fp = io.BytesIO()
+    instance.model_dump_to(fp)
+    assert fp.getvalue() == _dumps(instance.model_dump())
+
+
+def test_model_dump_json__nested():
+    class MyModel(Model, extra=True):
+        if_condition: str | None = field(default=None, json_alias="if")
+        number: int = field(default=0, json_dumper=int_to_str)
+        nested: list[_Nested | str] = field(default_factory=list)
+        mapping: dict[str, _Nested] = field(default_factory=dict)
+        any: Any = None
+
+    instance = MyModel.model_load(
+        {
+            "if": "true",
+            "number": 1,
+            "nested": [{"field": "a"}, "b", {}],
+            "mapping": {"a": {"field": "b"}},
+            "any": {"a": [1.5, None]},
+            "extra": {"key": "value"},
+        }
+    )
+    assert instance.model_dump_json() == _dumps(instance.model_dump())
+
+    fp = io.BytesIO()
+    instance.model_dump_to(fp)
+    assert fp.getvalue() == _dumps(instance.model_dump())
+
+
+def test_model_dump_json__extras_override_fields():
+    instance = _NestedWithExtras(field="a")
+    instance._extra = {"field": "b", "other": 1}
+    assert instance.model_dump_json() == _dumps(instance.model_dump())
+
+
+def test_model_dump_json__overridden_model_dump():
+    class MyModel(Model):
+        field: str = ""
+
+        def model_dump(self):
+            return {"custom": super().model_dump()}
+
+    class Parent(Model):
+        nested: MyModel
+        items: list[MyModel] = field(default_factory=list)
+
+    instance = MyModel(field="a")
+    assert instance.model_dump_json() == _dumps({"custom": {"field": "a"}})
+    fp = io.BytesIO()
+    instance.model_dump_to(fp)
+    assert fp.getvalue() == _dumps(instance.model_dump())
+
+    parent = Parent(nested=instance, items=[MyModel()])
+    assert parent.model_dump_json() == _dumps(parent.model_dump())
+    fp = io.BytesIO()
+    parent.model_dump_to(fp)
+    assert fp.getvalue() == _dumps(parent.model_dump())
+
+
+def test_model_dump__copies_containers():
+    class MyModel(Model):
+        field: list[str]
+
+    instance = MyModel(field=["a"])
+    instance.model_dump()["field"].append("b")
+    assert instance.field == ["a"]
+
+
+def test_model_dump__default_factory_called_once():
+    calls = []
+
+    def factory() -> list[int]:
+        calls.append(None)
+        return []
+
+    class MyModel(Model):
+        field: list[int] = field(default_factory=factory)
+
+    instance = MyModel(field=[])
+    calls.clear()
+    for _ in range(3):
+        assert instance.model_dump() == {}
+    assert len(calls) <= 1
@@ -2,14 +2,33 @@
 Tests related to `json_load.py`.
 """
 
+import concurrent.futures
+import copy
+import dataclasses
+import gc
+import pickle
+import weakref
+
 import pytest
 from typing import Literal, Annotated, ClassVar
 import uuid
 from pytest import param
 
 from shimbboleth.internal.clay.model import Model, field, FieldAlias
-from shimbboleth.internal.clay.validation import MatchesRegex, NonEmpty, Ge
-from shimbboleth.internal.clay.json_load import load
+from shimbboleth.internal.clay.validation import (
+    MatchesRegex,
+    NonEmpty,
+    Ge,
+    NonEmptyString,
+    ValidationError,
+    ValidationErrors,
+)
+from shimbboleth.internal.clay import json_load
+from shimbboleth.internal.clay.json_load import (
+    ExtrasNotAllowedError,
+    load,
+    get_loader,
+)
 
 
 def make_model(attrs, **kwargs):
@@ -55,6 +74,9 @@ def str_to_int(value: str) -> int:
         param(Literal[1, 2, 3], 1, id="literal"),
         param(Literal[1, 2, 3], 2, id="literal"),
         param(Literal[1, 2, 3], 3, id="literal"),
+        # NB: Not an interned int
+        param(Literal[1000, 2000], int("1000"), id="literal"),
+        param(Literal[None], None, id="literal"),
         # union
         param(int | str, 42, id="union"),
         param(int | str, "hello", id="union"),
@@ -115,6 +137,7 @@ def test_passing_uuid(field_type, data):
         param(Literal[1], True, id="literal"),
         param(Literal[False], 0, id="literal"),
         param(Literal[0], False, id="literal"),
+        param(Literal["a"], ["a"], id="literal"),
         # union
         param(int | str, True, id="union"),
         param(int | str, [], id="union"),
@@ -297,3 +320,514 @@ def test__validation_error__json_alias_path():
 
     with pytest.raises(Exception, match=r"Path: .int"):
         MyModel.model_load({"int": -1})
+
+
+def test_model__json_loader_after_first_load():
+    """Registering a JSON loader after loading must still take effect."""
+
+    class MyModel(Model):
+        field: int
+
+    assert MyModel.model_load({"field": 1}).field == 1
+
+    @MyModel._json_loader_("field")
+    def _load_field(value: str) -> int:
+        return int(value)
+
+    assert MyModel.model_load({"field": "2"}).field == 2
+
+
+def test_model__json_loader_after_subclass_load():
+    class Base(Model):
+        field: int
+
+    class Child(Base):
+        pass
+
+    class GrandChild(Child):
+        pass
+
+    for model in (Child, GrandChild):
+        assert model.model_load({"field": 1}).field == 1
+        model.model_validate_json_data({"field": 1})
+        assert model.model_json_schema["properties"]["field"]["type"] == "integer"
+
+    @Base._json_loader_("field")
+    def _load_field(value: str) -> int:
+        return int(value)
+
+    for model in (Child, GrandChild):
+        assert model.model_load({"field": "2"}).field == 2
+        model.model_validate_json_data({"field": "2"})
+        assert model.model_json_schema["properties"]["field"]["type"] == "string"
+
+
+def test_model__subclass():
+    class Base(Model):
+        field: int
+
+    class Child(Base):
+        other: int = 0
+
+    assert Base.model_load({"field": 1}) == Base(field=1)
+    assert Child.model_load({"field": 1, "other": 2}) == Child(field=1, other=2)
+    with pytest.raises(
+        ExtrasNotAllowedError, match=r"`\{'other': 2\}`.*Base dosn't support extra keys"
+    ):
+        Base.model_load({"field": 1, "other": 2})
+
+
+def test_get_loader__memoized():
+    assert get_loader(list[int]) is get_loader(list[int])
+    assert get_loader(dict[str, Literal["a"]]) is get_loader(dict[str, Literal["a"]])
+    # NB: Unions compare equal regardless of order, but aren't the same loader
+    assert get_loader(int | str) is not get_loader(str | int)
+    # Unhashable annotations are still supported (just not memoized)
+    assert load(Annotated[int, []], data=1) == 1
+
+
+def test_get_loader__memoized_nested_unions(monkeypatch):
+    # NB: Overlapping unions are (only) disallowed under test
+    monkeypatch.delenv("SHIMBBOLETH_PYTESTING")
+    # NB: Nested unions also compare equal regardless of order
+    assert load(list[Literal["a"] | str], data=["a"]) == ["a"]
+    assert load(list[str | Literal["a"]], data=["b"]) == ["b"]
+    assert get_loader(list[int | str]) is not get_loader(list[str | int])
+    assert get_loader(Literal[1]) is not get_loader(Literal[True])
+
+
+def test_get_loader__memoized_on_model():
+    class MyModel(Model):
+        field: int
+
+    loader = get_loader(list[MyModel])
+    assert get_loader(list[MyModel]) is loader
+    assert loader in MyModel.__model_memo__.values()
+
+    # NB: The (global) memo doesn't keep the model alive
+    model_ref = weakref.ref(MyModel)
+    del MyModel, loader
+    gc.collect()
+    assert model_ref() is None
+
+
+@pytest.mark.parametrize(
+    ("field_type", "data", "path"),
+    [
+        param(list[int], [1, "2"], "[1]", id="list"),
+        param(list[list[str]], [[], ["", 0]], "[1][1]", id="nested-list"),
+        param(dict[str, int], {"a": 0, "b": None}, "['b']", id="dict"),
+        param(dict[str, list[bool]], {"a": [True, 0]}, "['a'][1]", id="nested-dict"),
+    ],
+)
+def test_invalid__path(field_type, data, path):
+    with pytest.raises(TypeError) as e:
+        load(field_type, data=data)
+
+    assert f"Path: {path}" in str(e.value)
+
+
+def test_union__literal_arm():
+    assert load(Literal["a", "b"] | list[str], data="a") == "a"
+    assert load(Literal["a", "b"] | list[str], data=["c"]) == ["c"]
+    with pytest.raises(TypeError):
+        load(Literal["a", "b"] | list[str], data="c")
+
+
+def test_model__input_not_mutated():
+    class MyModel(Model, extra=True):
+        if_condition: str = field(json_alias="if")
+        field: str = ""
+        alias: ClassVar = FieldAlias("field")
+
+    data = {"if": "value", "alias": "value", "extra": {"key": "value"}}
+    data_copy = copy.deepcopy(data)
+    instance = MyModel.model_load(data)
+    assert instance == MyModel(if_condition="value", field="value")
+    assert instance._extra == {"extra": {"key": "value"}}
+    assert data == data_copy
+
+
+def test_field_alias__of_json_alias():
+    class MyModel(Model):
+        if_condition: str = field(json_alias="if")
+        alias: ClassVar = FieldAlias("if_condition")
+
+    assert MyModel.model_load({"alias": "value"}).if_condition == "value"
+
+
+def test_field_alias__of_field_alias():
+    class MyModel(Model):
+        field: str
+        alias: ClassVar = FieldAlias("field")
+        alias_alias: ClassVar = FieldAlias("alias")
+
+    assert MyModel.model_load({"alias_alias": "value"}).field == "value"
+
+
+class _ManyModel(Model):
+    field: int
+
+
+def test_model_load_many():
+    assert _ManyModel.model_load_many([{"field": 0}, {"field": 1}]) == [
+        _ManyModel(field=0),
+        _ManyModel(field=1),
+    ]
+    assert _ManyModel.model_load_many([]) == []
+
+
+def test_model_load_many__error_path():
+    with pytest.raises(TypeError, match=r"Path: \[1\]\.field"):
+        _ManyModel.model_load_many([{"field": 0}, {"field": ""}, {"field": None}])
+
+
+def test_model_load_many__collect_errors():
+    with pytest.raises(ValidationErrors) as e:
+        _ManyModel.model_load_many(
+            [{"field": ""}, {"field": 0}, {"field": None}], collect_errors=True
+        )
+
+    assert [error.path for error in e.value.errors] == [
+        ["[0]", ".field"],
+        ["[2]", ".field"],
+    ]
+
+
+def test_model_load_many__stream():
+    def values():
+        yield {"field": 0}
+        yield {"field": ""}
+        yield {"field": 2}
+
+    models = _ManyModel.model_load_many(values(), stream=True, collect_errors=True)
+    assert next(models) == _ManyModel(field=0)
+    assert next(models) == _ManyModel(field=2)
+    with pytest.raises(ValidationErrors, match=r"Path: \[1\]\.field"):
+        next(models)
+
+
+class _ExtraModel(Model, extra=True):
+    name: NonEmptyString
+
+
+class _LazyModel(Model, lazy=True):
+    name: NonEmptyString
+
+
+class _UnsetFieldModel(Model):
+    name: str
+    derived: str = dataclasses.field(init=False)
+
+
+@pytest.mark.parametrize(
+    "instance",
+    [
+        param(_ManyModel(field=1), id="plain"),
+        param(_ExtraModel.model_load({"name": "a", "other": [1]}), id="extra"),
+        param(_LazyModel(name="a"), id="lazy"),
+    ],
+)
+def test_model__pickle(instance):
+    unpickled = pickle.loads(pickle.dumps(instance))
+    assert unpickled == instance
+    assert getattr(unpickled, "_extra", None) == getattr(instance, "_extra", None)
+    assert copy.copy(instance) == instance
+
+
+def test_model__pickle__not_revalidated():
+    instance = _ExtraModel(name="a")
+    # NB: Sneak an invalid value past the validators
+    (name_slot,) = _ExtraModel._field_slots_()
+    name_slot.__set__(instance, "")
+
+    assert pickle.loads(pickle.dumps(instance)).name == ""
+
+
+def test_model__pickle__unset_field():
+    instance = _UnsetFieldModel(name="a")
+    unpickled = pickle.loads(pickle.dumps(instance))
+    assert unpickled.name == "a"
+    with pytest.raises(AttributeError):
+        unpickled.derived
+
+    copied = copy.copy(instance)
+    copied.derived = "b"
+    assert pickle.loads(pickle.dumps(copied)).derived == "b"
+
+
+def test_validation_error__pickle():
+    with pytest.raises(ValidationError) as e:
+        _ManyModel.model_load_many([{"field": 0}, {"field": ""}])
+
+    unpickled = pickle.loads(pickle.dumps(e.value))
+    assert type(unpickled) is type(e.value)
+    assert str(unpickled) == str(e.value)
+
+    errors = pickle.loads(pickle.dumps(ValidationErrors([e.value])))
+    assert str(errors) == str(ValidationErrors([e.value]))
+
+
+@pytest.fixture(scope="module")
+def process_pool():
+    with concurrent.futures.ProcessPoolExecutor(2) as executor:
+        yield executor
+
+
+def test_model_load_many_in_processes(process_pool):
+    values = [{"field": index} for index in range(10)]
+    assert _ManyModel.model_load_many_in_processes(
+        values, executor=process_pool, chunk_size=3
+    ) == _ManyModel.model_load_many(values)
+    assert _ManyModel.model_load_many_in_processes([], executor=process_pool) == []
+
+
+def test_model_load_many_in_processes__own_pool(monkeypatch):
+    chunks = []
+
+    class SpyExecutor(concurrent.futures.ProcessPoolExecutor):
+        def submit(self, fn, /, *args, **kwargs):
+            chunks.append(len(args[1]))
+            return super().submit(fn, *args, **kwargs)
+
+    monkeypatch.setattr(concurrent.futures, "ProcessPoolExecutor", SpyExecutor)
+    values = [{"field": index} for index in range(16)]
+
+    # NB: Too small a batch (or a single worker) is loaded in this process
+    assert _ManyModel.model_load_many_in_processes(
+        values, max_workers=2
+    ) == _ManyModel.model_load_many(values)
+    assert _ManyModel.model_load_many_in_processes(
+        values, max_workers=1
+    ) == _ManyModel.model_load_many(values)
+    assert chunks == []
+
+    monkeypatch.setattr(json_load, "_MIN_PROCESS_POOL_VALUES", 0)
+    assert _ManyModel.model_load_many_in_processes(
+        values, max_workers=2
+    ) == _ManyModel.model_load_many(values)
+    # NB: ~4 chunks per (requested) worker
+    assert chunks == [2] * 8
+
+    chunks.clear()
+    assert _ManyModel.model_load_many_in_processes(
+        values, max_workers=1
+    ) == _ManyModel.model_load_many(values)
+    assert chunks == []
+
+
+def test_model_load_many_in_processes__error_path(process_pool):
+    values = [{"field": 0}] * 5 + [{"field": ""}, {"field": None}]
+    with pytest.raises(TypeError, match=r"Path: \[5\]\.field"):
+        _ManyModel.model_load_many_in_processes(
+            values, executor=process_pool, chunk_size=2
+        )
+
+    with pytest.raises(ValidationErrors) as e:
+        _ManyModel.model_load_many_in_processes(
+            values, executor=process_pool, chunk_size=2, collect_errors=True
+        )
+    assert [error.path for error in e.value.errors] == [
+        ["[5]", ".field"],
+        ["[6]", ".field"],
+    ]
+
+
+class _DeferredInner(Model):
+    name: NonEmptyString
+
+
+class _DeferredModel(Model, extra=True):
+    label: str = ""
+    inner: _DeferredInner | None = None
+    inners: list[_DeferredInner] = field(default_factory=list)
+    env: dict[str, str] = field(default_factory=dict)
+    if_condition: list[str] = field(default_factory=list, json_alias="if")
+
+
+_DEFERRED_DATA = {
+    "label": "a",
+    "inner": {"name": "b"},
+    "inners": [{"name": "c"}],
+    "env": {"A": "B"},
+    "if": ["x"],
+    "extra": [1],
+}
+
+
+def test_model__defer_nested():
+    instance = _DeferredModel.model_load(_DEFERRED_DATA, defer_nested=True)
+    assert set(instance.__dict__["_deferred_fields_"]) == {
+        "inner",
+        "inners",
+        "env",
+        "if_condition",
+    }
+    assert instance._extra == {"extra": [1]}
+
+    assert instance.inners == [_DeferredInner(name="c")]
+    assert instance.inners is instance.inners
+    assert "inners" not in instance.__dict__["_deferred_fields_"]
+
+    assert instance == _DeferredModel.model_load(_DEFERRED_DATA)
+    assert (
+        instance.model_dump() == _DeferredModel.model_load(_DEFERRED_DATA).model_dump()
+    )
+
+    # NB: Not provided, so not deferred
+    instance = _DeferredModel.model_load({}, defer_nested=True)
+    assert "_deferred_fields_" not in instance.__dict__
+    assert instance.inners == []
+
+    with pytest.raises(AttributeError, match="nope"):
+        instance.nope
+
+
+@pytest.mark.parametrize(
+    ("data", "path"),
+    [
+        param({"inner": {"name": ""}}, r"\.inner\.name", id="nested"),
+        param({"inners": [{"name": "a"}, {}]}, r"\.inners\[1\]", id="list"),
+        param({"if": [1]}, r"\.if\[0\]", id="json-alias"),
+    ],
+)
+def test_model__defer_nested__invalid(data, path):
+    with pytest.raises(ValidationError, match=rf"Path: {path}") as deferred_error:
+        _DeferredModel.model_load(data, defer_nested=True)
+    with pytest.raises(ValidationError) as error:
+        _DeferredModel.model_load(data)
+    assert str(deferred_error.value) == str(error.value)
+
+
+def test_model__defer_nested__pickle():
+    instance = _DeferredModel.model_load(_DEFERRED_DATA, defer_nested=True)
+    unpickled = pickle.loads(pickle.dumps(instance))
+    assert unpickled == _DeferredModel.model_load(_DEFERRED_DATA)
+    assert "_deferred_fields_" not in unpickled.__dict__
+
+
+def test_model__defer_nested__assigned_before_access():
+    instance = _DeferredModel.model_load(_DEFERRED_DATA, defer_nested=True)
+    instance.inners = []
+    assert instance.inners == []
+    assert pickle.loads(pickle.dumps(instance)).inners == []
+
+
+def test_model__defer_nested__getattr_installed_on_use():
+    class MyModel(Model):
+        inners: list[int] = field(default_factory=list)
+
+    # NB: Eager models don't pay for `__getattr__` on failed attribute lookups
+    MyModel.model_load({"inners": [1]})
+    MyModel.model_load({}, defer_nested=True)
+    assert not hasattr(MyModel, "__getattr__")
+    assert not hasattr(Model, "__getattr__")
+
+    assert MyModel.model_load({"inners": [1]}, defer_nested=True).inners == [1]
+    assert hasattr(MyModel, "__getattr__")
+
+
+def test_model__defer_nested__concurrent_load():
+    instance = _DeferredModel.model_load(_DEFERRED_DATA, defer_nested=True)
+    deferred = instance.__dict__["_deferred_fields_"]
+    load, value, set_value = deferred["inners"]
+    raced = []
+
+    def racing_load(value):
+        if not raced:
+            raced.append(True)
+            # NB: As if another thread loaded the field in the meantime
+            assert instance.inners == [_DeferredInner(name="c")]
+        return load(value)
+
+    deferred["inners"] = (racing_load, value, set_value)
+    assert instance.inners == [_DeferredInner(name="c")]
+    assert raced
+    assert "inners" not in deferred
+
+    instance._load_deferred_fields_()
+    assert "_deferred_fields_" not in instance.__dict__
+
+
+class _ValidatedModel(Model):
+    name: NonEmptyString
+    count: Annotated[int, Ge(0)] = 0
+    tags: list[NonEmptyString] = field(default_factory=lambda: ["tag"])
+
+
+def test_model__validated():
+    instance = _ValidatedModel.model_load({"name": "a", "count": 1})
+    assert instance == _ValidatedModel(name="a", count=1)
+    assert instance.tags == ["tag"]
+    assert instance.tags is not _ValidatedModel.model_load({"name": "a"}).tags
+
+    with pytest.raises(ValidationError, match=r"Path: \.count"):
+        _ValidatedModel.model_load({"name": "a", "count": -1})
+    with pytest.raises(ValidationError, match=r"Path: \.tags\[1\]"):
+        _ValidatedModel.model_load({"name": "a", "tags": ["a", ""]})
+
+    # NB: Assignment is still validated
+    with pytest.raises(ValidationError, match=r"Path: \.name"):
+        instance.name = ""
+
+
+def test_model__invalid_default():
+    class MyModel(Model):
+        field: NonEmptyString = ""
+
+    assert MyModel.model_load({"field": "a"}) == MyModel(field="a")
+    with pytest.raises(ValidationError, match=r"Path: \.field"):
+        MyModel.model_load({})
+
+
+def test_model__post_init():
+    class MyModel(Model):
+        field: int
+        doubled: int = field(default=0, init=False)
+
+        def __post_init__(self):
+            self.doubled = self.field * 2
+
+    assert MyModel.model_load({"field": 2}).doubled == 4
+    # NB: `__post_init__` would see the deferred fields, so nothing is deferred
+    assert MyModel.model_load({"field": 2}, defer_nested=True).doubled == 4
+
+
+def test_model__custom_init():
+    class MyModel(Model):
+        a: int
+
+        def __init__(self, *, a: int):
+            self.a = a * 2
+
+    assert MyModel.model_load({"a": 1}).a == 2
+    assert MyModel.model_load_many([{"a": 1}, {"a": 2}])[1].a == 4
+
+
+def test_model__custom_setattr():
+    class MyModel(Model):
+        a: int
+
+        def __setattr__(self, name, value):
+            if isinstance(value, int):
+                value *= 2
+            object.__setattr__(self, name, value)
+
+    assert MyModel.model_load({"a": 1}).a == 2
+
+    class Child(MyModel):
+        b: int = 0
+
+    assert Child.model_load({"a": 1, "b": 2}) == Child(a=1, b=2)
+    assert Child.model_load({"a": 1, "b": 2}).b == 4
+
+
+def test_model__init_var():
+    class MyModel(Model):
+        field: int = 0
+        offset: dataclasses.InitVar[int] = 1
+
+        def __post_init__(self, offset):
+            self.field += offset
+
+    assert MyModel.model_load({"field": 2}).field == 3
@@ -1,4 +1,5 @@
 from shimbboleth.internal.clay.json_schema import schema
+import json
 import re
 import uuid
 from shimbboleth.internal.clay.model import Model, field, FieldAlias
@@ -317,3 +318,32 @@ def test_json_loader__with_field_default(monkeypatch):
 
     with pytest.raises(Exception):
         assert MyModel.model_json_schema
+
+
+def test_schema__cached():
+    class NestedModel(Model):
+        field: list[str] = field(default_factory=lambda: ["a"])
+
+    class MyModel(Model):
+        nested: NestedModel
+
+    model_schema = MyModel.model_json_schema
+    assert MyModel.model_json_schema_json is MyModel.model_json_schema_json
+    assert json.loads(MyModel.model_json_schema_json) == model_schema
+
+    # NB: Mutating the returned schema doesn't affect the cached one
+    model_schema["$defs"]["NestedModel"]["properties"]["field"]["default"].append("b")
+    assert MyModel.model_json_schema != model_schema
+
+
+def test_schema__cache_reset_by_json_loader():
+    class MyModel(Model):
+        field: str
+
+    assert MyModel.model_json_schema["properties"]["field"] == {"type": "string"}
+
+    @MyModel._json_loader_("field")
+    def _load_field(value: int) -> str:
+        return ""
+
+    assert MyModel.model_json_schema["properties"]["field"] == {"type": "integer"}
@@ -0,0 +1,176 @@
+"""
+Tests related to `json_schema_compile.py`.
+
+The compiled validator should agree with a reference JSON Schema validator.
+"""
+
+import re
+import uuid
+from typing import Annotated, Any, ClassVar, Literal
+
+import pytest
+from pytest import param
+
+from shimbboleth.internal.clay.json_schema_compile import (
+    compile_model_schema,
+    compile_schema,
+    model_schema_document,
+)
+from shimbboleth.internal.clay.model import Model, field, FieldAlias
+from shimbboleth.internal.clay.validation import (
+    Ge,
+    Le,
+    MatchesRegex,
+    MaxLength,
+    NonEmpty,
+    NonEmptyList,
+    NonEmptyString,
+    Not,
+    ValidationError,
+)
+
+
+def str_to_int(value: str) -> int:
+    return int(value)
+
+
+class Inner(Model, extra=True):
+    name: NonEmptyString
+    count: Annotated[int, Ge(1), Le(10)] = 1
+
+
+class Outer(Model):
+    label: str | None = None
+    key: Annotated[str, MatchesRegex(r"^[a-z]+$")] | None = None
+    if_condition: NonEmptyString = field(default="true", json_alias="if")
+    tags: Annotated[list[Annotated[str, NonEmpty]], MaxLength(3)] = field(
+        default_factory=list
+    )
+    env: dict[str, Annotated[str, NonEmpty]] = field(default_factory=dict)
+    inners: NonEmptyList[Inner] = field(default_factory=lambda: [Inner(name="a")])
+    inner: Inner | str | int | None = None
+    state: Literal["passed", "failed"] = "passed"
+    id: uuid.UUID | None = None
+    not_uuid: Annotated[str, Not[uuid.UUID]] | None = None
+    pattern: re.Pattern | None = None
+    number: int = field(default=0, json_loader=str_to_int)
+    anything: Any = None
+    required: bool
+
+    name: ClassVar = FieldAlias("label")
+
+
+VALID = {"required": True}
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        param(VALID, id="minimal"),
+        param(
+            {
+                **VALID,
+                "name": "label",
+                "key": "abc",
+                "if": "x",
+                "tags": ["a", "b"],
+                "env": {"A": "b"},
+                "inners": [{"name": "a", "count": 2, "extra": None}],
+                "inner": "b",
+                "state": "failed",
+                "id": "12345678-1234-5678-1234-567812345678",
+                "not_uuid": "abc",
+                "pattern": "a+",
+                "number": "10",
+                "anything": {"a": [1]},
+            },
+            id="full",
+        ),
+        param({**VALID, "inner": {"name": "a"}}, id="union-model"),
+        param({**VALID, "inner": 1}, id="union-int"),
+        param({**VALID, "inner": 1.0}, id="union-float-int"),
+        param({**VALID, "inner": None}, id="union-null"),
+        param({**VALID, "inners": [{"name": "a", "count": 10.0}]}, id="float-int"),
+        param([], id="not-an-object"),
+        param({}, id="missing-required"),
+        param({**VALID, "extra": 1}, id="extras"),
+        param({**VALID, "label": 1}, id="wrong-type"),
+        param({**VALID, "name": 1}, id="wrong-type-alias"),
+        param({**VALID, "key": "ABC"}, id="pattern"),
+        param({**VALID, "if": ""}, id="min-length"),
+        param({**VALID, "tags": ["a", ""]}, id="list-items"),
+        param({**VALID, "tags": ["a", "b", "c", "d"]}, id="max-items"),
+        param({**VALID, "env": {"A": ""}}, id="dict-values"),
+        param({**VALID, "env": {"A": None}}, id="dict-type"),
+        param({**VALID, "inners": []}, id="min-items"),
+        param({**VALID, "inners": [{"name": ""}]}, id="nested"),
+        param({**VALID, "inners": [{"name": "a", "count": 0}]}, id="minimum"),
+        param({**VALID, "inners": [{"name": "a", "count": 11}]}, id="maximum"),
+        param({**VALID, "inners": [{"name": "a", "count": True}]}, id="bool-int"),
+        param({**VALID, "inners": [{"name": "a", "count": 1.5}]}, id="float"),
+        param({**VALID, "inner": 1.5}, id="union-float"),
+        param({**VALID, "inner": True}, id="union-bool"),
+        param({**VALID, "inner": {"name": ""}}, id="union-model-invalid"),
+        param({**VALID, "state": "running"}, id="enum"),
+        param({**VALID, "state": 1}, id="enum-type"),
+        param({**VALID, "id": "not-a-uuid"}, id="uuid"),
+        param({**VALID, "not_uuid": "12345678-1234-5678-1234-567812345678"}, id="not"),
+        param({**VALID, "number": 1}, id="json-loader-type"),
+        param({**VALID, "required": 1}, id="bool-type"),
+    ],
+)
+def test_matches_jsonschema(data):
+    # NB: Only this test needs the reference validator
+    jsonschema = pytest.importorskip("jsonschema")
+    schema = model_schema_document(Outer)
+    expected = jsonschema.Draft202012Validator(schema).is_valid(data)
+
+    validate = compile_model_schema(Outer)
+    if expected:
+        validate(data)
+    else:
+        with pytest.raises(ValidationError):
+            validate(data)
+
+
+@pytest.mark.parametrize(
+    ("data", "path"),
+    [
+        param({**VALID, "label": 1}, ".label", id="property"),
+        param({**VALID, "tags": ["a", ""]}, ".tags[1]", id="item"),
+        param({**VALID, "env": {"A": ""}}, ".env['A']", id="value"),
+        param({**VALID, "inners": [{"name": ""}]}, ".inners[0].name", id="nested"),
+    ],
+)
+def test_error_path(data, path):
+    with pytest.raises(ValidationError, match=rf"Path: {re.escape(path)}$"):
+        compile_model_schema(Outer)(data)
+
+
+def test_recursive_ref():
+    validate = compile_schema(
+        {
+            "$ref": "#/$defs/Node",
+            "$defs": {
+                "Node": {
+                    "type": "object",
+                    "properties": {
+                        "name": {"type": "string", "minLength": 1},
+                        "children": {
+                            "type": "array",
+                            "items": {"$ref": "#/$defs/Node"},
+                        },
+                    },
+                    "required": ["name"],
+                }
+            },
+        }
+    )
+    validate({"name": "a", "children": [{"name": "b", "children": [{"name": "c"}]}]})
+    with pytest.raises(ValidationError, match=r"Path: \.children\[0\]\.name"):
+        validate({"name": "a", "children": [{"name": ""}]})
+
+
+def test_unsupported_keyword():
+    with pytest.raises(NotImplementedError, match="allOf"):
+        compile_schema({"allOf": [{"type": "string"}]})
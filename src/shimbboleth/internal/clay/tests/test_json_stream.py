@@ -0,0 +1,109 @@
+"""
+Tests related to `json_stream.py` (and the `Model` JSON entry points).
+"""
+
+import io
+import json
+
+import pytest
+from pytest import param
+
+from shimbboleth.internal.clay.json_stream import iter_json_values
+from shimbboleth.internal.clay.model import Model
+from shimbboleth.internal.clay.validation import ValidationErrors
+
+VALUES = [
+    {"key": "value", "list": [1, 2, 3]},
+    'a string with a \\ and a " and a ✨',
+    12345,
+    None,
+    [],
+    {},
+    True,
+]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 7, 1024])
+@pytest.mark.parametrize(
+    "document",
+    [
+        param(json.dumps(VALUES), id="array"),
+        param(json.dumps(VALUES, indent=4), id="array-indented"),
+        param("\n".join(json.dumps(value) for value in VALUES) + "\n", id="ndjson"),
+        param(
+            "\n".join(json.dumps(value, indent=2) for value in VALUES),
+            id="concatenated",
+        ),
+    ],
+)
+@pytest.mark.parametrize("binary", [True, False])
+def test_iter_json_values(document, chunk_size, binary):
+    fp = io.BytesIO(document.encode("utf-8")) if binary else io.StringIO(document)
+    assert list(iter_json_values(fp, chunk_size=chunk_size)) == VALUES
+
+
+@pytest.mark.parametrize(
+    ("document", "expected"),
+    [
+        param("", [], id="empty"),
+        param("  \n ", [], id="whitespace"),
+        param("[]", [], id="empty-array"),
+        param(" [ ] ", [], id="empty-array"),
+        param("[[]]", [[]], id="nested-array"),
+        param("1 2", [1, 2], id="numbers"),
+    ],
+)
+def test_iter_json_values__edge_cases(document, expected):
+    assert list(iter_json_values(document, chunk_size=1)) == expected
+
+
+@pytest.mark.parametrize(
+    "document",
+    [
+        param("[1, 2", id="unterminated-array"),
+        param("[1 2]", id="missing-comma"),
+        param("[1, 2] 3", id="trailing-data"),
+        param('{"key": ', id="unterminated-object"),
+        param("[1,]", id="trailing-comma"),
+    ],
+)
+def test_iter_json_values__invalid(document):
+    with pytest.raises(json.JSONDecodeError):
+        list(iter_json_values(document, chunk_size=2))
+
+
+class MyModel(Model):
+    field: int
+
+
+def test_model_load_json():
+    assert MyModel.model_load_json('{"field": 1}') == MyModel(field=1)
+    assert MyModel.model_load_json(b'{"field": 1}') == MyModel(field=1)
+    assert MyModel.model_load_json(io.BytesIO(b'{"field": 1}')) == MyModel(field=1)
+
+    with pytest.raises(TypeError, match=r"Path: \.field"):
+        MyModel.model_load_json('{"field": "1"}')
+
+
+def test_model_iter_load_json():
+    models = MyModel.model_iter_load_json(io.BytesIO(b'{"field": 1}\n{"field": 2}\n'))
+    assert next(models) == MyModel(field=1)
+    assert list(models) == [MyModel(field=2)]
+
+    models = MyModel.model_iter_load_json('[{"field": 1}, {"field": "2"}]')
+    assert next(models) == MyModel(field=1)
+    with pytest.raises(TypeError, match=r"Path: \[1\]\.field"):
+        next(models)
+
+
+def test_model_iter_load_json__collect_errors():
+    models = MyModel.model_iter_load_json(
+        '[{"field": ""}, {"field": 1}, {}]', collect_errors=True
+    )
+    loaded = []
+    with pytest.raises(ValidationErrors) as e:
+        for model in models:
+            loaded.append(model)
+
+    assert loaded == [MyModel(field=1)]
+    assert len(e.value.errors) == 2
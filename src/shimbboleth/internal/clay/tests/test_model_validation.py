@@ -24,3 +24,55 @@ def test_error_message():
         MyModel(field="")
 
     assert "Path: .field" in str(e.value)
+
+
+class MyLazyModel(Model, lazy=True):
+    field: NonEmptyString
+    other: int = 0
+
+
+class MyLazySubModel(MyLazyModel):
+    sub_field: NonEmptyString = "a"
+
+
+@pytest.mark.parametrize("model_type", [MyLazyModel, MyLazySubModel])
+def test_lazy__validates(model_type):
+    with pytest.raises(ValidationError, match=r"Path: \.field"):
+        model_type(field="")
+    with pytest.raises(ValidationError, match=r"Path: \.field"):
+        model_type.model_load({"field": ""})
+
+    instance = model_type(field="a")
+    with pytest.raises(ValidationError, match=r"Path: \.field"):
+        instance.field = ""
+    instance.other = 1
+    assert instance.other == 1
+
+
+def test_lazy__inherited():
+    assert MyLazySubModel.__lazy__
+    assert not MyModel.__lazy__
+
+    class NotLazy(MyLazyModel, lazy=False):
+        pass
+
+    assert not NotLazy.__lazy__
+
+
+def test_lazy__doc():
+    assert MyLazyModel.__doc__ == (
+        "MyLazyModel(*, field: typing.Annotated[str, NonEmpty], other: int = 0)"
+    )
+
+    class Documented(Model, lazy=True):
+        """Documented."""
+
+    assert Documented.__doc__ == "Documented."
+
+
+def test_extra__survives_slots_recreation():
+    class Extra(Model, extra=True):
+        field: int
+
+    assert Extra.__allow_extra_properties__
+    assert Extra.model_load({"field": 1, "unknown": 2})._extra == {"unknown": 2}
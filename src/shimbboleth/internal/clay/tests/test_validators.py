@@ -1,4 +1,10 @@
-from shimbboleth.internal.clay._validators import get_validators
+from shimbboleth.internal.clay._validators import (
+    _VALIDATORS,
+    ListElementsValidator,
+    RangeValidator,
+    get_validators,
+)
+from shimbboleth.internal.clay.model import Model
 from shimbboleth.internal.clay.validation import (
     MaxLength,
     ValidationError,
@@ -8,7 +14,9 @@ from shimbboleth.internal.clay.validation import (
     Ge,
     Le,
 )
+import gc
 import uuid
+import weakref
 from typing import Annotated, Union
 
 
@@ -24,6 +32,8 @@ from pytest import param
         param(Annotated[int, Ge(1)], 2, id="int"),
         param(Annotated[int, Le(1)], 1, id="int"),
         param(Annotated[int, Le(1)], 0, id="int"),
+        param(Annotated[int, Ge(0), Le(10)], 0, id="int"),
+        param(Annotated[int, Le(10), Ge(0)], 10, id="int"),
         # dict
         param(dict[str, int], {}, id="dict"),
         param(dict[str, int], {"key": 0}, id="dict"),
@@ -36,6 +46,11 @@ from pytest import param
             id="dict",
         ),
         param(dict[Annotated[str, MatchesRegex("^a$")], int], {"a": 0}, id="dict"),
+        param(
+            dict[str, Annotated[str, NonEmpty, MatchesRegex("^a.*")]],
+            {"key1": "a", "key2": "ab"},
+            id="dict",
+        ),
         # str
         param(Annotated[str, MatchesRegex(r"^.*$")], "", id="str"),
         param(Annotated[str, MatchesRegex(r"^.*$")], "a", id="str"),
@@ -76,6 +91,14 @@ def test_valid(field_type, obj):
         # int
         param(Annotated[int, Ge(1)], 0, "`0` to be >= 1", id="int"),
         param(Annotated[int, Le(1)], 2, "`2` to be <= 1", id="int"),
+        param(Annotated[int, Ge(0), Le(10)], -1, "`-1` to be >= 0", id="int"),
+        param(Annotated[int, Ge(0), Le(10)], 11, "`11` to be <= 10", id="int"),
+        param(
+            list[Annotated[int, Ge(0), Le(10), Not[Ge(5)]]],
+            [1, 6],
+            r"`6` to not be >= 5\nPath: \[1\]",
+            id="list",
+        ),
         # dict
         param(
             Annotated[dict[str, int], NonEmpty], {}, "`{}` to be non-empty", id="dict"
@@ -156,6 +179,18 @@ def test_valid(field_type, obj):
             "`''` to be non-empty",
             id="union",
         ),
+        param(
+            dict[str, Annotated[str, NonEmpty, MatchesRegex("^a.*")]],
+            {"key1": "a", "key2": "b"},
+            r"`'b'` to match regex `\^a\.\*`\nPath: \['key2'\]",
+            id="dict",
+        ),
+        param(
+            list[Annotated[str, NonEmpty]],
+            ["a", "b", ""],
+            r"`''` to be non-empty\nPath: \[2\]",
+            id="list",
+        ),
         # MaxLength
         param(
             Annotated[list[int], MaxLength(1)],
@@ -185,3 +220,54 @@ def test_invalid(field_type, obj, expected_error):
 def test_types_we_dont_support(field_type):
     with pytest.raises(Exception, match="unsupported"):
         tuple(get_validators(field_type))
+
+
+def test_fused_validators():
+    (validator,) = get_validators(Annotated[int, Ge(0), Le(10)])
+    assert validator == RangeValidator(0, 10, (Ge(0), Le(10)))
+
+    (validator,) = get_validators(list[Annotated[str, NonEmpty, MatchesRegex("^a")]])
+    assert isinstance(validator, ListElementsValidator)
+    validator(["a"])
+    with pytest.raises(ValidationError, match=r"Path: \[1\]"):
+        validator(["a", ""])
+
+
+def test_get_validators__memoized():
+    assert get_validators(list[Annotated[str, NonEmpty]]) is get_validators(
+        list[Annotated[str, NonEmpty]]
+    )
+    (not_validator,) = get_validators(Annotated[str, Not[uuid.UUID]])
+    (other_not_validator,) = get_validators(Annotated[str, NonEmpty, Not[uuid.UUID]])
+    assert other_not_validator.validators[1] is not_validator
+
+
+def test_get_validators__memoized_nested_unions():
+    # NB: Nested unions compare equal regardless of order
+    assert get_validators(list[int | Annotated[str, NonEmpty]]) is not get_validators(
+        list[Annotated[str, NonEmpty] | int]
+    )
+
+
+def test_get_validators__memoized_on_model():
+    class MyModel(Model):
+        field: int
+
+    validators = get_validators(Annotated[list[MyModel], NonEmpty])
+    assert get_validators(Annotated[list[MyModel], NonEmpty]) is validators
+    assert any(value is validators for value in MyModel.__model_memo__.values())
+    assert all(value is not validators for value in _VALIDATORS.values())
+
+
+def test_get_validators__model_not_kept_alive():
+    class MyModel(Model):
+        field: int
+
+    # NB: Not `Annotated`, which `typing` caches (in a bounded cache) itself
+    get_validators(dict[str, MyModel] | None)
+    assert MyModel.__model_memo__
+
+    model_ref = weakref.ref(MyModel)
+    del MyModel
+    gc.collect()
+    assert model_ref() is None
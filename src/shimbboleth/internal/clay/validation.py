@@ -5,6 +5,7 @@ NOTE: This only handles Annotated validations (E.g. `Annotated[int, Ge(10)]`)
 """
 
 from typing import TypeVar, ClassVar, Annotated, Protocol, overload
+import copyreg
 import dataclasses
 from contextlib import contextmanager
 import re
@@ -55,6 +56,11 @@ class ValidationError(ValueError):
             + f"Path: {''.join(self.path)}"
         )
 
+    def __reduce__(self):
+        # NB: The default (`cls(*self.args)`) doesn't work with our keyword-only `__init__`s,
+        #   so recreate the instance without `__init__` and restore its attributes (incl. `path`).
+        return (copyreg.__newobj__, (type(self),), self.__dict__)
+
     def add_context(
         self,
         *,
@@ -81,6 +87,21 @@ class ValidationError(ValueError):
             raise
 
 
+class ValidationErrors(ValueError):
+    """
+    Multiple `ValidationError`s, collected (instead of raising the first one).
+    """
+
+    def __init__(self, errors: list[ValidationError]):
+        super().__init__(errors)
+        self.errors = errors
+
+    def __str__(self):
+        return f"{len(self.errors)} validation error(s):\n" + "\n".join(
+            "  " + str(error).replace("\n", "\n  ") for error in self.errors
+        )
+
+
 class _NonEmptyT(Validator):
     description: ClassVar[str] = "not be empty"
 